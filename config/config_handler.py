@@ -33,11 +33,19 @@ class ConfigHandler:
         Retorna la configuración de la base de datos
         """
         return {
+            'backend': self._config.get('DATABASE', 'backend', fallback='mysql').strip().lower(),
             'host': self._config.get('DATABASE', 'host'),
             'user': self._config.get('DATABASE', 'user'),
             'password': self._config.get('DATABASE', 'password'),
             'database': self._config.get('DATABASE', 'database'),
-            'port': self._config.getint('DATABASE', 'port')
+            'port': self._config.getint('DATABASE', 'port'),
+            'pool_min_size': self._config.getint('DATABASE', 'pool_min_size', fallback=1),
+            'pool_max_size': self._config.getint('DATABASE', 'pool_max_size', fallback=10),
+            'pool_idle_timeout': self._config.getint('DATABASE', 'pool_idle_timeout', fallback=300),
+            'pool_checkout_timeout': self._config.getint('DATABASE', 'pool_checkout_timeout', fallback=10),
+            'pool_ping_interval': self._config.getint('DATABASE', 'pool_ping_interval', fallback=5),
+            'sqlite_path': self._config.get('DATABASE', 'sqlite_path', fallback='database/pokedex.sqlite3'),
+            'sqlite_busy_timeout': self._config.getint('DATABASE', 'sqlite_busy_timeout', fallback=5000)
         }
 
     @property
@@ -48,7 +56,64 @@ class ConfigHandler:
         return {
             'base_url': self._config.get('API', 'base_url'),
             'timeout': self._config.getint('API', 'timeout'),
-            'max_retries': self._config.getint('API', 'max_retries')
+            'connect_timeout': self._config.getint('API', 'connect_timeout', fallback=5),
+            'max_retries': self._config.getint('API', 'max_retries'),
+            'backoff_base': self._config.getfloat('API', 'backoff_base', fallback=0.5),
+            'backoff_max': self._config.getfloat('API', 'backoff_max', fallback=10.0),
+            'breaker_failure_threshold': self._config.getint('API', 'breaker_failure_threshold', fallback=5),
+            'breaker_reset_timeout': self._config.getint('API', 'breaker_reset_timeout', fallback=30),
+            'max_workers': self._config.getint('API', 'max_workers', fallback=8),
+            'sync_workers': self._config.getint('API', 'sync_workers', fallback=4),
+            'max_concurrency': self._config.getint('API', 'max_concurrency', fallback=32)
+        }
+
+    @property
+    def cache(self):
+        """
+        Retorna la configuración de la caché de respuestas de la API
+        """
+        return {
+            'directory': self._config.get('CACHE', 'directory', fallback='cache'),
+            'ttl': {
+                'pokemon': self._config.getint('CACHE', 'ttl_pokemon', fallback=604800),
+                'species': self._config.getint('CACHE', 'ttl_species', fallback=604800),
+                'evolution': self._config.getint('CACHE', 'ttl_evolution', fallback=2592000),
+                'default': self._config.getint('CACHE', 'ttl_default', fallback=86400),
+                'list': self._config.getint('CACHE', 'ttl_list', fallback=86400)
+            },
+            'memory_max_entries': self._config.getint('CACHE', 'memory_max_entries', fallback=256),
+            'memory_max_bytes': self._config.getint('CACHE', 'memory_max_bytes', fallback=8388608),
+            'summary_max_entries': self._config.getint('CACHE', 'summary_max_entries', fallback=2048),
+            'query_max_entries': self._config.getint('CACHE', 'query_max_entries', fallback=512),
+            'sprite_sizes': [
+                tuple(int(side) for side in size.strip().lower().split('x'))
+                for size in self._config.get('CACHE', 'sprite_sizes', fallback='96x96').split(',')
+            ],
+            'sprite_memory_entries': self._config.getint('CACHE', 'sprite_memory_entries', fallback=512)
+        }
+
+    @property
+    def catalog(self):
+        """
+        Retorna la configuración del catálogo local (modo sin conexión)
+        """
+        return {
+            'path': self._config.get('CATALOG', 'path', fallback='cache/catalog.bin'),
+            'offline': self._config.getboolean('CATALOG', 'offline', fallback=False)
+        }
+
+    @property
+    def history(self):
+        """
+        Retorna la configuración del búfer del historial de búsquedas
+        """
+        return {
+            'flush_size': self._config.getint('HISTORY', 'flush_size', fallback=50),
+            'flush_interval': self._config.getfloat('HISTORY', 'flush_interval', fallback=5.0),
+            'journal': self._config.get('HISTORY', 'journal', fallback='cache/search_history.journal'),
+            'rejected': self._config.get('HISTORY', 'rejected', fallback='cache/search_history.rejected'),
+            'max_retries': self._config.getint('HISTORY', 'max_retries', fallback=10),
+            'max_pending': self._config.getint('HISTORY', 'max_pending', fallback=10000)
         }
 
     @property
@@ -61,7 +126,11 @@ class ConfigHandler:
             'theme': self._config.get('APP', 'theme'),
             'language': self._config.get('APP', 'language'),
             'max_team_size': self._config.getint('APP', 'max_team_size'),
-            'debug': self._config.getboolean('APP', 'debug')
+            'debug': self._config.getboolean('APP', 'debug'),
+            'image_workers': self._config.getint('APP', 'image_workers', fallback=4),
+            'image_batch_size': self._config.getint('APP', 'image_batch_size', fallback=8),
+            'image_poll_interval': self._config.getint('APP', 'image_poll_interval', fallback=30),
+            'admin_page_size': self._config.getint('APP', 'admin_page_size', fallback=50)
         }
 
     @property
@@ -75,6 +144,23 @@ class ConfigHandler:
             'format': self._config.get('LOGGING', 'format')
         }
 
+    @property
+    def profiler(self):
+        """
+        Retorna la configuración del perfilador de consultas
+        """
+        enabled = self._config.getboolean('PROFILER', 'enabled', fallback=False)
+        # POKEDEX_PROFILER=1 lo activa (o =0 lo desactiva) sin tocar config.ini
+        override = os.environ.get('POKEDEX_PROFILER')
+        if override is not None:
+            enabled = override.strip().lower() in ('1', 'true', 'yes', 'on')
+        return {
+            'enabled': enabled,
+            'slow_query_ms': self._config.getfloat('PROFILER', 'slow_query_ms', fallback=200.0),
+            'n_plus_one_threshold': self._config.getint('PROFILER', 'n_plus_one_threshold', fallback=5),
+            'report_dir': self._config.get('PROFILER', 'report_dir', fallback='logs/profiles')
+        }
+
     @property
     def security(self):
         """
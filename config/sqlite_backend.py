@@ -0,0 +1,364 @@
+# Motor SQLite embebido
+
+# config/sqlite_backend.py
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', 'database', 'schema_sqlite.sql')
+
+# ON CONFLICT ... DO UPDATE sin indicar columnas requiere SQLite 3.35
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+# WAL permite leer mientras otro hilo escribe; con synchronous=NORMAL
+# solo se sincroniza el disco en cada checkpoint
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456"
+)
+
+# Las fechas se guardan como texto 'YYYY-MM-DD HH:MM:SS', igual que las
+# escribe datetime('now', 'localtime'), para que se puedan comparar
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('DATETIME', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()))
+
+# Traducción del dialecto de MySQL
+
+_LITERAL = re.compile(r"'(?:[^'\\]|''|\\.)*'")
+_MASK = re.compile(r"\x00(\d+)\x00")
+_INTERVAL = re.compile(r"^INTERVAL\s+(.+?)\s+(SECOND|MINUTE|HOUR|DAY|MONTH|YEAR)$", re.IGNORECASE | re.DOTALL)
+_ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.IGNORECASE)
+_VALUES_CALL = re.compile(r"\bVALUES\s*\(\s*(\w+)\s*\)", re.IGNORECASE)
+_DELETE_JOIN = re.compile(r"^\s*DELETE\s+(\w+)\s+FROM\s+(\w+)\s+(?:AS\s+)?(\w+)\s+(.*)$", re.IGNORECASE | re.DOTALL)
+_FOR_UPDATE = re.compile(r"\s+FOR\s+UPDATE\b", re.IGNORECASE)
+
+def _split_arguments(sql, start):
+    """
+    Separa los argumentos de la llamada cuyo paréntesis abre en start y
+    retorna (argumentos, posición tras el paréntesis de cierre)
+    """
+    depth = 0
+    arguments = []
+    current = start + 1
+    for position in range(start, len(sql)):
+        char = sql[position]
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                arguments.append(sql[current:position].strip())
+                return arguments, position + 1
+        elif char == ',' and depth == 1:
+            arguments.append(sql[current:position].strip())
+            current = position + 1
+    raise ValueError(f"Unbalanced parentheses in query: {sql}")
+
+def _rewrite_calls(sql, name, rewrite):
+    """
+    Sustituye cada llamada a la función name por rewrite(argumentos),
+    traduciendo antes las llamadas anidadas
+    """
+    pattern = re.compile(rf"\b{name}\s*\(", re.IGNORECASE)
+    result = []
+    position = 0
+    while True:
+        match = pattern.search(sql, position)
+        if not match:
+            result.append(sql[position:])
+            return ''.join(result)
+        arguments, end = _split_arguments(sql, match.end() - 1)
+        arguments = [_rewrite_calls(argument, name, rewrite) for argument in arguments]
+        result.append(sql[position:match.start()])
+        result.append(rewrite(arguments))
+        position = end
+
+def _date_arithmetic(sign):
+    def rewrite(arguments):
+        base, interval = arguments
+        match = _INTERVAL.match(interval)
+        if not match:
+            raise ValueError(f"Unsupported interval: {interval}")
+        amount, unit = match.groups()
+        modifier = f"'{sign}' || ({amount}) || ' {unit.lower()}s'"
+        if re.fullmatch(r"CURDATE\(\s*\)", base, re.IGNORECASE):
+            return f"date('now', 'localtime', {modifier})"
+        if re.fullmatch(r"(NOW\(\s*\)|CURRENT_TIMESTAMP)", base, re.IGNORECASE):
+            return f"datetime('now', 'localtime', {modifier})"
+        return f"datetime({base}, {modifier})"
+    return rewrite
+
+def _top_level(sql):
+    """
+    Retorna la consulta sin el contenido de los paréntesis, para buscar
+    palabras clave solo en el nivel exterior
+    """
+    depth = 0
+    chars = []
+    for char in sql:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0:
+            chars.append(char)
+    return ''.join(chars)
+
+def _upsert(sql):
+    match = _ON_DUPLICATE.search(sql)
+    if not match:
+        return sql
+    head, assignments = sql[:match.start()].rstrip(), sql[match.end():]
+    assignments = _VALUES_CALL.sub(r"excluded.\1", assignments)
+
+    # En INSERT ... SELECT el ON podría leerse como parte de un JOIN;
+    # SQLite pide un WHERE para deshacer la ambigüedad
+    outer = _top_level(head).upper()
+    if re.search(r"\bSELECT\b", outer) and not re.search(r"\b(WHERE|GROUP\s+BY)\b", outer):
+        head += " WHERE true"
+    return f"{head} ON CONFLICT DO UPDATE SET{assignments}"
+
+def _delete_join(sql):
+    # DELETE alias FROM tabla alias JOIN ... se convierte en un borrado por rowid
+    match = _DELETE_JOIN.match(sql)
+    if not match or match.group(1) != match.group(3):
+        return sql
+    alias, table, _, rest = match.groups()
+    return f"DELETE FROM {table} WHERE rowid IN (SELECT {alias}.rowid FROM {table} {alias} {rest})"
+
+@lru_cache(maxsize=512)
+def translate(sql):
+    """
+    Convierte una consulta escrita para MySQL (con parámetros %s) al
+    dialecto de SQLite
+    """
+    # Los literales se apartan para no tocar su contenido; como en pymysql,
+    # '%%' también representa un '%' dentro de ellos
+    literals = []
+    def mask(match):
+        literals.append(match.group(0).replace("\\'", "''").replace('%%', '%'))
+        return f"\x00{len(literals) - 1}\x00"
+    sql = _LITERAL.sub(mask, sql)
+
+    sql = sql.replace('%s', '?').replace('%%', '%')
+    sql = _FOR_UPDATE.sub('', sql)
+    sql = sql.replace('<=>', ' IS ')
+    sql = _rewrite_calls(sql, 'DATE_SUB', _date_arithmetic('-'))
+    sql = _rewrite_calls(sql, 'DATE_ADD', _date_arithmetic('+'))
+    sql = re.sub(r"\bCURDATE\(\s*\)", "date('now', 'localtime')", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bNOW\(\s*\)", "datetime('now', 'localtime')", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bGREATEST\s*\(", "MAX(", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bLEAST\s*\(", "MIN(", sql, flags=re.IGNORECASE)
+    sql = _rewrite_calls(sql, 'CONCAT', lambda arguments: f"({' || '.join(arguments)})")
+    sql = _upsert(sql)
+    sql = _delete_join(sql)
+
+    return _MASK.sub(lambda match: literals[int(match.group(1))], sql)
+
+# Conexiones
+
+class SQLiteCursor:
+    """
+    Cursor con la interfaz que usan los modelos (context manager y
+    parámetros %s)
+    """
+    def __init__(self, connection):
+        self._connection = connection
+        self._cursor = connection.cursor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def execute(self, query, params=()):
+        self._cursor.execute(translate(query), tuple(params))
+        return self._cursor.rowcount
+
+    def executemany(self, query, params_list):
+        # En autocommit cada fila sería una transacción; se agrupan en una
+        query = translate(query)
+        if self._connection.in_transaction:
+            self._cursor.executemany(query, params_list)
+        else:
+            self._cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self._cursor.executemany(query, params_list)
+            except BaseException:
+                self._cursor.execute("ROLLBACK")
+                raise
+            self._cursor.execute("COMMIT")
+        return self._cursor.rowcount
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def close(self):
+        self._cursor.close()
+
+class SQLiteConnection:
+    """
+    Conexión con la misma interfaz que la de pymysql que usa DatabaseConnection
+    """
+    def __init__(self, path, busy_timeout):
+        self._connection = sqlite3.connect(
+            path,
+            timeout=busy_timeout / 1000,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            # Autocommit como en MySQL; las transacciones se abren con begin()
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._connection.row_factory = lambda cursor, row: {
+            column[0]: value for column, value in zip(cursor.description, row)
+        }
+        for pragma in PRAGMAS:
+            self._connection.execute(pragma)
+        self.open = True
+
+    def cursor(self):
+        return SQLiteCursor(self._connection)
+
+    def begin(self):
+        # IMMEDIATE toma el bloqueo de escritura al empezar, que es lo que
+        # hacen los SELECT ... FOR UPDATE en MySQL
+        self._connection.execute("BEGIN IMMEDIATE")
+
+    def commit(self):
+        if self._connection.in_transaction:
+            self._connection.execute("COMMIT")
+
+    def rollback(self):
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
+
+    def ping(self, reconnect=False):
+        return True
+
+    def executescript(self, script):
+        self._connection.executescript(script)
+
+    def close(self):
+        self.open = False
+        self._connection.close()
+
+class SQLitePool:
+    """
+    Sustituto del pool de MySQL: cada hilo mantiene su propia conexión
+    al archivo, ya que SQLite no necesita limitar las conexiones
+    """
+    def __init__(self, path, busy_timeout):
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"SQLite {sqlite3.sqlite_version} is too old, "
+                f"{'.'.join(map(str, MIN_SQLITE_VERSION))} or newer is required"
+            )
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._schema_ready = False
+        self._stats = {'created': 0, 'closed': 0, 'checkouts': 0}
+
+    def _ensure_schema(self, connection):
+        with self._lock:
+            if self._schema_ready:
+                return
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'users'")
+                exists = cursor.fetchone()
+            if not exists:
+                with open(SCHEMA_PATH, 'r', encoding='utf-8') as script:
+                    connection.executescript(script.read())
+            self._schema_ready = True
+
+    def acquire(self):
+        """
+        Retorna la conexión del hilo actual, creándola si hace falta
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or not connection.open:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = SQLiteConnection(self.path, self.busy_timeout)
+            self._ensure_schema(connection)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+                self._stats['created'] += 1
+        with self._lock:
+            self._stats['checkouts'] += 1
+        return connection
+
+    def release(self, connection, discard=False):
+        """
+        La conexión sigue siendo del hilo; solo se cierra si quedó inservible
+        """
+        if discard and connection.open:
+            self._close(connection)
+
+    def _close(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+            self._stats['closed'] += 1
+
+    @contextmanager
+    def connection(self):
+        """
+        Presta la conexión del hilo durante el bloque with
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close_all(self):
+        """
+        Cierra las conexiones de todos los hilos
+        """
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            self._close(connection)
+
+    def get_stats(self):
+        """
+        Retorna el número de conexiones abiertas y sus contadores de uso
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._connections)
+            stats['backend'] = 'sqlite'
+            stats['path'] = self.path
+        return stats
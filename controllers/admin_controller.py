@@ -1,23 +1,31 @@
 # Control de Administracion
 # controllers/admin_controller.py
+from config.config_handler import config
 from models.admin_model import AdminModel
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 
 class AdminController:
     def __init__(self):
         self.admin_model = AdminModel()
         self.logger = logging.getLogger(__name__)
+        self.PAGE_SIZE = config.app['admin_page_size']
+        self.MAX_PAGE_SIZE = 200
 
-    def get_users_list(self) -> List[Dict]:
+    def _page_size(self, page_size: Optional[int]) -> int:
+        return min(max(page_size or self.PAGE_SIZE, 1), self.MAX_PAGE_SIZE)
+
+    def get_users_list(self, cursor: str = None, page_size: int = None, role: str = None,
+                       search: str = None) -> Tuple[List[Dict], Optional[str]]:
         """
-        Obtiene la lista de usuarios para el panel de administración
+        Obtiene una página de la lista de usuarios para el panel de
+        administración y el cursor de la siguiente (None si no hay más)
         """
         try:
-            return self.admin_model.get_all_users()
+            return self.admin_model.get_users_page(self._page_size(page_size), cursor, role, search)
         except Exception as e:
             self.logger.error(f"Error getting users list: {str(e)}")
-            return []
+            return [], None
 
     def get_user_details(self, user_id: int) -> Tuple[bool, Dict]:
         """
@@ -71,22 +79,28 @@ class AdminController:
             self.logger.error(f"Error getting dashboard stats: {str(e)}")
             return {}
 
-    def get_recent_activity(self) -> List[Dict]:
+    def get_recent_activity(self, cursor: str = None, page_size: int = None, activity_type: str = None,
+                            days: int = 7, user_id: int = None) -> Tuple[List[Dict], Optional[str]]:
         """
-        Obtiene actividad reciente del sistema
+        Obtiene una página de la actividad reciente del sistema y el
+        cursor de la siguiente (None si no hay más)
         """
         try:
-            return self.admin_model.get_activity_logs()
+            return self.admin_model.get_activity_logs(
+                self._page_size(page_size), cursor, activity_type, days, user_id
+            )
         except Exception as e:
             self.logger.error(f"Error getting recent activity: {str(e)}")
-            return []
+            return [], None
 
-    def get_search_history(self, limit: int = 100) -> List[Dict]:
+    def get_search_history(self, cursor: str = None, page_size: int = None, user_id: int = None,
+                           search_term: str = None) -> Tuple[List[Dict], Optional[str]]:
         """
-        Obtiene historial de búsquedas
+        Obtiene una página del historial de búsquedas y el cursor de la
+        siguiente (None si no hay más)
         """
         try:
-            return self.admin_model.get_search_logs(limit)
+            return self.admin_model.get_search_logs(self._page_size(page_size), cursor, user_id, search_term)
         except Exception as e:
             self.logger.error(f"Error getting search history: {str(e)}")
-            return []
\ No newline at end of file
+            return [], None
\ No newline at end of file
@@ -2,6 +2,7 @@
 # controllers/pokemon_controller.py
 from services.api_service import PokeAPIService
 from models.search_model import SearchModel
+from services.search_history_buffer import search_history
 from typing import Dict, List, Optional
 import logging
 
@@ -19,9 +20,9 @@ class PokemonController:
             # Realizar búsqueda
             results = self.api_service.search_pokemon(query)
             
-            # Registrar búsqueda en el historial
+            # Registrar búsqueda en el historial (se escribe en segundo plano)
             if results:
-                self.search_model.add_search(user_id, query)
+                search_history.add(user_id, query)
             
             if not results:
                 return [], "No se encontraron Pokémon que coincidan con la búsqueda."
@@ -53,7 +54,20 @@ class PokemonController:
         Obtiene las búsquedas recientes del usuario
         """
         try:
-            return self.search_model.get_user_searches(user_id, limit)
+            # Las búsquedas aún no volcadas a la base de datos van primero
+            pending = search_history.get_pending(user_id)[::-1][:limit]
+            if len(pending) >= limit:
+                return pending
+
+            stored = self.search_model.get_user_searches(user_id, limit)
+            # Durante un volcado las búsquedas en curso pueden estar ya
+            # confirmadas: se quitan las que también vienen de la base de datos
+            stored_keys = {(row['search_term'], row['search_date']) for row in stored}
+            pending = [
+                entry for entry in pending
+                if (entry['search_term'], entry['search_date']) not in stored_keys
+            ]
+            return (pending + stored)[:limit]
         except Exception as e:
             self.logger.error(f"Error al obtener búsquedas recientes: {str(e)}")
             return []
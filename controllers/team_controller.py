@@ -1,6 +1,7 @@
 # Control de Equipo
 # controllers/team_controller.py
 from models.team_model import TeamModel
+from models.team_stats_model import TeamStatsModel
 from services.api_service import PokeAPIService
 from typing import Dict, List, Tuple
 import logging
@@ -8,6 +9,7 @@ import logging
 class TeamController:
     def __init__(self):
         self.team_model = TeamModel()
+        self.team_stats = TeamStatsModel()
         self.api_service = PokeAPIService()
         self.logger = logging.getLogger(__name__)
         self.MAX_TEAM_SIZE = 10
@@ -17,14 +19,8 @@ class TeamController:
         Obtiene la lista de Pokémon del entrenador
         """
         try:
-            pokemon_list = self.team_model.get_trainer_pokemon(trainer_id)
-            
-            # Procesar los datos para la visualización
-            for pokemon in pokemon_list:
-                pokemon['types'] = pokemon['pokemon_type'].split(',')
-                pokemon['moves'] = pokemon['moves'].split(',')
-                
-            return pokemon_list
+            # El modelo ya entrega 'types' y 'moves' como listas
+            return self.team_model.get_trainer_pokemon(trainer_id)
         except Exception as e:
             self.logger.error(f"Error getting trainer's pokemon: {e}")
             return []
@@ -102,48 +98,15 @@ class TeamController:
         Obtiene estadísticas del equipo
         """
         try:
-            pokemon_list = self.get_trainer_pokemon(trainer_id)
-            
-            stats = {
-                'total_pokemon': len(pokemon_list),
-                'types': {},
-                'average_stats': {
-                    'hp': 0,
-                    'attack': 0,
-                    'defense': 0,
-                    'sp_attack': 0,
-                    'sp_defense': 0,
-                    'speed': 0
-                },
-                'strongest_pokemon': None,
-                'fastest_pokemon': None
+            team_stats = self.team_stats.get_team_stats(trainer_id)
+
+            return {
+                'total_pokemon': team_stats['total_pokemon'],
+                'types': team_stats['types'],
+                'average_stats': team_stats['average_stats'],
+                'strongest_pokemon': team_stats['max_stats']['attack'],
+                'fastest_pokemon': team_stats['max_stats']['speed']
             }
-            
-            if not pokemon_list:
-                return stats
-
-            # Calcular estadísticas
-            for pokemon in pokemon_list:
-                # Contar tipos
-                for type_name in pokemon['types']:
-                    stats['types'][type_name] = stats['types'].get(type_name, 0) + 1
-                
-                # Sumar stats
-                for stat in stats['average_stats'].keys():
-                    stats['average_stats'][stat] += pokemon[f'stats_{stat}']
-                
-                # Encontrar el más fuerte y el más rápido
-                if not stats['strongest_pokemon'] or pokemon['stats_attack'] > stats['strongest_pokemon']['stats_attack']:
-                    stats['strongest_pokemon'] = pokemon
-                    
-                if not stats['fastest_pokemon'] or pokemon['stats_speed'] > stats['fastest_pokemon']['stats_speed']:
-                    stats['fastest_pokemon'] = pokemon
-
-            # Calcular promedios
-            for stat in stats['average_stats'].keys():
-                stats['average_stats'][stat] = round(stats['average_stats'][stat] / len(pokemon_list), 2)
-
-            return stats
 
         except Exception as e:
             self.logger.error(f"Error calculating team stats: {e}")
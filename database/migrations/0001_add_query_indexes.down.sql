@@ -0,0 +1,12 @@
+-- MySQL elimina el índice implícito de una clave foránea cuando se crea
+-- otro que la cubre, así que se recrea antes de borrar el compuesto
+CREATE INDEX user_id ON search_history (user_id);
+CREATE INDEX trainer_id ON team_pokemon (trainer_id);
+
+DROP INDEX idx_search_history_user_date ON search_history;
+DROP INDEX idx_search_history_term ON search_history;
+DROP INDEX idx_search_history_date ON search_history;
+DROP INDEX idx_team_pokemon_trainer_joined ON team_pokemon;
+DROP INDEX idx_team_pokemon_name ON team_pokemon;
+DROP INDEX idx_trainers_region_name ON trainers;
+DROP INDEX idx_users_created_at ON users;
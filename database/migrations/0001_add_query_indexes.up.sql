@@ -0,0 +1,22 @@
+-- Índices para las consultas más frecuentes de los modelos
+
+-- Búsquedas recientes por usuario (cubre también COUNT/MAX de get_user_stats)
+CREATE INDEX idx_search_history_user_date ON search_history (user_id, search_date, search_term);
+
+-- Búsquedas populares (GROUP BY search_term)
+CREATE INDEX idx_search_history_term ON search_history (search_term);
+
+-- Búsquedas por fecha (últimos 7 días y registro de búsquedas)
+CREATE INDEX idx_search_history_date ON search_history (search_date);
+
+-- Equipo de un entrenador ordenado por fecha de captura
+CREATE INDEX idx_team_pokemon_trainer_joined ON team_pokemon (trainer_id, joined_at);
+
+-- Pokémon más populares (GROUP BY pokemon_name)
+CREATE INDEX idx_team_pokemon_name ON team_pokemon (pokemon_name);
+
+-- Entrenadores por región ordenados por nombre
+CREATE INDEX idx_trainers_region_name ON trainers (region, name);
+
+-- Registros recientes (ORDER BY created_at DESC)
+CREATE INDEX idx_users_created_at ON users (created_at);
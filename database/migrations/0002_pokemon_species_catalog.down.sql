@@ -0,0 +1,41 @@
+-- Volver a copiar los datos de la especie en cada fila del equipo
+
+ALTER TABLE team_pokemon
+    DROP FOREIGN KEY fk_team_pokemon_species,
+    MODIFY pokemon_id INT,
+    ADD COLUMN pokemon_name VARCHAR(50) NOT NULL DEFAULT '' AFTER nickname,
+    ADD COLUMN pokemon_type VARCHAR(50) AFTER pokemon_name,
+    ADD COLUMN height FLOAT AFTER pokemon_type,
+    ADD COLUMN weight FLOAT AFTER height,
+    ADD COLUMN base_experience INT AFTER weight,
+    ADD COLUMN sprite_url TEXT AFTER base_experience,
+    ADD COLUMN stats_hp INT AFTER sprite_url,
+    ADD COLUMN stats_attack INT AFTER stats_hp,
+    ADD COLUMN stats_defense INT AFTER stats_attack,
+    ADD COLUMN stats_sp_attack INT AFTER stats_defense,
+    ADD COLUMN stats_sp_defense INT AFTER stats_sp_attack,
+    ADD COLUMN stats_speed INT AFTER stats_sp_defense,
+    ADD COLUMN moves TEXT AFTER stats_speed;
+
+UPDATE team_pokemon tp
+JOIN pokemon_species ps ON ps.id = tp.pokemon_id
+SET
+    tp.pokemon_name = ps.name,
+    tp.pokemon_type = ps.types,
+    tp.height = ps.height,
+    tp.weight = ps.weight,
+    tp.base_experience = ps.base_experience,
+    tp.sprite_url = ps.sprite_url,
+    tp.stats_hp = ps.stats_hp,
+    tp.stats_attack = ps.stats_attack,
+    tp.stats_defense = ps.stats_defense,
+    tp.stats_sp_attack = ps.stats_sp_attack,
+    tp.stats_sp_defense = ps.stats_sp_defense,
+    tp.stats_speed = ps.stats_speed,
+    tp.moves = ps.moves;
+
+ALTER TABLE team_pokemon ALTER COLUMN pokemon_name DROP DEFAULT;
+
+CREATE INDEX idx_team_pokemon_name ON team_pokemon (pokemon_name);
+
+DROP TABLE pokemon_species;
@@ -0,0 +1,63 @@
+-- Catálogo compartido de especies: los datos de cada Pokémon se guardan
+-- una sola vez y team_pokemon solo referencia la especie
+
+-- Cada fila del equipo necesita su especie: las que no la tienen
+-- perderían sus datos al borrar las columnas y dejarían de verse en el
+-- equipo. Si queda alguna, la migración falla aquí, antes de cambiar
+-- nada, y hay que corregirlas o borrarlas a mano
+-- (SELECT * FROM team_pokemon WHERE pokemon_id IS NULL).
+SET @previous_sql_mode = @@SESSION.sql_mode;
+SET SESSION sql_mode = 'STRICT_ALL_TABLES';
+ALTER TABLE team_pokemon MODIFY pokemon_id INT NOT NULL;
+SET SESSION sql_mode = @previous_sql_mode;
+
+CREATE TABLE pokemon_species (
+    id INT PRIMARY KEY,
+    name VARCHAR(50) NOT NULL,
+    types VARCHAR(50),
+    height FLOAT,
+    weight FLOAT,
+    base_experience INT,
+    sprite_url TEXT,
+    stats_hp INT,
+    stats_attack INT,
+    stats_defense INT,
+    stats_sp_attack INT,
+    stats_sp_defense INT,
+    stats_speed INT,
+    moves TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_pokemon_species_name (name)
+);
+
+-- Rellenar el catálogo con las especies que ya están en algún equipo
+INSERT INTO pokemon_species (
+    id, name, types, height, weight, base_experience, sprite_url,
+    stats_hp, stats_attack, stats_defense, stats_sp_attack,
+    stats_sp_defense, stats_speed, moves
+)
+SELECT
+    pokemon_id, MAX(pokemon_name), MAX(pokemon_type), MAX(height), MAX(weight),
+    MAX(base_experience), MAX(sprite_url), MAX(stats_hp), MAX(stats_attack),
+    MAX(stats_defense), MAX(stats_sp_attack), MAX(stats_sp_defense),
+    MAX(stats_speed), MAX(moves)
+FROM team_pokemon
+GROUP BY pokemon_id;
+
+-- Dejar team_pokemon solo con el entrenador, la especie, el apodo y la fecha
+ALTER TABLE team_pokemon
+    DROP INDEX idx_team_pokemon_name,
+    DROP COLUMN pokemon_name,
+    DROP COLUMN pokemon_type,
+    DROP COLUMN height,
+    DROP COLUMN weight,
+    DROP COLUMN base_experience,
+    DROP COLUMN sprite_url,
+    DROP COLUMN stats_hp,
+    DROP COLUMN stats_attack,
+    DROP COLUMN stats_defense,
+    DROP COLUMN stats_sp_attack,
+    DROP COLUMN stats_sp_defense,
+    DROP COLUMN stats_speed,
+    DROP COLUMN moves,
+    ADD CONSTRAINT fk_team_pokemon_species FOREIGN KEY (pokemon_id) REFERENCES pokemon_species(id);
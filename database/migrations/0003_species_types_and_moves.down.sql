@@ -0,0 +1,23 @@
+-- Volver a guardar tipos y movimientos como cadenas separadas por comas
+
+-- Las listas de movimientos superan el límite por defecto de GROUP_CONCAT
+SET SESSION group_concat_max_len = 1048576;
+
+ALTER TABLE pokemon_species
+    ADD COLUMN types VARCHAR(50) AFTER name,
+    ADD COLUMN moves TEXT AFTER stats_speed;
+
+UPDATE pokemon_species ps
+SET ps.types = (
+        SELECT GROUP_CONCAT(t.type_name ORDER BY t.slot SEPARATOR ',')
+        FROM pokemon_species_types t
+        WHERE t.species_id = ps.id
+    ),
+    ps.moves = (
+        SELECT GROUP_CONCAT(m.move_name ORDER BY m.position SEPARATOR ',')
+        FROM pokemon_species_moves m
+        WHERE m.species_id = ps.id
+    );
+
+DROP TABLE pokemon_species_moves;
+DROP TABLE pokemon_species_types;
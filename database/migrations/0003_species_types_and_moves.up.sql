@@ -0,0 +1,46 @@
+-- Tipos y movimientos de cada especie en tablas propias en lugar de
+-- cadenas separadas por comas
+
+CREATE TABLE pokemon_species_types (
+    species_id INT NOT NULL,
+    slot TINYINT NOT NULL,
+    type_name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (species_id, slot),
+    -- Distribución por tipo: GROUP BY type_name resuelto con el índice
+    KEY idx_species_types_type (type_name, species_id),
+    CONSTRAINT fk_species_types_species FOREIGN KEY (species_id)
+        REFERENCES pokemon_species(id) ON DELETE CASCADE
+);
+
+CREATE TABLE pokemon_species_moves (
+    species_id INT NOT NULL,
+    position SMALLINT NOT NULL,
+    move_name VARCHAR(50) NOT NULL,
+    PRIMARY KEY (species_id, position),
+    KEY idx_species_moves_move (move_name),
+    CONSTRAINT fk_species_moves_species FOREIGN KEY (species_id)
+        REFERENCES pokemon_species(id) ON DELETE CASCADE
+);
+
+-- Separar las cadenas existentes (JSON_TABLE convierte la lista en filas)
+INSERT INTO pokemon_species_types (species_id, slot, type_name)
+SELECT ps.id, parts.slot, parts.type_name
+FROM pokemon_species ps
+JOIN JSON_TABLE(
+    CONCAT('["', REPLACE(ps.types, ',', '","'), '"]'),
+    '$[*]' COLUMNS (slot FOR ORDINALITY, type_name VARCHAR(20) PATH '$')
+) parts
+WHERE ps.types IS NOT NULL AND ps.types != '';
+
+INSERT INTO pokemon_species_moves (species_id, position, move_name)
+SELECT ps.id, parts.position, parts.move_name
+FROM pokemon_species ps
+JOIN JSON_TABLE(
+    CONCAT('["', REPLACE(ps.moves, ',', '","'), '"]'),
+    '$[*]' COLUMNS (position FOR ORDINALITY, move_name VARCHAR(50) PATH '$')
+) parts
+WHERE ps.moves IS NOT NULL AND ps.moves != '';
+
+ALTER TABLE pokemon_species
+    DROP COLUMN types,
+    DROP COLUMN moves;
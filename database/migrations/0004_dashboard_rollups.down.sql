@@ -0,0 +1,7 @@
+-- Quitar las tablas resumen del panel de administración
+
+DROP TABLE rollup_region_trainers;
+DROP TABLE rollup_species_team;
+DROP TABLE rollup_role_users;
+DROP TABLE rollup_daily_searches;
+DROP TABLE rollup_totals;
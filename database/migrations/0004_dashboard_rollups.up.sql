@@ -0,0 +1,68 @@
+-- Tablas resumen del panel de administración. Los modelos las actualizan
+-- en la misma transacción que cada escritura; RollupModel.rebuild() las
+-- recalcula desde cero si alguna vez se desajustan.
+
+CREATE TABLE rollup_totals (
+    name VARCHAR(32) PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE rollup_daily_searches (
+    day DATE PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE rollup_role_users (
+    role_id INT PRIMARY KEY,
+    total INT NOT NULL DEFAULT 0,
+    CONSTRAINT fk_rollup_role_users_role FOREIGN KEY (role_id)
+        REFERENCES roles(id) ON DELETE CASCADE
+);
+
+CREATE TABLE rollup_species_team (
+    species_id INT PRIMARY KEY,
+    total INT NOT NULL DEFAULT 0,
+    -- Pokémon más populares (ORDER BY total DESC LIMIT 5)
+    KEY idx_rollup_species_team_total (total),
+    CONSTRAINT fk_rollup_species_team_species FOREIGN KEY (species_id)
+        REFERENCES pokemon_species(id) ON DELETE CASCADE
+);
+
+CREATE TABLE rollup_region_trainers (
+    region VARCHAR(50) PRIMARY KEY,
+    total INT NOT NULL DEFAULT 0,
+    -- Regiones más populares (ORDER BY total DESC LIMIT 5)
+    KEY idx_rollup_region_trainers_total (total)
+);
+
+-- Carga inicial a partir de los datos existentes
+INSERT INTO rollup_totals (name, total)
+SELECT 'users', COUNT(*) FROM users
+UNION ALL
+SELECT 'searches', COUNT(*) FROM search_history
+UNION ALL
+SELECT 'team_pokemon', COUNT(*) FROM team_pokemon;
+
+INSERT INTO rollup_daily_searches (day, total)
+SELECT DATE(search_date), COUNT(*)
+FROM search_history
+WHERE search_date IS NOT NULL
+GROUP BY DATE(search_date);
+
+INSERT INTO rollup_role_users (role_id, total)
+SELECT role_id, COUNT(*)
+FROM users
+WHERE role_id IS NOT NULL
+GROUP BY role_id;
+
+INSERT INTO rollup_species_team (species_id, total)
+SELECT pokemon_id, COUNT(*)
+FROM team_pokemon
+WHERE pokemon_id IS NOT NULL
+GROUP BY pokemon_id;
+
+INSERT INTO rollup_region_trainers (region, total)
+SELECT region, COUNT(*)
+FROM trainers
+WHERE region IS NOT NULL
+GROUP BY region;
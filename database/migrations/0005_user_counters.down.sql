@@ -0,0 +1,3 @@
+-- Quitar los contadores por usuario
+
+DROP TABLE user_counters;
@@ -0,0 +1,30 @@
+-- Contadores por usuario para el listado del panel de administración.
+-- Los modelos los actualizan al escribir; RollupModel.reconcile_user_counters()
+-- corrige cualquier desajuste.
+
+CREATE TABLE user_counters (
+    user_id INT PRIMARY KEY,
+    total_searches INT NOT NULL DEFAULT 0,
+    total_pokemon INT NOT NULL DEFAULT 0,
+    last_search_at TIMESTAMP NULL,
+    CONSTRAINT fk_user_counters_user FOREIGN KEY (user_id)
+        REFERENCES users(id) ON DELETE CASCADE
+);
+
+INSERT INTO user_counters (user_id, total_searches, total_pokemon, last_search_at)
+SELECT u.id,
+       COALESCE(s.total, 0),
+       COALESCE(p.total, 0),
+       s.last_search
+FROM users u
+LEFT JOIN (
+    SELECT user_id, COUNT(*) as total, MAX(search_date) as last_search
+    FROM search_history
+    GROUP BY user_id
+) s ON s.user_id = u.id
+LEFT JOIN (
+    SELECT t.user_id, COUNT(*) as total
+    FROM team_pokemon tp
+    JOIN trainers t ON t.id = tp.trainer_id
+    GROUP BY t.user_id
+) p ON p.user_id = u.id;
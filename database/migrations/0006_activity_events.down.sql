@@ -0,0 +1,3 @@
+-- Quitar el registro único de actividad
+
+DROP TABLE activity_events;
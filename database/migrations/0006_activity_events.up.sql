@@ -0,0 +1,39 @@
+-- Registro único de actividad (búsquedas y altas en equipos). Solo se
+-- añaden filas; el panel lo pagina por fecha sin unir tablas completas.
+
+CREATE TABLE activity_events (
+    id BIGINT PRIMARY KEY AUTO_INCREMENT,
+    occurred_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    type VARCHAR(20) NOT NULL,
+    user_id INT NOT NULL,
+    detail VARCHAR(255) NOT NULL,
+    -- Ventana de tiempo y paginación por (occurred_at, id)
+    KEY idx_activity_events_occurred (occurred_at, type),
+    -- Filtro por tipo
+    KEY idx_activity_events_type (type, occurred_at),
+    -- Filtro por usuario
+    KEY idx_activity_events_user (user_id, occurred_at),
+    CONSTRAINT fk_activity_events_user FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- Carga inicial a partir del historial existente
+INSERT INTO activity_events (occurred_at, type, user_id, detail)
+SELECT sh.search_date, 'search', sh.user_id, LEFT(sh.search_term, 255)
+FROM search_history sh
+WHERE sh.user_id IS NOT NULL;
+
+INSERT INTO activity_events (occurred_at, type, user_id, detail)
+SELECT tp.joined_at,
+       'team_update',
+       t.user_id,
+       LEFT(CONCAT(
+           CASE
+               WHEN tp.nickname IS NOT NULL
+               THEN CONCAT(ps.name, ' (', tp.nickname, ')')
+               ELSE ps.name
+           END,
+           ' added to team'
+       ), 255)
+FROM team_pokemon tp
+JOIN pokemon_species ps ON ps.id = tp.pokemon_id
+JOIN trainers t ON tp.trainer_id = t.id;
@@ -0,0 +1,155 @@
+-- Esquema para el motor SQLite embebido ([DATABASE] backend = sqlite).
+-- Equivale a database/schema.sql con todas las migraciones aplicadas;
+-- al añadir una migración hay que reflejar aquí el mismo cambio.
+
+-- Tabla de roles
+CREATE TABLE roles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(50) NOT NULL
+);
+
+-- Tabla de usuarios
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE,
+    role_id INT REFERENCES roles(id),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Tabla de entrenadores (personajes)
+CREATE TABLE trainers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT REFERENCES users(id),
+    name VARCHAR(50) NOT NULL,
+    age INT,
+    region VARCHAR(50),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Catálogo compartido de especies
+CREATE TABLE pokemon_species (
+    id INT PRIMARY KEY,
+    name VARCHAR(50) NOT NULL UNIQUE,
+    height FLOAT,
+    weight FLOAT,
+    base_experience INT,
+    sprite_url TEXT,
+    stats_hp INT,
+    stats_attack INT,
+    stats_defense INT,
+    stats_sp_attack INT,
+    stats_sp_defense INT,
+    stats_speed INT,
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE TABLE pokemon_species_types (
+    species_id INT NOT NULL REFERENCES pokemon_species(id) ON DELETE CASCADE,
+    slot TINYINT NOT NULL,
+    type_name VARCHAR(20) NOT NULL,
+    PRIMARY KEY (species_id, slot)
+);
+CREATE INDEX idx_species_types_type ON pokemon_species_types (type_name, species_id);
+
+CREATE TABLE pokemon_species_moves (
+    species_id INT NOT NULL REFERENCES pokemon_species(id) ON DELETE CASCADE,
+    position SMALLINT NOT NULL,
+    move_name VARCHAR(50) NOT NULL,
+    PRIMARY KEY (species_id, position)
+);
+CREATE INDEX idx_species_moves_move ON pokemon_species_moves (move_name);
+
+-- Tabla de pokémon del equipo
+CREATE TABLE team_pokemon (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    trainer_id INT REFERENCES trainers(id),
+    pokemon_id INT NOT NULL REFERENCES pokemon_species(id),
+    nickname VARCHAR(50),
+    joined_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_team_pokemon_trainer_joined ON team_pokemon (trainer_id, joined_at);
+CREATE INDEX idx_team_pokemon_species ON team_pokemon (pokemon_id);
+
+-- Tabla de historial de búsquedas
+CREATE TABLE search_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT REFERENCES users(id),
+    search_term VARCHAR(100),
+    pokemon_id INT,
+    search_date TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_search_history_user_date ON search_history (user_id, search_date, search_term);
+CREATE INDEX idx_search_history_term ON search_history (search_term);
+CREATE INDEX idx_search_history_date ON search_history (search_date);
+
+CREATE INDEX idx_trainers_user ON trainers (user_id);
+CREATE INDEX idx_trainers_region_name ON trainers (region, name);
+CREATE INDEX idx_users_created_at ON users (created_at);
+
+-- Tablas resumen del panel de administración
+CREATE TABLE rollup_totals (
+    name VARCHAR(32) PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE rollup_daily_searches (
+    day DATE PRIMARY KEY,
+    total BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE rollup_role_users (
+    role_id INT PRIMARY KEY REFERENCES roles(id) ON DELETE CASCADE,
+    total INT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE rollup_species_team (
+    species_id INT PRIMARY KEY REFERENCES pokemon_species(id) ON DELETE CASCADE,
+    total INT NOT NULL DEFAULT 0
+);
+CREATE INDEX idx_rollup_species_team_total ON rollup_species_team (total);
+
+CREATE TABLE rollup_region_trainers (
+    region VARCHAR(50) PRIMARY KEY,
+    total INT NOT NULL DEFAULT 0
+);
+CREATE INDEX idx_rollup_region_trainers_total ON rollup_region_trainers (total);
+
+-- Contadores por usuario
+CREATE TABLE user_counters (
+    user_id INT PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    total_searches INT NOT NULL DEFAULT 0,
+    total_pokemon INT NOT NULL DEFAULT 0,
+    last_search_at TIMESTAMP NULL
+);
+
+-- Registro único de actividad
+CREATE TABLE activity_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    occurred_at TIMESTAMP NOT NULL DEFAULT (datetime('now', 'localtime')),
+    type VARCHAR(20) NOT NULL,
+    user_id INT NOT NULL REFERENCES users(id),
+    detail VARCHAR(255) NOT NULL
+);
+CREATE INDEX idx_activity_events_occurred ON activity_events (occurred_at, type);
+CREATE INDEX idx_activity_events_type ON activity_events (type, occurred_at);
+CREATE INDEX idx_activity_events_user ON activity_events (user_id, occurred_at);
+
+-- Versiones de migración que este esquema ya incluye
+CREATE TABLE schema_version (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+INSERT INTO schema_version (version, name) VALUES
+    (1, 'add_query_indexes'),
+    (2, 'pokemon_species_catalog'),
+    (3, 'species_types_and_moves'),
+    (4, 'dashboard_rollups'),
+    (5, 'user_counters'),
+    (6, 'activity_events');
+
+-- Insertar roles básicos y contadores iniciales
+INSERT INTO roles (name) VALUES ('user'), ('admin');
+INSERT INTO rollup_totals (name, total) VALUES ('users', 0), ('searches', 0), ('team_pokemon', 0);
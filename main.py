@@ -3,6 +3,8 @@ import customtkinter as ctk
 from views.login_view import LoginView
 from views.main_view import MainView
 from views.profile_view import ProfileView
+from services.db_profiler import profiler
+from services.search_history_buffer import search_history
 
 class App(ctk.CTk):
     def __init__(self):
@@ -22,6 +24,9 @@ class App(ctk.CTk):
         
         # Variables de sesión
         self.current_user = None
+
+        # Guardar el historial pendiente al cerrar la ventana
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Mostrar login
         self.show_login()
@@ -31,8 +36,9 @@ class App(ctk.CTk):
         for widget in self.winfo_children():
             widget.destroy()
         
-        # Resetear usuario actual
+        # Resetear usuario actual y guardar su historial pendiente
         self.current_user = None
+        search_history.flush()
         
         # Mostrar vista de login
         login_view = LoginView(self, self.show_main_view)
@@ -68,6 +74,12 @@ class App(ctk.CTk):
         )
         profile_view.grid(row=0, column=0, sticky="nsew")
 
+    def on_close(self):
+        search_history.close()
+        # Informe de consultas de la sesión (logs/profiles) para comparar versiones
+        profiler.export_report()
+        self.destroy()
+
 if __name__ == "__main__":
     app = App()
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,90 @@
+# Modelo del registro de actividad
+# models/activity_model.py
+from datetime import datetime
+from config.database import DatabaseConnection
+from utils.helpers import encode_cursor, decode_cursor
+from typing import Dict, List, Optional, Tuple
+
+ACTIVITY_TYPES = ('search', 'team_update')
+
+class ActivityModel:
+    """
+    Registro de actividad de solo escritura al final. Los métodos record_*
+    deben llamarse dentro de la transacción que guarda la acción.
+    """
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    def record_searches(self, searches: List[Tuple[int, str, datetime]]):
+        """
+        Registra las búsquedas (usuario, término, fecha) como actividad
+        """
+        if not searches:
+            return
+        self.db.execute_many("""
+            INSERT INTO activity_events (occurred_at, type, user_id, detail)
+            VALUES (%s, %s, %s, %s)
+        """, [(search_date, 'search', user_id, search_term[:255])
+              for user_id, search_term, search_date in searches])
+
+    def record_team_addition(self, trainer_id: int, pokemon_name: str, nickname: str = None):
+        """
+        Registra el alta de un Pokémon en el equipo del entrenador
+        """
+        name = f"{pokemon_name} ({nickname})" if nickname else pokemon_name
+        self.db.execute_query("""
+            INSERT INTO activity_events (type, user_id, detail)
+            SELECT 'team_update', user_id, %s FROM trainers WHERE id = %s
+        """, (f"{name} added to team"[:255], trainer_id))
+
+    def delete_user_events(self, user_id: int):
+        """
+        Elimina la actividad de un usuario que se va a borrar
+        """
+        self.db.execute_query("DELETE FROM activity_events WHERE user_id = %s", (user_id,))
+
+    def get_events(self, limit: int = 100, cursor: str = None, activity_type: str = None,
+                   days: int = None, user_id: int = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Obtiene una página de actividad, de la más reciente a la más
+        antigua, y el cursor de la página siguiente (None si no hay más).
+        El coste depende del tamaño de página, no del historial.
+        """
+        conditions = []
+        params = []
+        if cursor:
+            occurred_at, last_type, last_id = decode_cursor(cursor, datetime, str, int)
+            conditions.append("""(ae.occurred_at < %s OR (ae.occurred_at = %s AND
+                (ae.type < %s OR (ae.type = %s AND ae.id < %s))))""")
+            params.extend([occurred_at, occurred_at, last_type, last_type, last_id])
+        if activity_type:
+            if activity_type not in ACTIVITY_TYPES:
+                raise ValueError(f"Unknown activity type: {activity_type}")
+            conditions.append("ae.type = %s")
+            params.append(activity_type)
+        if days:
+            conditions.append("ae.occurred_at >= DATE_SUB(NOW(), INTERVAL %s DAY)")
+            params.append(days)
+        if user_id:
+            conditions.append("ae.user_id = %s")
+            params.append(user_id)
+
+        # El orden coincide con el índice (occurred_at, type) más el id
+        query = f"""
+            SELECT ae.id, ae.type, u.username, ae.detail,
+                   ae.occurred_at as activity_date
+            FROM activity_events ae
+            JOIN users u ON u.id = ae.user_id
+            {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+            ORDER BY ae.occurred_at DESC, ae.type DESC, ae.id DESC
+            LIMIT %s
+        """
+        params.append(limit + 1)
+        rows = self.db.fetch_all(query, tuple(params))
+
+        # Se pide una fila de más para saber si hay otra página
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last['activity_date'], last['type'], last['id'])
@@ -1,31 +1,62 @@
 # models/admin_model.py
 from config.database import DatabaseConnection
+from models.activity_model import ActivityModel
+from models.rollup_model import RollupModel
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
+from utils.helpers import encode_cursor, decode_cursor
 
 class AdminModel:
     def __init__(self):
         self.db = DatabaseConnection()
-
-    def get_all_users(self) -> List[Dict]:
-        """
-        Obtiene todos los usuarios con sus datos básicos
-        """
-        query = """
+        self.rollups = RollupModel()
+        self.activity = ActivityModel()
+
+    def _page(self, rows: List[Dict], limit: int, key) -> Tuple[List[Dict], Optional[str]]:
+        # Se pide una fila de más para saber si hay otra página
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(*key(rows[-1]))
+
+    def get_users_page(self, limit: int = 50, cursor: str = None,
+                       role: str = None, search: str = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Obtiene una página de usuarios, del más reciente al más antiguo,
+        y el cursor de la página siguiente (None si no hay más)
+        """
+        conditions = []
+        params = []
+        if cursor:
+            created_at, user_id = decode_cursor(cursor, datetime, int)
+            conditions.append("(u.created_at < %s OR (u.created_at = %s AND u.id < %s))")
+            params.extend([created_at, created_at, user_id])
+        if role:
+            conditions.append("r.name = %s")
+            params.append(role)
+        if search:
+            conditions.append("(u.username LIKE %s OR u.email LIKE %s)")
+            params.extend([f"%{search}%", f"%{search}%"])
+
+        query = f"""
             SELECT 
                 u.id, u.username, u.email, u.created_at,
                 r.name as role_name,
                 t.name as trainer_name,
-                (SELECT COUNT(*) FROM search_history WHERE user_id = u.id) as total_searches,
-                (SELECT COUNT(*) FROM team_pokemon tp 
-                 JOIN trainers tr ON tp.trainer_id = tr.id 
-                 WHERE tr.user_id = u.id) as total_pokemon
+                COALESCE(uc.total_searches, 0) as total_searches,
+                COALESCE(uc.total_pokemon, 0) as total_pokemon,
+                uc.last_search_at
             FROM users u
             JOIN roles r ON u.role_id = r.id
             LEFT JOIN trainers t ON u.id = t.user_id
-            ORDER BY u.created_at DESC
+            LEFT JOIN user_counters uc ON uc.user_id = u.id
+            {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+            ORDER BY u.created_at DESC, u.id DESC
+            LIMIT %s
         """
-        return self.db.fetch_all(query)
+        params.append(limit + 1)
+        rows = self.db.fetch_all(query, tuple(params))
+        return self._page(rows, limit, lambda row: (row['created_at'], row['id']))
 
     def get_user_details(self, user_id: int) -> Optional[Dict]:
         """
@@ -53,7 +84,14 @@ class AdminModel:
                 SET role_id = (SELECT id FROM roles WHERE name = %s)
                 WHERE id = %s
             """
-            self.db.execute_query(query, (new_role, user_id))
+            with self.db.transaction():
+                user = self.db.fetch_one(
+                    "SELECT role_id FROM users WHERE id = %s FOR UPDATE",
+                    (user_id,)
+                )
+                self.db.execute_query(query, (new_role, user_id))
+                if user:
+                    self.rollups.user_role_changed(user['role_id'], new_role)
             return True
         except Exception as e:
             print(f"Error updating user role: {str(e)}")
@@ -64,41 +102,56 @@ class AdminModel:
         Elimina un usuario y todos sus datos relacionados
         """
         try:
-            # Iniciar transacción
-            self.db.execute_query("START TRANSACTION")
-
-            # Eliminar historial de búsquedas
-            self.db.execute_query(
-                "DELETE FROM search_history WHERE user_id = %s",
-                (user_id,)
-            )
-
-            # Eliminar pokémon del equipo
-            self.db.execute_query("""
-                DELETE tp FROM team_pokemon tp
-                JOIN trainers t ON tp.trainer_id = t.id
-                WHERE t.user_id = %s
-            """, (user_id,))
-
-            # Eliminar entrenador
-            self.db.execute_query(
-                "DELETE FROM trainers WHERE user_id = %s",
-                (user_id,)
-            )
-
-            # Eliminar usuario
-            self.db.execute_query(
-                "DELETE FROM users WHERE id = %s",
-                (user_id,)
-            )
-
-            # Confirmar transacción
-            self.db.execute_query("COMMIT")
+            # Todo se confirma junto al salir del bloque o se revierte si falla
+            with self.db.transaction():
+                user = self.db.fetch_one(
+                    "SELECT role_id FROM users WHERE id = %s FOR UPDATE",
+                    (user_id,)
+                )
+                trainers = self.db.fetch_all(
+                    "SELECT id, region FROM trainers WHERE user_id = %s FOR UPDATE",
+                    (user_id,)
+                )
+
+                # Descontar de los resúmenes lo que se va a eliminar
+                self.rollups.user_searches_removed(user_id)
+                for trainer in trainers:
+                    self.rollups.trainer_team_removed(trainer['id'])
+                    self.rollups.trainer_region_changed(trainer['region'], None)
+                if user:
+                    self.rollups.user_removed(user_id, user['role_id'])
+
+                # Eliminar actividad
+                self.activity.delete_user_events(user_id)
+
+                # Eliminar historial de búsquedas
+                self.db.execute_query(
+                    "DELETE FROM search_history WHERE user_id = %s",
+                    (user_id,)
+                )
+
+                # Eliminar pokémon del equipo
+                self.db.execute_query("""
+                    DELETE tp FROM team_pokemon tp
+                    JOIN trainers t ON tp.trainer_id = t.id
+                    WHERE t.user_id = %s
+                """, (user_id,))
+
+                # Eliminar entrenador
+                self.db.execute_query(
+                    "DELETE FROM trainers WHERE user_id = %s",
+                    (user_id,)
+                )
+
+                # Eliminar usuario
+                self.db.execute_query(
+                    "DELETE FROM users WHERE id = %s",
+                    (user_id,)
+                )
+                self.db.invalidate(f"user:{user_id}", *[f"trainer:{trainer['id']}" for trainer in trainers])
             return True
 
         except Exception as e:
-            # Revertir en caso de error
-            self.db.execute_query("ROLLBACK")
             print(f"Error deleting user: {str(e)}")
             return False
 
@@ -118,42 +171,15 @@ class AdminModel:
         }
 
         try:
-            # Total usuarios
-            query = "SELECT COUNT(*) as total FROM users"
-            result = self.db.fetch_one(query)
-            stats['total_users'] = result['total']
-
-            # Total búsquedas
-            query = "SELECT COUNT(*) as total FROM search_history"
-            result = self.db.fetch_one(query)
-            stats['total_searches'] = result['total']
-
-            # Total pokémon en equipos
-            query = "SELECT COUNT(*) as total FROM team_pokemon"
-            result = self.db.fetch_one(query)
-            stats['total_pokemon'] = result['total']
-
-            # Usuarios por rol
-            query = """
-                SELECT r.name, COUNT(*) as total
-                FROM users u
-                JOIN roles r ON u.role_id = r.id
-                GROUP BY r.name
-            """
-            results = self.db.fetch_all(query)
-            stats['users_by_role'] = {
-                row['name']: row['total'] for row in results
-            }
+            # Los contadores salen de las tablas resumen, que se mantienen
+            # al escribir; así el coste no depende del tamaño del historial
+            totals = self.rollups.get_totals()
+            stats['total_users'] = totals.get('users', 0)
+            stats['total_searches'] = totals.get('searches', 0)
+            stats['total_pokemon'] = totals.get('team_pokemon', 0)
 
-            # Búsquedas últimos 7 días
-            query = """
-                SELECT DATE(search_date) as date, COUNT(*) as total
-                FROM search_history
-                WHERE search_date >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)
-                GROUP BY DATE(search_date)
-                ORDER BY date
-            """
-            stats['searches_last_7_days'] = self.db.fetch_all(query)
+            stats['users_by_role'] = self.rollups.get_users_by_role()
+            stats['searches_last_7_days'] = self.rollups.get_daily_searches(7)
 
             # Registros recientes
             query = """
@@ -164,26 +190,8 @@ class AdminModel:
             """
             stats['recent_registrations'] = self.db.fetch_all(query)
 
-            # Pokémon más populares
-            query = """
-                SELECT pokemon_name, COUNT(*) as total
-                FROM team_pokemon
-                GROUP BY pokemon_name
-                ORDER BY total DESC
-                LIMIT 5
-            """
-            stats['popular_pokemon'] = self.db.fetch_all(query)
-
-            # Regiones más populares
-            query = """
-                SELECT region, COUNT(*) as total
-                FROM trainers
-                WHERE region IS NOT NULL
-                GROUP BY region
-                ORDER BY total DESC
-                LIMIT 5
-            """
-            stats['popular_regions'] = self.db.fetch_all(query)
+            stats['popular_pokemon'] = self.rollups.get_popular_pokemon(5)
+            stats['popular_regions'] = self.rollups.get_popular_regions(5)
 
             return stats
 
@@ -191,50 +199,44 @@ class AdminModel:
             print(f"Error getting system stats: {str(e)}")
             return stats
 
-    def get_search_logs(self, limit: int = 100) -> List[Dict]:
-        """
-        Obtiene los registros de búsqueda más recientes
-        """
-        query = """
+    def get_search_logs(self, limit: int = 100, cursor: str = None, user_id: int = None,
+                        search_term: str = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Obtiene una página de búsquedas, de la más reciente a la más
+        antigua, y el cursor de la página siguiente (None si no hay más)
+        """
+        conditions = []
+        params = []
+        if cursor:
+            search_date, search_id = decode_cursor(cursor, datetime, int)
+            conditions.append("(sh.search_date < %s OR (sh.search_date = %s AND sh.id < %s))")
+            params.extend([search_date, search_date, search_id])
+        if user_id:
+            conditions.append("sh.user_id = %s")
+            params.append(user_id)
+        if search_term:
+            conditions.append("sh.search_term LIKE %s")
+            params.append(f"%{search_term}%")
+
+        query = f"""
             SELECT 
                 sh.id, sh.search_term, sh.search_date,
                 u.username, u.email
             FROM search_history sh
             JOIN users u ON sh.user_id = u.id
-            ORDER BY sh.search_date DESC
+            {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+            ORDER BY sh.search_date DESC, sh.id DESC
             LIMIT %s
         """
-        return self.db.fetch_all(query, (limit,))
+        params.append(limit + 1)
+        rows = self.db.fetch_all(query, tuple(params))
+        return self._page(rows, limit, lambda row: (row['search_date'], row['id']))
 
-    def get_activity_logs(self, days: int = 7) -> List[Dict]:
+    def get_activity_logs(self, limit: int = 100, cursor: str = None, activity_type: str = None,
+                          days: int = 7, user_id: int = None) -> Tuple[List[Dict], Optional[str]]:
         """
-        Obtiene logs de actividad reciente
+        Obtiene una página de actividad (búsquedas y altas en equipos) de
+        los últimos días y el cursor de la página siguiente (None si no
+        hay más). activity_type filtra por 'search' o 'team_update'.
         """
-        query = """
-            (SELECT 
-                'search' as type,
-                u.username,
-                sh.search_term as detail,
-                sh.search_date as activity_date
-            FROM search_history sh
-            JOIN users u ON sh.user_id = u.id)
-            UNION ALL
-            (SELECT 
-                'team_update' as type,
-                u.username,
-                CONCAT(
-                    CASE 
-                        WHEN tp.nickname IS NOT NULL 
-                        THEN CONCAT(tp.pokemon_name, ' (', tp.nickname, ')')
-                        ELSE tp.pokemon_name
-                    END,
-                    ' added to team'
-                ) as detail,
-                tp.joined_at as activity_date
-            FROM team_pokemon tp
-            JOIN trainers t ON tp.trainer_id = t.id
-            JOIN users u ON t.user_id = u.id)
-            ORDER BY activity_date DESC
-            LIMIT 100
-        """
-        return self.db.fetch_all(query)
\ No newline at end of file
+        return self.activity.get_events(limit, cursor, activity_type, days, user_id)
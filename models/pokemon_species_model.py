@@ -0,0 +1,169 @@
+# Modelo del catálogo de especies
+# models/pokemon_species_model.py
+from config.database import DatabaseConnection
+from typing import Dict, List, Optional
+
+# Fila del equipo junto con los datos de su especie. Conserva los nombres
+# de columna que usaban las vistas cuando team_pokemon copiaba la especie;
+# los tipos y movimientos se añaden con attach_types_and_moves.
+TEAM_POKEMON_SELECT = """
+    SELECT tp.id, tp.trainer_id, tp.pokemon_id, tp.nickname, tp.joined_at,
+           ps.name as pokemon_name,
+           ps.height, ps.weight, ps.base_experience, ps.sprite_url,
+           ps.stats_hp, ps.stats_attack, ps.stats_defense,
+           ps.stats_sp_attack, ps.stats_sp_defense, ps.stats_speed
+    FROM team_pokemon tp
+    JOIN pokemon_species ps ON ps.id = tp.pokemon_id
+"""
+
+class PokemonSpeciesModel:
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    def save_species(self, pokemon_data: Dict):
+        """
+        Inserta o actualiza una especie (con sus tipos y movimientos) a
+        partir de los datos ya procesados de la API. Lanza la excepción si
+        falla para que la transacción que la contiene se revierta.
+        """
+        query = """
+            INSERT INTO pokemon_species (
+                id, name, height, weight, base_experience,
+                sprite_url, stats_hp, stats_attack, stats_defense,
+                stats_sp_attack, stats_sp_defense, stats_speed
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            )
+            ON DUPLICATE KEY UPDATE
+                name = VALUES(name),
+                height = VALUES(height),
+                weight = VALUES(weight),
+                base_experience = VALUES(base_experience),
+                sprite_url = VALUES(sprite_url),
+                stats_hp = VALUES(stats_hp),
+                stats_attack = VALUES(stats_attack),
+                stats_defense = VALUES(stats_defense),
+                stats_sp_attack = VALUES(stats_sp_attack),
+                stats_sp_defense = VALUES(stats_sp_defense),
+                stats_speed = VALUES(stats_speed)
+        """
+        species_id = pokemon_data['id']
+        params = (
+            species_id,
+            pokemon_data['name'],
+            pokemon_data['height'],
+            pokemon_data['weight'],
+            pokemon_data.get('base_experience', 0),
+            pokemon_data['sprites']['front_default'],
+            pokemon_data['stats']['hp'],
+            pokemon_data['stats']['attack'],
+            pokemon_data['stats']['defense'],
+            pokemon_data['stats']['sp_attack'],
+            pokemon_data['stats']['sp_defense'],
+            pokemon_data['stats']['speed']
+        )
+
+        with self.db.transaction():
+            self.db.execute_query(query, params)
+
+            self.db.execute_query(
+                "DELETE FROM pokemon_species_types WHERE species_id = %s",
+                (species_id,)
+            )
+            if pokemon_data['types']:
+                self.db.execute_many(
+                    "INSERT INTO pokemon_species_types (species_id, slot, type_name) VALUES (%s, %s, %s)",
+                    [(species_id, slot, type_name)
+                     for slot, type_name in enumerate(pokemon_data['types'], start=1)]
+                )
+
+            self.db.execute_query(
+                "DELETE FROM pokemon_species_moves WHERE species_id = %s",
+                (species_id,)
+            )
+            if pokemon_data['moves']:
+                self.db.execute_many(
+                    "INSERT INTO pokemon_species_moves (species_id, position, move_name) VALUES (%s, %s, %s)",
+                    [(species_id, position, move_name)
+                     for position, move_name in enumerate(pokemon_data['moves'], start=1)]
+                )
+            self.db.invalidate(f"species:{species_id}")
+
+    def get_species(self, species_id: int) -> Optional[Dict]:
+        """
+        Obtiene una especie del catálogo por su ID de la PokeAPI
+        """
+        query = "SELECT * FROM pokemon_species WHERE id = %s"
+        return self.db.fetch_one_cached(query, (species_id,), [f"species:{species_id}"])
+
+    def get_species_types(self, species_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Obtiene los tipos (en orden) de varias especies con una sola consulta
+        """
+        if not species_ids:
+            return {}
+        placeholders = ', '.join(['%s'] * len(species_ids))
+        query = f"""
+            SELECT species_id, type_name
+            FROM pokemon_species_types
+            WHERE species_id IN ({placeholders})
+            ORDER BY species_id, slot
+        """
+        types = {}
+        tags = [f"species:{species_id}" for species_id in species_ids]
+        for row in self.db.fetch_all_cached(query, tuple(species_ids), tags):
+            types.setdefault(row['species_id'], []).append(row['type_name'])
+        return types
+
+    def get_species_moves(self, species_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Obtiene los movimientos (en orden) de varias especies con una sola consulta
+        """
+        if not species_ids:
+            return {}
+        placeholders = ', '.join(['%s'] * len(species_ids))
+        query = f"""
+            SELECT species_id, move_name
+            FROM pokemon_species_moves
+            WHERE species_id IN ({placeholders})
+            ORDER BY species_id, position
+        """
+        moves = {}
+        tags = [f"species:{species_id}" for species_id in species_ids]
+        for row in self.db.fetch_all_cached(query, tuple(species_ids), tags):
+            moves.setdefault(row['species_id'], []).append(row['move_name'])
+        return moves
+
+    def attach_types_and_moves(self, rows: List[Dict], moves: bool = True) -> List[Dict]:
+        """
+        Añade a cada fila del equipo las listas 'types' y 'moves' de su
+        especie (dos consultas en total, no una por fila)
+        """
+        species_ids = sorted({row['pokemon_id'] for row in rows if row})
+        types_by_species = self.get_species_types(species_ids)
+        moves_by_species = self.get_species_moves(species_ids) if moves else {}
+        for row in rows:
+            if row:
+                row['types'] = types_by_species.get(row['pokemon_id'], [])
+                if moves:
+                    row['moves'] = moves_by_species.get(row['pokemon_id'], [])
+        return rows
+
+    def get_type_distribution(self, trainer_id: int = None) -> Dict[str, int]:
+        """
+        Cuenta los Pokémon de los equipos por tipo, de un entrenador o de
+        todos. Se resuelve en SQL con el índice por tipo.
+        """
+        query = """
+            SELECT pst.type_name, COUNT(*) as total
+            FROM team_pokemon tp
+            JOIN pokemon_species_types pst ON pst.species_id = tp.pokemon_id
+        """
+        if trainer_id is None:
+            query += "GROUP BY pst.type_name ORDER BY total DESC, pst.type_name"
+            rows = self.db.fetch_all(query)
+        else:
+            query += "WHERE tp.trainer_id = %s\n"
+            query += "GROUP BY pst.type_name ORDER BY total DESC, pst.type_name"
+            rows = self.db.fetch_all_cached(query, (trainer_id,), [f"trainer:{trainer_id}"])
+        return {row['type_name']: row['total'] for row in rows}
@@ -0,0 +1,341 @@
+# Modelo de las tablas resumen del panel de administración
+# models/rollup_model.py
+from collections import Counter
+from datetime import datetime
+from config.database import DatabaseConnection
+from services.query_cache import query_cache
+from typing import Dict, Iterable, List, Tuple
+
+# Recalculo completo de cada tabla resumen a partir de los datos
+REBUILD_QUERIES = [
+    ("rollup_totals", """
+        INSERT INTO rollup_totals (name, total)
+        SELECT 'users', COUNT(*) FROM users
+        UNION ALL
+        SELECT 'searches', COUNT(*) FROM search_history
+        UNION ALL
+        SELECT 'team_pokemon', COUNT(*) FROM team_pokemon
+    """),
+    ("rollup_daily_searches", """
+        INSERT INTO rollup_daily_searches (day, total)
+        SELECT DATE(search_date), COUNT(*)
+        FROM search_history
+        WHERE search_date IS NOT NULL
+        GROUP BY DATE(search_date)
+    """),
+    ("rollup_role_users", """
+        INSERT INTO rollup_role_users (role_id, total)
+        SELECT role_id, COUNT(*)
+        FROM users
+        WHERE role_id IS NOT NULL
+        GROUP BY role_id
+    """),
+    ("rollup_species_team", """
+        INSERT INTO rollup_species_team (species_id, total)
+        SELECT pokemon_id, COUNT(*)
+        FROM team_pokemon
+        WHERE pokemon_id IS NOT NULL
+        GROUP BY pokemon_id
+    """),
+    ("rollup_region_trainers", """
+        INSERT INTO rollup_region_trainers (region, total)
+        SELECT region, COUNT(*)
+        FROM trainers
+        WHERE region IS NOT NULL
+        GROUP BY region
+    """)
+]
+
+# Valores correctos de los contadores por usuario, calculados desde cero
+USER_COUNTERS_SOURCE = """
+    SELECT u.id as user_id,
+           COALESCE(s.total, 0) as total_searches,
+           COALESCE(p.total, 0) as total_pokemon,
+           s.last_search as last_search_at
+    FROM users u
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) as total, MAX(search_date) as last_search
+        FROM search_history
+        GROUP BY user_id
+    ) s ON s.user_id = u.id
+    LEFT JOIN (
+        SELECT t.user_id, COUNT(*) as total
+        FROM team_pokemon tp
+        JOIN trainers t ON t.id = tp.trainer_id
+        GROUP BY t.user_id
+    ) p ON p.user_id = u.id
+"""
+
+class RollupModel:
+    """
+    Mantiene los contadores del panel de administración. Los métodos de
+    escritura deben llamarse dentro de la transacción que modifica los
+    datos para que los contadores nunca se desajusten.
+    """
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    def _bump(self, table: str, key_column: str, deltas: Dict):
+        # Las filas sin clave (rol, especie o fecha nulos) no tienen
+        # contador propio, igual que al reconstruir las tablas
+        deltas = [(key, delta) for key, delta in deltas.items() if delta and key is not None]
+        if not deltas:
+            return
+        query = f"""
+            INSERT INTO {table} ({key_column}, total) VALUES (%s, %s)
+            ON DUPLICATE KEY UPDATE total = total + VALUES(total)
+        """
+        if len(deltas) == 1:
+            self.db.execute_query(query, deltas[0])
+        else:
+            self.db.execute_many(query, deltas)
+
+    def _bump_total(self, name: str, delta: int):
+        self._bump('rollup_totals', 'name', {name: delta})
+
+    # Búsquedas
+
+    def searches_added(self, searches: Iterable[Tuple[int, str, datetime]]):
+        """
+        Suma las búsquedas nuevas (usuario, término, fecha) al total, a su
+        día y a los contadores de cada usuario
+        """
+        per_day = Counter()
+        per_user = {}
+        for user_id, _, search_date in searches:
+            per_day[search_date.date()] += 1
+            total, last_search = per_user.get(user_id, (0, search_date))
+            per_user[user_id] = (total + 1, max(last_search, search_date))
+
+        self._bump('rollup_daily_searches', 'day', per_day)
+        self._bump_total('searches', sum(per_day.values()))
+        if per_user:
+            self.db.execute_many("""
+                INSERT INTO user_counters (user_id, total_searches, last_search_at)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    total_searches = total_searches + VALUES(total_searches),
+                    last_search_at = GREATEST(
+                        COALESCE(last_search_at, VALUES(last_search_at)),
+                        VALUES(last_search_at)
+                    )
+            """, [(user_id, total, last_search) for user_id, (total, last_search) in per_user.items()])
+
+    def user_searches_removed(self, user_id: int):
+        """
+        Resta las búsquedas de un usuario que se van a eliminar
+        """
+        rows = self.db.fetch_all("""
+            SELECT DATE(search_date) as day, COUNT(*) as total
+            FROM search_history
+            WHERE user_id = %s
+            GROUP BY DATE(search_date)
+        """, (user_id,))
+        self._bump('rollup_daily_searches', 'day', {row['day']: -row['total'] for row in rows})
+        self._bump_total('searches', -sum(row['total'] for row in rows))
+
+    # Pokémon de los equipos
+
+    def _bump_user_pokemon(self, trainer_id: int, delta: int):
+        self.db.execute_query("""
+            INSERT INTO user_counters (user_id, total_pokemon)
+            SELECT user_id, %s FROM trainers WHERE id = %s
+            ON DUPLICATE KEY UPDATE total_pokemon = total_pokemon + %s
+        """, (delta, trainer_id, delta))
+
+    def pokemon_added(self, trainer_id: int, species_id: int):
+        """
+        Suma un Pokémon de la especie al equipo del entrenador
+        """
+        self._bump('rollup_species_team', 'species_id', {species_id: 1})
+        self._bump_total('team_pokemon', 1)
+        self._bump_user_pokemon(trainer_id, 1)
+
+    def pokemon_removed(self, trainer_id: int, species_id: int):
+        """
+        Resta un Pokémon de la especie del equipo del entrenador
+        """
+        self._bump('rollup_species_team', 'species_id', {species_id: -1})
+        self._bump_total('team_pokemon', -1)
+        self._bump_user_pokemon(trainer_id, -1)
+
+    def trainer_team_removed(self, trainer_id: int):
+        """
+        Resta todo el equipo de un entrenador que se va a vaciar
+        """
+        rows = self.db.fetch_all("""
+            SELECT pokemon_id, COUNT(*) as total
+            FROM team_pokemon
+            WHERE trainer_id = %s
+            GROUP BY pokemon_id
+        """, (trainer_id,))
+        removed = sum(row['total'] for row in rows)
+        self._bump('rollup_species_team', 'species_id', {row['pokemon_id']: -row['total'] for row in rows})
+        self._bump_total('team_pokemon', -removed)
+        if removed:
+            self._bump_user_pokemon(trainer_id, -removed)
+
+    # Entrenadores
+
+    def trainer_region_changed(self, old_region: str = None, new_region: str = None):
+        """
+        Mueve un entrenador de región; None significa alta o baja
+        """
+        if old_region == new_region:
+            return
+        deltas = {}
+        if old_region is not None:
+            deltas[old_region] = -1
+        if new_region is not None:
+            deltas[new_region] = 1
+        self._bump('rollup_region_trainers', 'region', deltas)
+
+    # Usuarios
+
+    def _bump_role_name(self, role_name: str, delta: int):
+        self.db.execute_query("""
+            INSERT INTO rollup_role_users (role_id, total)
+            SELECT id, %s FROM roles WHERE name = %s
+            ON DUPLICATE KEY UPDATE total = total + %s
+        """, (delta, role_name, delta))
+
+    def user_added(self, role_name: str):
+        """
+        Suma un usuario nuevo a su rol
+        """
+        self._bump_role_name(role_name, 1)
+        self._bump_total('users', 1)
+
+    def user_removed(self, user_id: int, role_id: int):
+        """
+        Resta un usuario que se va a eliminar y borra sus contadores
+        """
+        self._bump('rollup_role_users', 'role_id', {role_id: -1})
+        self._bump_total('users', -1)
+        self.db.execute_query("DELETE FROM user_counters WHERE user_id = %s", (user_id,))
+
+    def user_role_changed(self, old_role_id: int, new_role_name: str):
+        """
+        Mueve un usuario de un rol a otro
+        """
+        self._bump('rollup_role_users', 'role_id', {old_role_id: -1})
+        self._bump_role_name(new_role_name, 1)
+
+    # Lectura
+
+    def get_totals(self) -> Dict[str, int]:
+        """
+        Retorna el total de usuarios, búsquedas y Pokémon en equipos
+        """
+        rows = self.db.fetch_all("SELECT name, total FROM rollup_totals")
+        return {row['name']: row['total'] for row in rows}
+
+    def get_users_by_role(self) -> Dict[str, int]:
+        """
+        Retorna el número de usuarios de cada rol
+        """
+        rows = self.db.fetch_all("""
+            SELECT r.name, rr.total
+            FROM rollup_role_users rr
+            JOIN roles r ON r.id = rr.role_id
+            WHERE rr.total > 0
+        """)
+        return {row['name']: row['total'] for row in rows}
+
+    def get_daily_searches(self, days: int = 7) -> List[Dict]:
+        """
+        Retorna las búsquedas por día de los últimos días
+        """
+        return self.db.fetch_all("""
+            SELECT day as date, total
+            FROM rollup_daily_searches
+            WHERE day >= DATE_SUB(CURDATE(), INTERVAL %s DAY) AND total > 0
+            ORDER BY day
+        """, (days,))
+
+    def get_popular_pokemon(self, limit: int = 5) -> List[Dict]:
+        """
+        Retorna las especies más repetidas en los equipos
+        """
+        return self.db.fetch_all("""
+            SELECT ps.name as pokemon_name, rs.total
+            FROM rollup_species_team rs
+            JOIN pokemon_species ps ON ps.id = rs.species_id
+            WHERE rs.total > 0
+            ORDER BY rs.total DESC
+            LIMIT %s
+        """, (limit,))
+
+    def get_popular_regions(self, limit: int = 5) -> List[Dict]:
+        """
+        Retorna las regiones con más entrenadores
+        """
+        return self.db.fetch_all("""
+            SELECT region, total
+            FROM rollup_region_trainers
+            WHERE total > 0
+            ORDER BY total DESC
+            LIMIT %s
+        """, (limit,))
+
+    def get_user_counters(self, user_id: int, trainer_id: int = None) -> Dict:
+        """
+        Retorna las búsquedas, Pokémon y última búsqueda del usuario. Con
+        trainer_id, los cambios en su equipo también invalidan la caché.
+        """
+        tags = [f"user:{user_id}"]
+        if trainer_id:
+            tags.append(f"trainer:{trainer_id}")
+        counters = self.db.fetch_one_cached("""
+            SELECT total_searches, total_pokemon, last_search_at
+            FROM user_counters
+            WHERE user_id = %s
+        """, (user_id,), tags)
+        return counters or {'total_searches': 0, 'total_pokemon': 0, 'last_search_at': None}
+
+    def reconcile_user_counters(self) -> int:
+        """
+        Compara los contadores por usuario con los datos reales, corrige
+        los que se hayan desajustado y retorna cuántos había
+        """
+        try:
+            with self.db.transaction():
+                drift = self.db.fetch_one(f"""
+                    SELECT COUNT(*) as total
+                    FROM ({USER_COUNTERS_SOURCE}) expected
+                    LEFT JOIN user_counters uc ON uc.user_id = expected.user_id
+                    WHERE uc.user_id IS NULL
+                       OR uc.total_searches != expected.total_searches
+                       OR uc.total_pokemon != expected.total_pokemon
+                       OR NOT (uc.last_search_at <=> expected.last_search_at)
+                """)
+                self.db.execute_query(f"""
+                    INSERT INTO user_counters (user_id, total_searches, total_pokemon, last_search_at)
+                    SELECT expected.user_id, expected.total_searches,
+                           expected.total_pokemon, expected.last_search_at
+                    FROM ({USER_COUNTERS_SOURCE}) expected
+                    ON DUPLICATE KEY UPDATE
+                        total_searches = VALUES(total_searches),
+                        total_pokemon = VALUES(total_pokemon),
+                        last_search_at = VALUES(last_search_at)
+                """)
+            # Cualquier usuario pudo cambiar: se descarta toda la caché
+            query_cache.clear()
+            return drift['total'] if drift else 0
+        except Exception as e:
+            print(f"Error reconciling user counters: {str(e)}")
+            return -1
+
+    def rebuild(self) -> bool:
+        """
+        Recalcula todas las tablas resumen desde los datos originales
+        """
+        try:
+            with self.db.transaction():
+                for table, query in REBUILD_QUERIES:
+                    self.db.execute_query(f"DELETE FROM {table}")
+                    self.db.execute_query(query)
+            return True
+        except Exception as e:
+            print(f"Error rebuilding rollups: {str(e)}")
+            return False
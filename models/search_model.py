@@ -1,27 +1,50 @@
 # Modelo de Busqueda
 # models/search_model.py
 from config.database import DatabaseConnection
-from typing import List, Dict
+from models.activity_model import ActivityModel
+from models.rollup_model import RollupModel
+from datetime import datetime
+from typing import List, Dict, Tuple
 
 class SearchModel:
     def __init__(self):
         self.db = DatabaseConnection()
+        self.rollups = RollupModel()
+        self.activity = ActivityModel()
 
     def add_search(self, user_id: int, search_term: str) -> bool:
         """
         Registra una nueva búsqueda en el historial
         """
+        return self.add_searches([(user_id, search_term, datetime.now())])
+
+    def add_searches(self, searches: List[Tuple[int, str, datetime]]) -> bool:
+        """
+        Registra varias búsquedas (usuario, término, fecha) en un solo INSERT
+        """
         try:
-            query = """
-                INSERT INTO search_history (user_id, search_term)
-                VALUES (%s, %s)
-            """
-            self.db.execute_query(query, (user_id, search_term))
+            self.insert_searches(searches)
             return True
         except Exception as e:
-            print(f"Error al registrar búsqueda: {str(e)}")
+            print(f"Error al registrar búsquedas: {str(e)}")
             return False
 
+    def insert_searches(self, searches: List[Tuple[int, str, datetime]]):
+        """
+        Como add_searches, pero propaga el error de la base de datos para
+        que el llamador distinga los fallos transitorios de las filas que
+        nunca se podrán escribir
+        """
+        query = """
+            INSERT INTO search_history (user_id, search_term, search_date)
+            VALUES (%s, %s, %s)
+        """
+        with self.db.transaction():
+            self.db.execute_many(query, searches)
+            self.rollups.searches_added(searches)
+            self.activity.record_searches(searches)
+            self.db.invalidate(*{f"user:{user_id}" for user_id, _, _ in searches})
+
     def get_user_searches(self, user_id: int, limit: int = 10) -> List[Dict]:
         """
         Obtiene las búsquedas recientes de un usuario
@@ -30,7 +53,7 @@ class SearchModel:
             SELECT search_term, search_date
             FROM search_history
             WHERE user_id = %s
-            ORDER BY search_date DESC
+            ORDER BY search_date DESC, id DESC
             LIMIT %s
         """
         return self.db.fetch_all(query, (user_id, limit))
@@ -1,65 +1,47 @@
 # Modelo de Equipo
 # models/team_model.py
 from config.database import DatabaseConnection
+from models.activity_model import ActivityModel
+from models.pokemon_species_model import PokemonSpeciesModel, TEAM_POKEMON_SELECT
+from models.rollup_model import RollupModel
 from typing import List, Dict, Optional
 
 class TeamModel:
     def __init__(self):
         self.db = DatabaseConnection()
+        self.species_model = PokemonSpeciesModel()
+        self.rollups = RollupModel()
+        self.activity = ActivityModel()
 
     def get_trainer_pokemon(self, trainer_id: int) -> List[Dict]:
         """
         Obtiene todos los Pokémon del entrenador
         """
-        query = """
-            SELECT *
-            FROM team_pokemon
-            WHERE trainer_id = %s
-            ORDER BY joined_at DESC
+        query = TEAM_POKEMON_SELECT + """
+            WHERE tp.trainer_id = %s
+            ORDER BY tp.joined_at DESC
         """
-        return self.db.fetch_all(query, (trainer_id,))
+        return self.species_model.attach_types_and_moves(
+            self.db.fetch_all_cached(query, (trainer_id,), [f"trainer:{trainer_id}"])
+        )
 
     def add_pokemon(self, trainer_id: int, pokemon_data: Dict, nickname: str = None) -> bool:
         """
         Añade un nuevo Pokémon al equipo
         """
         try:
-            query = """
-                INSERT INTO team_pokemon (
-                    trainer_id, pokemon_id, nickname, pokemon_name,
-                    pokemon_type, height, weight, base_experience,
-                    sprite_url, stats_hp, stats_attack, stats_defense,
-                    stats_sp_attack, stats_sp_defense, stats_speed, moves
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-            """
-            
-            # Preparar los tipos de Pokémon como string
-            pokemon_types = ','.join(pokemon_data['types'])
-            # Preparar los movimientos como string
-            moves = ','.join(pokemon_data['moves'])
-            
-            params = (
-                trainer_id,
-                pokemon_data['id'],
-                nickname,
-                pokemon_data['name'],
-                pokemon_types,
-                pokemon_data['height'],
-                pokemon_data['weight'],
-                pokemon_data.get('base_experience', 0),
-                pokemon_data['sprites']['front_default'],
-                pokemon_data['stats']['hp'],
-                pokemon_data['stats']['attack'],
-                pokemon_data['stats']['defense'],
-                pokemon_data['stats']['sp_attack'],
-                pokemon_data['stats']['sp_defense'],
-                pokemon_data['stats']['speed'],
-                moves
-            )
-            
-            self.db.execute_query(query, params)
+            with self.db.transaction():
+                # Guardar (o refrescar) la especie en el catálogo compartido
+                self.species_model.save_species(pokemon_data)
+
+                query = """
+                    INSERT INTO team_pokemon (trainer_id, pokemon_id, nickname)
+                    VALUES (%s, %s, %s)
+                """
+                self.db.execute_query(query, (trainer_id, pokemon_data['id'], nickname))
+                self.rollups.pokemon_added(trainer_id, pokemon_data['id'])
+                self.activity.record_team_addition(trainer_id, pokemon_data['name'], nickname)
+                self.db.invalidate(f"trainer:{trainer_id}")
             return True
         except Exception as e:
             print(f"Error adding pokemon to team: {e}")
@@ -74,7 +56,15 @@ class TeamModel:
                 DELETE FROM team_pokemon
                 WHERE id = %s AND trainer_id = %s
             """
-            self.db.execute_query(query, (pokemon_id, trainer_id))
+            with self.db.transaction():
+                pokemon = self.db.fetch_one(
+                    "SELECT pokemon_id FROM team_pokemon WHERE id = %s AND trainer_id = %s FOR UPDATE",
+                    (pokemon_id, trainer_id)
+                )
+                self.db.execute_query(query, (pokemon_id, trainer_id))
+                if pokemon:
+                    self.rollups.pokemon_removed(trainer_id, pokemon['pokemon_id'])
+                self.db.invalidate(f"trainer:{trainer_id}")
             return True
         except Exception as e:
             print(f"Error removing pokemon from team: {e}")
@@ -91,6 +81,7 @@ class TeamModel:
                 WHERE id = %s AND trainer_id = %s
             """
             self.db.execute_query(query, (nickname, pokemon_id, trainer_id))
+            self.db.invalidate(f"trainer:{trainer_id}")
             return True
         except Exception as e:
             print(f"Error updating pokemon nickname: {e}")
@@ -105,16 +96,23 @@ class TeamModel:
             FROM team_pokemon
             WHERE trainer_id = %s
         """
-        result = self.db.fetch_one(query, (trainer_id,))
+        result = self.db.fetch_one_cached(query, (trainer_id,), [f"trainer:{trainer_id}"])
         return result['count'] if result else 0
 
     def get_pokemon_by_id(self, pokemon_id: int, trainer_id: int) -> Optional[Dict]:
         """
         Obtiene un Pokémon específico del equipo
         """
-        query = """
-            SELECT *
-            FROM team_pokemon
-            WHERE id = %s AND trainer_id = %s
+        query = TEAM_POKEMON_SELECT + """
+            WHERE tp.id = %s AND tp.trainer_id = %s
+        """
+        pokemon = self.db.fetch_one_cached(query, (pokemon_id, trainer_id), [f"trainer:{trainer_id}"])
+        if pokemon:
+            self.species_model.attach_types_and_moves([pokemon])
+        return pokemon
+
+    def get_type_distribution(self, trainer_id: int) -> Dict[str, int]:
+        """
+        Obtiene cuántos Pokémon del equipo hay de cada tipo
         """
-        return self.db.fetch_one(query, (pokemon_id, trainer_id))
\ No newline at end of file
+        return self.species_model.get_type_distribution(trainer_id)
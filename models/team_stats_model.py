@@ -0,0 +1,149 @@
+# Modelo de estadísticas de equipos
+# models/team_stats_model.py
+from config.database import DatabaseConnection
+from models.pokemon_species_model import PokemonSpeciesModel
+from typing import Dict
+
+STAT_NAMES = ('hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed')
+
+_TOTAL_STATS = ' + '.join(f"ps.stats_{stat}" for stat in STAT_NAMES)
+
+# Valor de la estadística indicada en s.stat ('total' es la suma de todas)
+_STAT_VALUE = (
+    "CASE s.stat "
+    + ' '.join(f"WHEN '{stat}' THEN ps.stats_{stat}" for stat in STAT_NAMES)
+    + f" ELSE {_TOTAL_STATS} END"
+)
+
+_STAT_ROWS = ' UNION ALL '.join(f"SELECT '{stat}' as stat" for stat in STAT_NAMES + ('total',))
+
+# Medias, experiencia total y número de Pokémon de cada equipo
+AGGREGATES_QUERY = f"""
+    SELECT tp.trainer_id, COUNT(*) as total_pokemon,
+           {', '.join(f"AVG(ps.stats_{stat}) as avg_{stat}" for stat in STAT_NAMES)},
+           COALESCE(SUM(ps.base_experience), 0) as total_base_experience
+    FROM team_pokemon tp
+    JOIN pokemon_species ps ON ps.id = tp.pokemon_id
+    {{where}}
+    GROUP BY tp.trainer_id
+"""
+
+# Pokémon con el valor más alto de cada estadística en cada equipo; en
+# caso de empate gana el más reciente
+TOP_STATS_QUERY = f"""
+    SELECT trainer_id, stat, value, pokemon_name, nickname
+    FROM (
+        SELECT tp.trainer_id, s.stat, ps.name as pokemon_name, tp.nickname,
+               {_STAT_VALUE} as value,
+               ROW_NUMBER() OVER (
+                   PARTITION BY tp.trainer_id, s.stat
+                   ORDER BY {_STAT_VALUE} DESC, tp.joined_at DESC, tp.id DESC
+               ) as position
+        FROM team_pokemon tp
+        JOIN pokemon_species ps ON ps.id = tp.pokemon_id
+        CROSS JOIN ({_STAT_ROWS}) s
+        {{where}}
+    ) ranked
+    WHERE position = 1
+"""
+
+class TeamStatsModel:
+    """
+    Estadísticas de los equipos calculadas en la base de datos: solo se
+    transfieren unas pocas filas por equipo, no los Pokémon completos
+    """
+    def __init__(self):
+        self.db = DatabaseConnection()
+        self.species_model = PokemonSpeciesModel()
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {
+            'total_pokemon': 0,
+            'average_stats': {stat: 0 for stat in STAT_NAMES},
+            'max_stats': {stat: None for stat in STAT_NAMES},
+            'strongest_pokemon': None,
+            'total_base_experience': 0,
+            'types': {}
+        }
+
+    @staticmethod
+    def _apply_aggregates(stats: Dict, row: Dict):
+        stats['total_pokemon'] = row['total_pokemon']
+        stats['total_base_experience'] = int(row['total_base_experience'])
+        stats['average_stats'] = {
+            stat: round(float(row[f'avg_{stat}'] or 0), 2) for stat in STAT_NAMES
+        }
+
+    @staticmethod
+    def _apply_top_stat(stats: Dict, row: Dict):
+        if row['stat'] == 'total':
+            stats['strongest_pokemon'] = {
+                'name': row['pokemon_name'],
+                'nickname': row['nickname'],
+                'total_stats': row['value']
+            }
+        else:
+            stats['max_stats'][row['stat']] = {
+                'name': row['pokemon_name'],
+                'nickname': row['nickname'],
+                'value': row['value']
+            }
+
+    def get_team_stats(self, trainer_id: int) -> Dict:
+        """
+        Obtiene las medias, el Pokémon con el valor más alto de cada
+        estadística, el más fuerte (suma de estadísticas), el más reciente,
+        la experiencia base total y los tipos del equipo del entrenador
+        """
+        stats = self._empty_stats()
+        stats['newest_pokemon'] = None
+        tags = [f"trainer:{trainer_id}"]
+        where = "WHERE tp.trainer_id = %s"
+
+        aggregates = self.db.fetch_one_cached(
+            AGGREGATES_QUERY.format(where=where), (trainer_id,), tags
+        )
+        if not aggregates:
+            return stats
+        self._apply_aggregates(stats, aggregates)
+
+        for row in self.db.fetch_all_cached(TOP_STATS_QUERY.format(where=where), (trainer_id,), tags):
+            self._apply_top_stat(stats, row)
+
+        newest = self.db.fetch_one_cached("""
+            SELECT ps.name, tp.nickname, tp.joined_at
+            FROM team_pokemon tp
+            JOIN pokemon_species ps ON ps.id = tp.pokemon_id
+            WHERE tp.trainer_id = %s
+            ORDER BY tp.joined_at DESC, tp.id DESC
+            LIMIT 1
+        """, (trainer_id,), tags)
+        stats['newest_pokemon'] = newest
+
+        stats['types'] = self.species_model.get_type_distribution(trainer_id)
+        return stats
+
+    def get_all_team_stats(self) -> Dict[int, Dict]:
+        """
+        Obtiene las mismas estadísticas (salvo el Pokémon más reciente)
+        para todos los equipos a la vez, indexadas por entrenador
+        """
+        teams = {}
+        for row in self.db.fetch_all(AGGREGATES_QUERY.format(where='')):
+            stats = teams[row['trainer_id']] = self._empty_stats()
+            self._apply_aggregates(stats, row)
+
+        for row in self.db.fetch_all(TOP_STATS_QUERY.format(where='')):
+            self._apply_top_stat(teams[row['trainer_id']], row)
+
+        type_rows = self.db.fetch_all("""
+            SELECT tp.trainer_id, pst.type_name, COUNT(*) as total
+            FROM team_pokemon tp
+            JOIN pokemon_species_types pst ON pst.species_id = tp.pokemon_id
+            GROUP BY tp.trainer_id, pst.type_name
+            ORDER BY tp.trainer_id, total DESC, pst.type_name
+        """)
+        for row in type_rows:
+            teams[row['trainer_id']]['types'][row['type_name']] = row['total']
+        return teams
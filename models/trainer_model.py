@@ -1,11 +1,15 @@
 # Modelo de Entrenador
 # models/trainer_model.py
 from config.database import DatabaseConnection
+from models.rollup_model import RollupModel
+from models.team_stats_model import TeamStatsModel
 from typing import List, Dict, Optional, Tuple
 
 class TrainerModel:
     def __init__(self):
         self.db = DatabaseConnection()
+        self.rollups = RollupModel()
+        self.team_stats = TeamStatsModel()
 
     def create_trainer(self, user_id: int, name: str, age: int = None, region: str = None) -> Tuple[bool, str]:
         """
@@ -22,7 +26,10 @@ class TrainerModel:
                 INSERT INTO trainers (user_id, name, age, region)
                 VALUES (%s, %s, %s, %s)
             """
-            self.db.execute_query(query, (user_id, name, age, region))
+            with self.db.transaction():
+                self.db.execute_query(query, (user_id, name, age, region))
+                self.rollups.trainer_region_changed(None, region)
+                self.db.invalidate(f"user:{user_id}")
             return True, "Entrenador creado exitosamente"
 
         except Exception as e:
@@ -39,7 +46,10 @@ class TrainerModel:
             FROM trainers t
             WHERE t.user_id = %s
         """
-        return self.db.fetch_one(query, (user_id,))
+        return self.db.fetch_one_cached(
+            query, (user_id,),
+            lambda trainer: [f"user:{user_id}"] + ([f"trainer:{trainer['id']}"] if trainer else [])
+        )
 
     def get_trainer_by_id(self, trainer_id: int) -> Optional[Dict]:
         """
@@ -53,7 +63,7 @@ class TrainerModel:
             JOIN users u ON t.user_id = u.id
             WHERE t.id = %s
         """
-        return self.db.fetch_one(query, (trainer_id,))
+        return self.db.fetch_one_cached(query, (trainer_id,), [f"trainer:{trainer_id}"])
 
     def update_trainer(self, trainer_id: int, data: Dict) -> Tuple[bool, str]:
         """
@@ -82,8 +92,16 @@ class TrainerModel:
                 SET {', '.join(updates)}
                 WHERE id = %s
             """
-            
-            self.db.execute_query(query, tuple(params))
+
+            with self.db.transaction():
+                trainer = self.db.fetch_one(
+                    "SELECT region FROM trainers WHERE id = %s FOR UPDATE",
+                    (trainer_id,)
+                )
+                self.db.execute_query(query, tuple(params))
+                if trainer and 'region' in data:
+                    self.rollups.trainer_region_changed(trainer['region'], data['region'])
+                self.db.invalidate(f"trainer:{trainer_id}")
             return True, "Entrenador actualizado exitosamente"
 
         except Exception as e:
@@ -95,28 +113,31 @@ class TrainerModel:
         Elimina un entrenador y sus pokémon
         """
         try:
-            # Iniciar transacción
-            self.db.execute_query("START TRANSACTION")
-
-            # Eliminar pokémon del entrenador
-            self.db.execute_query(
-                "DELETE FROM team_pokemon WHERE trainer_id = %s",
-                (trainer_id,)
-            )
-
-            # Eliminar entrenador
-            self.db.execute_query(
-                "DELETE FROM trainers WHERE id = %s",
-                (trainer_id,)
-            )
-
-            # Confirmar transacción
-            self.db.execute_query("COMMIT")
+            # Todo se confirma junto al salir del bloque o se revierte si falla
+            with self.db.transaction():
+                trainer = self.db.fetch_one(
+                    "SELECT region FROM trainers WHERE id = %s FOR UPDATE",
+                    (trainer_id,)
+                )
+                if trainer:
+                    self.rollups.trainer_team_removed(trainer_id)
+                    self.rollups.trainer_region_changed(trainer['region'], None)
+
+                # Eliminar pokémon del entrenador
+                self.db.execute_query(
+                    "DELETE FROM team_pokemon WHERE trainer_id = %s",
+                    (trainer_id,)
+                )
+
+                # Eliminar entrenador
+                self.db.execute_query(
+                    "DELETE FROM trainers WHERE id = %s",
+                    (trainer_id,)
+                )
+                self.db.invalidate(f"trainer:{trainer_id}")
             return True, "Entrenador eliminado exitosamente"
 
         except Exception as e:
-            # Revertir en caso de error
-            self.db.execute_query("ROLLBACK")
             print(f"Error deleting trainer: {str(e)}")
             return False, "Error al eliminar el entrenador"
 
@@ -125,91 +146,20 @@ class TrainerModel:
         Obtiene estadísticas detalladas del entrenador
         """
         try:
-            stats = {
-                'total_pokemon': 0,
-                'favorite_types': [],
-                'strongest_pokemon': None,
-                'newest_pokemon': None,
-                'pokemon_by_type': {},
-                'total_base_experience': 0,
-                'avg_pokemon_stats': {
-                    'hp': 0, 'attack': 0, 'defense': 0,
-                    'sp_attack': 0, 'sp_defense': 0, 'speed': 0
-                }
-            }
-
-            # Obtener pokémon del entrenador
-            pokemon_query = """
-                SELECT *
-                FROM team_pokemon
-                WHERE trainer_id = %s
-                ORDER BY joined_at DESC
-            """
-            pokemon_list = self.db.fetch_all(pokemon_query, (trainer_id,))
-
-            if not pokemon_list:
-                return stats
-
-            stats['total_pokemon'] = len(pokemon_list)
-            total_stats = {stat: 0 for stat in stats['avg_pokemon_stats'].keys()}
-            max_total_stats = 0
-            type_count = {}
-
-            for pokemon in pokemon_list:
-                # Contar tipos
-                types = pokemon['pokemon_type'].split(',')
-                for type_name in types:
-                    type_count[type_name] = type_count.get(type_name, 0) + 1
-
-                # Sumar estadísticas
-                total_stats['hp'] += pokemon['stats_hp']
-                total_stats['attack'] += pokemon['stats_attack']
-                total_stats['defense'] += pokemon['stats_defense']
-                total_stats['sp_attack'] += pokemon['stats_sp_attack']
-                total_stats['sp_defense'] += pokemon['stats_sp_defense']
-                total_stats['speed'] += pokemon['stats_speed']
-
-                # Calcular pokémon más fuerte
-                total_pokemon_stats = (
-                    pokemon['stats_hp'] + pokemon['stats_attack'] + 
-                    pokemon['stats_defense'] + pokemon['stats_sp_attack'] + 
-                    pokemon['stats_sp_defense'] + pokemon['stats_speed']
-                )
-                if total_pokemon_stats > max_total_stats:
-                    max_total_stats = total_pokemon_stats
-                    stats['strongest_pokemon'] = {
-                        'name': pokemon['pokemon_name'],
-                        'nickname': pokemon['nickname'],
-                        'total_stats': total_pokemon_stats
-                    }
-
-                stats['total_base_experience'] += pokemon['base_experience']
-
-            # Calcular promedios
-            for stat in total_stats:
-                stats['avg_pokemon_stats'][stat] = round(
-                    total_stats[stat] / len(pokemon_list), 2
-                )
-
-            # Obtener tipos favoritos (top 3)
-            stats['favorite_types'] = sorted(
-                type_count.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:3]
-
-            # Pokémon más reciente
-            stats['newest_pokemon'] = {
-                'name': pokemon_list[0]['pokemon_name'],
-                'nickname': pokemon_list[0]['nickname'],
-                'joined_at': pokemon_list[0]['joined_at']
+            # Medias, máximos y tipos se calculan en la base de datos
+            team_stats = self.team_stats.get_team_stats(trainer_id)
+
+            return {
+                'total_pokemon': team_stats['total_pokemon'],
+                # La distribución ya viene ordenada por número de Pokémon
+                'favorite_types': list(team_stats['types'].items())[:3],
+                'strongest_pokemon': team_stats['strongest_pokemon'],
+                'newest_pokemon': team_stats['newest_pokemon'],
+                'pokemon_by_type': team_stats['types'],
+                'total_base_experience': team_stats['total_base_experience'],
+                'avg_pokemon_stats': team_stats['average_stats']
             }
 
-            # Distribución por tipo
-            stats['pokemon_by_type'] = type_count
-
-            return stats
-
         except Exception as e:
             print(f"Error getting trainer stats: {str(e)}")
             return {}
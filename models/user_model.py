@@ -1,5 +1,6 @@
 # models/user_model.py
-from config.database import DatabaseConnection
+from config.database import DatabaseConnection, transactional
+from models.rollup_model import RollupModel
 from services.encryption_service import EncryptionService
 from typing import Optional, Dict, Tuple
 
@@ -7,6 +8,7 @@ class UserModel:
     def __init__(self):
         self.db = DatabaseConnection()
         self.encryption = EncryptionService()
+        self.rollups = RollupModel()
 
     def create_user(self, username: str, password: str, email: str) -> bool:
         """
@@ -18,7 +20,9 @@ class UserModel:
                 INSERT INTO users (username, password, email, role_id)
                 VALUES (%s, %s, %s, (SELECT id FROM roles WHERE name = 'user'))
             """
-            self.db.execute_query(query, (username, hashed_password, email))
+            with self.db.transaction():
+                self.db.execute_query(query, (username, hashed_password, email))
+                self.rollups.user_added('user')
             return True
         except Exception as e:
             print(f"Error creating user: {str(e)}")
@@ -65,13 +69,21 @@ class UserModel:
         """
         query = """
             SELECT u.username, u.email, u.created_at,
-                   t.name as trainer_name, t.age as trainer_age, 
-                   t.region as trainer_region
+                   t.id as trainer_id, t.name as trainer_name,
+                   t.age as trainer_age, t.region as trainer_region
             FROM users u
             LEFT JOIN trainers t ON u.id = t.user_id
             WHERE u.id = %s
         """
-        return self.db.fetch_one(query, (user_id,))
+        return self.db.fetch_one_cached(query, (user_id,), lambda profile: self._cache_tags(user_id, profile))
+
+    @staticmethod
+    def _cache_tags(user_id: int, row: Optional[Dict]):
+        # Los datos del usuario dependen también de su entrenador
+        tags = [f"user:{user_id}"]
+        if row and row['trainer_id']:
+            tags.append(f"trainer:{row['trainer_id']}")
+        return tags
 
     def update_user_profile(self, user_id: int, data: Dict) -> Tuple[bool, str]:
         """
@@ -84,82 +96,83 @@ class UserModel:
                 if self.db.fetch_one(check_query, (data['email'], user_id)):
                     return False, "El email ya está en uso"
 
-            # Actualizar usuario
-            user_updates = []
-            user_params = []
-            if 'email' in data:
-                user_updates.append("email = %s")
-                user_params.append(data['email'])
-            
-            if 'password' in data and data['password']:
-                user_updates.append("password = %s")
-                user_params.append(self.encryption.hash_password(data['password']))
-
-            if user_updates:
-                user_params.append(user_id)
-                user_query = f"""
-                    UPDATE users 
-                    SET {', '.join(user_updates)}
-                    WHERE id = %s
-                """
-                self.db.execute_query(user_query, tuple(user_params))
-
-            # Actualizar entrenador
-            trainer_exists = self.db.fetch_one(
-                "SELECT id FROM trainers WHERE user_id = %s", 
-                (user_id,)
-            )
-
-            trainer_data = {
-                'name': data.get('trainer_name'),
-                'age': data.get('trainer_age'),
-                'region': data.get('trainer_region')
-            }
-
-            if any(v is not None for v in trainer_data.values()):
-                if trainer_exists:
-                    # Actualizar entrenador existente
-                    trainer_updates = [
-                        f"{k} = %s" for k, v in trainer_data.items() 
-                        if v is not None
-                    ]
-                    trainer_params = [
-                        v for v in trainer_data.values() 
-                        if v is not None
-                    ]
-                    trainer_params.append(user_id)
-
-                    trainer_query = f"""
-                        UPDATE trainers 
-                        SET {', '.join(trainer_updates)}
-                        WHERE user_id = %s
-                    """
-                else:
-                    # Crear nuevo entrenador
-                    trainer_fields = [
-                        k for k, v in trainer_data.items() 
-                        if v is not None
-                    ]
-                    trainer_values = [
-                        v for v in trainer_data.values() 
-                        if v is not None
-                    ]
-                    trainer_values.append(user_id)
-
-                    trainer_query = f"""
-                        INSERT INTO trainers 
-                        (user_id, {', '.join(trainer_fields)})
-                        VALUES (%s, {', '.join(['%s'] * len(trainer_fields))})
-                    """
-
-                self.db.execute_query(trainer_query, tuple(trainer_params))
-
+            self._apply_profile_updates(user_id, data)
             return True, "Perfil actualizado exitosamente"
 
         except Exception as e:
             print(f"Error updating profile: {str(e)}")
             return False, "Error al actualizar el perfil"
 
+    @transactional
+    def _apply_profile_updates(self, user_id: int, data: Dict):
+        """
+        Aplica en una sola transacción los cambios de usuario y entrenador
+        """
+        # Descarta el perfil y las estadísticas en caché (se repite al confirmar)
+        self.db.invalidate(f"user:{user_id}")
+
+        # Actualizar usuario
+        user_updates = []
+        user_params = []
+        if 'email' in data:
+            user_updates.append("email = %s")
+            user_params.append(data['email'])
+
+        if 'password' in data and data['password']:
+            user_updates.append("password = %s")
+            user_params.append(self.encryption.hash_password(data['password']))
+
+        if user_updates:
+            user_params.append(user_id)
+            user_query = f"""
+                UPDATE users 
+                SET {', '.join(user_updates)}
+                WHERE id = %s
+            """
+            self.db.execute_query(user_query, tuple(user_params))
+
+        trainer_data = {
+            'name': data.get('trainer_name'),
+            'age': data.get('trainer_age'),
+            'region': data.get('trainer_region')
+        }
+
+        if not any(v is not None for v in trainer_data.values()):
+            return
+
+        # Actualizar entrenador
+        trainer_exists = self.db.fetch_one(
+            "SELECT id, region FROM trainers WHERE user_id = %s FOR UPDATE", 
+            (user_id,)
+        )
+
+        trainer_fields = [k for k, v in trainer_data.items() if v is not None]
+        trainer_values = [v for v in trainer_data.values() if v is not None]
+
+        if trainer_exists:
+            # Actualizar entrenador existente
+            trainer_updates = [f"{k} = %s" for k in trainer_fields]
+            trainer_query = f"""
+                UPDATE trainers 
+                SET {', '.join(trainer_updates)}
+                WHERE user_id = %s
+            """
+            trainer_params = trainer_values + [user_id]
+        else:
+            # Crear nuevo entrenador
+            trainer_query = f"""
+                INSERT INTO trainers 
+                (user_id, {', '.join(trainer_fields)})
+                VALUES (%s, {', '.join(['%s'] * len(trainer_fields))})
+            """
+            trainer_params = [user_id] + trainer_values
+
+        self.db.execute_query(trainer_query, tuple(trainer_params))
+
+        if trainer_data['region'] is not None:
+            old_region = trainer_exists['region'] if trainer_exists else None
+            self.rollups.trainer_region_changed(old_region, trainer_data['region'])
+
     def change_password(self, user_id: int, current_password: str, 
                        new_password: str) -> Tuple[bool, str]:
         """
@@ -204,36 +217,25 @@ class UserModel:
 
             # Obtener fecha de registro
             user_query = """
-                SELECT created_at 
-                FROM users 
-                WHERE id = %s
+                SELECT u.created_at, t.id as trainer_id
+                FROM users u
+                LEFT JOIN trainers t ON t.user_id = u.id
+                WHERE u.id = %s
             """
-            user_data = self.db.fetch_one(user_query, (user_id,))
+            user_data = self.db.fetch_one_cached(
+                user_query, (user_id,), lambda row: self._cache_tags(user_id, row)
+            )
+            trainer_id = None
             if user_data:
                 stats['join_date'] = user_data['created_at']
-
-            # Obtener total de búsquedas y última búsqueda
-            search_query = """
-                SELECT COUNT(*) as total,
-                       MAX(search_date) as last_search
-                FROM search_history
-                WHERE user_id = %s
-            """
-            search_data = self.db.fetch_one(search_query, (user_id,))
-            if search_data:
-                stats['total_searches'] = search_data['total']
-                stats['last_search'] = search_data['last_search']
-
-            # Obtener total de pokémon en el equipo
-            pokemon_query = """
-                SELECT COUNT(*) as total
-                FROM team_pokemon tp
-                JOIN trainers t ON tp.trainer_id = t.id
-                WHERE t.user_id = %s
-            """
-            pokemon_data = self.db.fetch_one(pokemon_query, (user_id,))
-            if pokemon_data:
-                stats['total_pokemon'] = pokemon_data['total']
+                trainer_id = user_data['trainer_id']
+
+            # Búsquedas, última búsqueda y pokémon del equipo salen de los
+            # contadores que se mantienen al escribir
+            counters = self.rollups.get_user_counters(user_id, trainer_id)
+            stats['total_searches'] = counters['total_searches']
+            stats['total_pokemon'] = counters['total_pokemon']
+            stats['last_search'] = counters['last_search_at']
 
             return stats
 
@@ -1,95 +1,245 @@
 # services/api_service.py
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
+from config.config_handler import config
 from services.logging_service import logger
+from services.cache_service import response_cache
+from services.memory_cache import pokemon_cache, summary_cache
+from services.name_index import name_index
+from services.catalog_service import catalog
+from services.single_flight import request_group
+from services.resilience import RETRY_STATUS_CODES, api_breaker, api_retry_policy
 
 class PokeAPIService:
+    _executor = None
+    _executor_lock = threading.Lock()
+    _index_lock = threading.Lock()
+    _index_refreshing = False
+
     def __init__(self):
-        self.base_url = "https://pokeapi.co/api/v2"
+        self.base_url = config.api['base_url'].rstrip('/')
+        self.max_workers = config.api['max_workers']
+        self.sync_workers = config.api['sync_workers']
+        # (conexión, lectura) en segundos
+        self.timeout = (config.api['connect_timeout'], config.api['timeout'])
+        self.retry_policy = api_retry_policy
+        self.breaker = api_breaker
         self.session = requests.Session()
+        # Un pool de conexiones por trabajador para no serializar las peticiones
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.cache = response_cache
+        self.catalog = catalog
+
+    @property
+    def offline(self) -> bool:
+        """
+        Indica si las consultas se sirven solo desde el catálogo local
+        """
+        return self.catalog.offline and self.catalog.is_loaded
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Retorna el pool de hilos compartido para las consultas en paralelo
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=config.api['max_workers'],
+                    thread_name_prefix='pokeapi'
+                )
+            return cls._executor
+
+    def _fetch_json(self, url: str, endpoint: str) -> Dict:
+        """
+        Obtiene un recurso JSON usando la caché local y revalidando
+        con peticiones condicionales cuando la copia ha expirado
+        """
+        cached = self.cache.lookup(url)
+        if cached and cached['fresh']:
+            return cached['data']
+
+        try:
+            # Las peticiones simultáneas a la misma URL comparten una sola llamada
+            return request_group.do(url, lambda: self._request_json(url, endpoint, cached))
+        except requests.exceptions.RequestException as e:
+            # Si la API no responde se sirve la copia expirada, si existe
+            if cached:
+                logger.log_error(f"Serving stale cache for {url}: {str(e)}")
+                return cached['data']
+            raise
+
+    def _get(self, url: str, headers: Dict = None) -> requests.Response:
+        """
+        Realiza un GET con timeouts, reintentos con backoff exponencial
+        (respetando Retry-After) y circuit breaker
+        """
+        self.breaker.before_call()
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.retry_policy.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+            except requests.exceptions.RequestException:
+                self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self.breaker.record_success()
+                    return response
+                if attempt >= self.retry_policy.max_retries:
+                    self.breaker.record_failure()
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.headers.get('Retry-After'))
+
+            attempt += 1
+            time.sleep(delay)
+
+    def _request_json(self, url: str, endpoint: str, cached: Optional[Dict]) -> Dict:
+        """
+        Realiza la petición HTTP (condicional si hay copia expirada)
+        y actualiza la caché local
+        """
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        start_time = time.time()
+        response = self._get(url, headers=headers)
+
+        logger.log_api_call(
+            endpoint=endpoint,
+            method="GET",
+            status_code=response.status_code,
+            response_time=time.time() - start_time
+        )
+
+        if response.status_code == 304 and cached:
+            self.cache.revalidate(url)
+            return cached['data']
+
+        response.raise_for_status()
+        data = response.json()
+        self.cache.store(
+            url,
+            data,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        return data
+
+    @classmethod
+    def build_pokemon_details(cls, pokemon_data: Dict, species_data: Dict,
+                              evolution_data: Dict) -> Dict:
+        """
+        Construye el registro detallado a partir de las respuestas de la API
+        """
+        return {
+            'id': pokemon_data['id'],
+            'name': pokemon_data['name'].capitalize(),
+            'height': pokemon_data['height'] / 10,  # Convertir a metros
+            'weight': pokemon_data['weight'] / 10,  # Convertir a kilogramos
+            'types': [t['type']['name'] for t in pokemon_data['types']],
+            'stats': {
+                'hp': pokemon_data['stats'][0]['base_stat'],
+                'attack': pokemon_data['stats'][1]['base_stat'],
+                'defense': pokemon_data['stats'][2]['base_stat'],
+                'sp_attack': pokemon_data['stats'][3]['base_stat'],
+                'sp_defense': pokemon_data['stats'][4]['base_stat'],
+                'speed': pokemon_data['stats'][5]['base_stat']
+            },
+            'sprites': {
+                'front_default': pokemon_data['sprites']['front_default'],
+                'back_default': pokemon_data['sprites']['back_default'],
+                'official_artwork': pokemon_data['sprites']['other']['official-artwork']['front_default']
+            },
+            'moves': [move['move']['name'].replace('-', ' ').title() 
+                     for move in pokemon_data['moves'][:4]],  # Limitamos a 4 movimientos
+            'evolution_chain': cls._process_evolution_chain(evolution_data['chain']),
+            'description': cls._get_pokemon_description(species_data),
+            'base_experience': pokemon_data.get('base_experience', 0)
+        }
+
+    @staticmethod
+    def build_pokemon_summary(pokemon_data: Dict) -> Dict:
+        """
+        Construye el resumen que muestran las tarjetas de resultados
+        """
+        return {
+            'id': pokemon_data['id'],
+            'name': pokemon_data['name'].capitalize(),
+            'types': [t['type']['name'] for t in pokemon_data['types']],
+            'sprite': pokemon_data['sprites']['front_default']
+        }
+
+    @staticmethod
+    def summarize_details(details: Dict) -> Dict:
+        """
+        Obtiene el resumen a partir de un registro detallado ya procesado
+        """
+        return {
+            'id': details['id'],
+            'name': details['name'],
+            'types': details['types'],
+            'sprite': details['sprites']['front_default']
+        }
 
     def get_pokemon_by_name_or_id(self, identifier: str) -> Optional[Dict]:
         """
         Obtiene información detallada de un Pokémon por nombre o ID
         """
+        # Los registros en memoria se comparten entre vistas: no deben modificarse
+        cached = pokemon_cache.get(str(identifier).strip().lower())
+        if cached is not None:
+            return cached
+
+        if self.offline:
+            processed_data = self.catalog.get(identifier)
+            if processed_data:
+                pokemon_cache.put(
+                    str(processed_data['id']),
+                    processed_data,
+                    aliases=(processed_data['name'].lower(),)
+                )
+            return processed_data
+
         start_time = time.time()
         try:
             # Convertir el identificador a minúsculas si es string
             if isinstance(identifier, str):
-                identifier = identifier.lower()
+                identifier = identifier.strip().lower()
 
             endpoint = f"/pokemon/{identifier}"
-            response = self.session.get(f"{self.base_url}{endpoint}")
-            response_time = time.time() - start_time
-            
-            # Log de la llamada a la API
-            logger.log_api_call(
-                endpoint=endpoint,
-                method="GET",
-                status_code=response.status_code,
-                response_time=response_time
-            )
-
-            response.raise_for_status()
-            pokemon_data = response.json()
+            pokemon_data = self._fetch_json(f"{self.base_url}{endpoint}", endpoint)
 
             # Obtener información de la especie
-            species_start_time = time.time()
-            species_url = pokemon_data['species']['url']
-            species_response = self.session.get(species_url)
-            species_time = time.time() - species_start_time
-
-            logger.log_api_call(
-                endpoint=f"species/{identifier}",
-                method="GET",
-                status_code=species_response.status_code,
-                response_time=species_time
+            species_data = self._fetch_json(
+                pokemon_data['species']['url'],
+                f"species/{identifier}"
             )
 
-            species_data = species_response.json()
-
             # Obtener cadena evolutiva
-            evo_start_time = time.time()
-            evolution_url = species_data['evolution_chain']['url']
-            evolution_response = self.session.get(evolution_url)
-            evo_time = time.time() - evo_start_time
-
-            logger.log_api_call(
-                endpoint=f"evolution-chain/{identifier}",
-                method="GET",
-                status_code=evolution_response.status_code,
-                response_time=evo_time
+            evolution_data = self._fetch_json(
+                species_data['evolution_chain']['url'],
+                f"evolution-chain/{identifier}"
             )
 
-            evolution_data = evolution_response.json()
-
             # Procesar y estructurar la información
-            processed_data = {
-                'id': pokemon_data['id'],
-                'name': pokemon_data['name'].capitalize(),
-                'height': pokemon_data['height'] / 10,  # Convertir a metros
-                'weight': pokemon_data['weight'] / 10,  # Convertir a kilogramos
-                'types': [t['type']['name'] for t in pokemon_data['types']],
-                'stats': {
-                    'hp': pokemon_data['stats'][0]['base_stat'],
-                    'attack': pokemon_data['stats'][1]['base_stat'],
-                    'defense': pokemon_data['stats'][2]['base_stat'],
-                    'sp_attack': pokemon_data['stats'][3]['base_stat'],
-                    'sp_defense': pokemon_data['stats'][4]['base_stat'],
-                    'speed': pokemon_data['stats'][5]['base_stat']
-                },
-                'sprites': {
-                    'front_default': pokemon_data['sprites']['front_default'],
-                    'back_default': pokemon_data['sprites']['back_default'],
-                    'official_artwork': pokemon_data['sprites']['other']['official-artwork']['front_default']
-                },
-                'moves': [move['move']['name'].replace('-', ' ').title() 
-                         for move in pokemon_data['moves'][:4]],  # Limitamos a 4 movimientos
-                'evolution_chain': self._process_evolution_chain(evolution_data['chain']),
-                'description': self._get_pokemon_description(species_data),
-                'base_experience': pokemon_data.get('base_experience', 0)
-            }
+            processed_data = self.build_pokemon_details(pokemon_data, species_data, evolution_data)
 
             logger.log_api_call(
                 endpoint=f"pokemon/{identifier}/complete",
@@ -98,6 +248,11 @@ class PokeAPIService:
                 response_time=time.time() - start_time
             )
 
+            pokemon_cache.put(
+                str(processed_data['id']),
+                processed_data,
+                aliases=(pokemon_data['name'].lower(),)
+            )
             return processed_data
 
         except requests.exceptions.RequestException as e:
@@ -105,7 +260,8 @@ class PokeAPIService:
                 f"Error fetching pokemon {identifier}: {str(e)}",
                 exc_info=True
             )
-            return None
+            # Con la API caída, usar el catálogo local si está disponible
+            return self.catalog.get(identifier) if self.catalog.is_loaded else None
 
     def search_pokemon(self, query: str, limit: int = 10) -> List[Dict]:
         """
@@ -113,38 +269,15 @@ class PokeAPIService:
         """
         start_time = time.time()
         try:
-            # Obtener lista completa de Pokémon
-            endpoint = "/pokemon?limit=1000"
-            response = self.session.get(f"{self.base_url}{endpoint}")
-            response_time = time.time() - start_time
+            # Buscar en el índice local de nombres (sin llamadas a la red)
+            matches = self._get_name_index().search(query, limit)
 
-            logger.log_api_call(
-                endpoint=endpoint,
-                method="GET",
-                status_code=response.status_code,
-                response_time=response_time
-            )
-
-            response.raise_for_status()
-            all_pokemon = response.json()['results']
-
-            # Filtrar por término de búsqueda
-            matches = [
-                pokemon for pokemon in all_pokemon
-                if query.lower() in pokemon['name'].lower()
-            ][:limit]
-
-            # Obtener información detallada de cada coincidencia
-            detailed_matches = []
-            for match in matches:
-                pokemon_data = self.get_pokemon_by_name_or_id(match['name'])
-                if pokemon_data:
-                    detailed_matches.append({
-                        'id': pokemon_data['id'],
-                        'name': pokemon_data['name'],
-                        'types': pokemon_data['types'],
-                        'sprite': pokemon_data['sprites']['front_default']
-                    })
+            # Obtener el resumen de cada coincidencia en paralelo
+            # (map conserva el orden de las coincidencias)
+            detailed_matches = [
+                summary for summary in self._get_executor().map(self._fetch_match, matches)
+                if summary
+            ]
 
             logger.log_api_call(
                 endpoint=f"pokemon/search/{query}",
@@ -162,25 +295,106 @@ class PokeAPIService:
             )
             return []
 
-    def get_pokemon_types(self) -> List[str]:
+    def _get_name_index(self):
         """
-        Obtiene la lista de todos los tipos de Pokémon
+        Retorna el índice de nombres, construyéndolo la primera vez y
+        refrescándolo en segundo plano cuando ha caducado
         """
-        start_time = time.time()
+        if not name_index.is_built:
+            self.refresh_name_index()
+        elif name_index.is_stale(self.cache.ttls['list']):
+            with PokeAPIService._index_lock:
+                start_refresh = not PokeAPIService._index_refreshing
+                PokeAPIService._index_refreshing = True
+            if start_refresh:
+                self._get_executor().submit(self._refresh_name_index_background)
+        return name_index
+
+    def _refresh_name_index_background(self):
         try:
-            endpoint = "/type"
-            response = self.session.get(f"{self.base_url}{endpoint}")
-            response_time = time.time() - start_time
+            self.refresh_name_index()
+        except requests.exceptions.RequestException as e:
+            logger.log_error(f"Error refreshing pokemon name index: {str(e)}", exc_info=True)
+        finally:
+            PokeAPIService._index_refreshing = False
 
-            logger.log_api_call(
-                endpoint=endpoint,
-                method="GET",
-                status_code=response.status_code,
-                response_time=response_time
+    def refresh_name_index(self):
+        """
+        Reconstruye el índice de nombres con la lista completa de Pokémon
+        (especies y formas) guardada en la caché local
+        """
+        if self.offline:
+            name_index.build(self.catalog.names())
+            return
+
+        endpoint = "/pokemon?limit=100000"
+        all_pokemon = self._fetch_json(f"{self.base_url}{endpoint}", endpoint)['results']
+        name_index.build([
+            (int(pokemon['url'].rstrip('/').split('/')[-1]), pokemon['name'])
+            for pokemon in all_pokemon
+        ])
+
+    def get_pokemon_summary(self, identifier: str) -> Optional[Dict]:
+        """
+        Obtiene solo los datos que muestran las tarjetas de resultados.
+        La especie y la cadena evolutiva se piden al abrir el detalle.
+        """
+        key = str(identifier).strip().lower()
+        summary = summary_cache.get(key)
+        if summary is not None:
+            return summary
+
+        try:
+            details = pokemon_cache.get(key)
+            if details is None and self.offline:
+                details = self.catalog.get(key)
+                if details is None:
+                    return None
+            if details is not None:
+                summary = self.summarize_details(details)
+            else:
+                endpoint = f"/pokemon/{key}"
+                pokemon_data = self._fetch_json(f"{self.base_url}{endpoint}", endpoint)
+                summary = self.build_pokemon_summary(pokemon_data)
+
+            summary_cache.put(
+                str(summary['id']),
+                summary,
+                aliases=(summary['name'].lower(),)
             )
+            return summary
 
-            response.raise_for_status()
-            types_data = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.log_error(
+                f"Error fetching pokemon summary {identifier}: {str(e)}",
+                exc_info=True
+            )
+            details = self.catalog.get(key) if self.catalog.is_loaded else None
+            return self.summarize_details(details) if details else None
+
+    def _fetch_match(self, match: Dict) -> Optional[Dict]:
+        """
+        Obtiene el resumen de una coincidencia aislando sus errores
+        """
+        try:
+            return self.get_pokemon_summary(match['name'])
+        except Exception as e:
+            logger.log_error(
+                f"Error fetching search match {match.get('name')}: {str(e)}",
+                exc_info=True
+            )
+            return None
+
+    def get_pokemon_types(self) -> List[str]:
+        """
+        Obtiene la lista de todos los tipos de Pokémon
+        """
+        if self.offline:
+            return list(self.catalog.types)
+
+        try:
+            endpoint = "/type"
+            types_data = self._fetch_json(f"{self.base_url}{endpoint}", endpoint)
             return [type_info['name'] for type_info in types_data['results']]
 
         except requests.exceptions.RequestException as e:
@@ -190,7 +404,8 @@ class PokeAPIService:
             )
             return []
 
-    def _process_evolution_chain(self, chain: Dict) -> List[str]:
+    @staticmethod
+    def _process_evolution_chain(chain: Dict) -> List[str]:
         """
         Procesa la cadena evolutiva de un Pokémon
         """
@@ -211,7 +426,8 @@ class PokeAPIService:
             )
             return []
 
-    def _get_pokemon_description(self, species_data: Dict) -> str:
+    @staticmethod
+    def _get_pokemon_description(species_data: Dict) -> str:
         """
         Obtiene la descripción en español del Pokémon
         """
@@ -227,13 +443,70 @@ class PokeAPIService:
             )
             return "Error al obtener la descripción."
 
-    def download_sprite(self, url: str) -> Optional[bytes]:
+    def sync_catalog(self, progress_callback=None) -> int:
         """
-        Descarga una imagen sprite de un Pokémon
+        Descarga todos los Pokémon (con especie y cadena evolutiva) y
+        los guarda en el snapshot local para el modo sin conexión.
+        Retorna el número de Pokémon guardados.
         """
         start_time = time.time()
+        endpoint = "/pokemon?limit=100000"
+        all_pokemon = self._fetch_json(f"{self.base_url}{endpoint}", endpoint)['results']
+        types = self.get_pokemon_types()
+
+        records = []
+        total = len(all_pokemon)
+        # Pool propio y más pequeño: con el compartido las búsquedas de la
+        # interfaz quedarían en cola detrás de todo el catálogo
+        with ThreadPoolExecutor(max_workers=self.sync_workers, thread_name_prefix='pokeapi-sync') as executor:
+            for done, record in enumerate(executor.map(self._fetch_match_details, all_pokemon), start=1):
+                if record:
+                    records.append(record)
+                if progress_callback:
+                    progress_callback(done, total)
+
+        saved = self.catalog.replace(records, types)
+
+        logger.log_api_call(
+            endpoint="catalog/sync",
+            method="GET",
+            status_code=200,
+            response_time=time.time() - start_time
+        )
+        return saved
+
+    def _fetch_match_details(self, match: Dict) -> Optional[Dict]:
+        """
+        Obtiene el detalle completo de una entrada aislando sus errores
+        """
         try:
-            response = self.session.get(url)
+            return self.get_pokemon_by_name_or_id(match['name'])
+        except Exception as e:
+            logger.log_error(
+                f"Error fetching catalog entry {match.get('name')}: {str(e)}",
+                exc_info=True
+            )
+            return None
+
+    def get_cache_stats(self) -> Dict:
+        """
+        Retorna las estadísticas de las cachés y de las peticiones agrupadas
+        """
+        return {
+            'responses': self.cache.get_stats(),
+            'pokemon': pokemon_cache.get_stats(),
+            'summaries': summary_cache.get_stats(),
+            'requests': request_group.get_stats(),
+            'circuit': self.breaker.get_stats()
+        }
+
+    def download_sprite(self, url: str) -> Optional[bytes]:
+        """
+        Descarga una imagen sprite de un Pokémon
+        """
+        def fetch_sprite() -> bytes:
+            start_time = time.time()
+            response = self._get(url)
             response_time = time.time() - start_time
 
             logger.log_api_call(
@@ -246,6 +519,9 @@ class PokeAPIService:
             response.raise_for_status()
             return response.content
 
+        try:
+            return request_group.do(url, fetch_sprite)
+
         except requests.exceptions.RequestException as e:
             logger.log_error(
                 f"Error downloading sprite from {url}: {str(e)}",
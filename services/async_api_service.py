@@ -0,0 +1,314 @@
+# services/async_api_service.py
+import asyncio
+import aiohttp
+import time
+from typing import Dict, Iterable, List, Optional
+from config.config_handler import config
+from services.logging_service import logger
+from services.cache_service import response_cache
+from services.catalog_service import catalog
+from services.memory_cache import pokemon_cache, summary_cache
+from services.name_index import name_index
+from services.api_service import PokeAPIService
+from services.resilience import RETRY_STATUS_CODES, CircuitOpenError, api_breaker, api_retry_policy
+
+# Errores de red que se registran y se tratan como "sin respuesta"
+NETWORK_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError)
+
+class AsyncPokeAPIService:
+    def __init__(self, max_concurrency: int = None):
+        self.base_url = config.api['base_url'].rstrip('/')
+        self.max_concurrency = max_concurrency or config.api['max_concurrency']
+        self.timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=config.api['connect_timeout'],
+            sock_read=config.api['timeout']
+        )
+        self.retry_policy = api_retry_policy
+        self.breaker = api_breaker
+        self.cache = response_cache
+        self.catalog = catalog
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def offline(self) -> bool:
+        return self.catalog.offline and self.catalog.is_loaded
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # La sesión y el semáforo se crean dentro del event loop que los usa
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        """
+        Cierra la sesión HTTP
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get(self, url: str, headers: Dict = None, read_json: bool = True):
+        """
+        Realiza un GET con reintentos con backoff exponencial (respetando
+        Retry-After) y circuit breaker. Retorna (status, cabeceras, cuerpo).
+        """
+        self.breaker.before_call()
+        session = self._get_session()
+
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    async with session.get(url, headers=headers) as response:
+                        status = response.status
+                        response_headers = response.headers
+                        body = None
+                        if status < 300:
+                            body = await (response.json() if read_json else response.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.retry_policy.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+            except aiohttp.ClientError:
+                self.breaker.record_failure()
+                raise
+            else:
+                if status not in RETRY_STATUS_CODES:
+                    self.breaker.record_success()
+                    return status, response_headers, body
+                if attempt >= self.retry_policy.max_retries:
+                    self.breaker.record_failure()
+                    return status, response_headers, body
+                delay = self.retry_policy.get_delay(attempt, response_headers.get('Retry-After'))
+
+            attempt += 1
+            # La espera se hace fuera del semáforo para no bloquear otras peticiones
+            await asyncio.sleep(delay)
+
+    async def _fetch_json(self, url: str, endpoint: str) -> Dict:
+        """
+        Obtiene un recurso JSON usando la caché local compartida con
+        PokeAPIService y limitando las peticiones simultáneas
+        """
+        cached = self.cache.lookup(url)
+        if cached and cached['fresh']:
+            return cached['data']
+
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            start_time = time.time()
+            status, response_headers, data = await self._get(url, headers=headers)
+            logger.log_api_call(
+                endpoint=endpoint,
+                method="GET",
+                status_code=status,
+                response_time=time.time() - start_time
+            )
+
+            if status == 304 and cached:
+                self.cache.revalidate(url)
+                return cached['data']
+
+            if status >= 400:
+                raise aiohttp.ClientResponseError(
+                    None, (), status=status, message=f"HTTP {status} for {url}"
+                )
+
+        except NETWORK_ERRORS as e:
+            # Si la API no responde se sirve la copia expirada, si existe
+            if cached:
+                logger.log_error(f"Serving stale cache for {url}: {str(e)}")
+                return cached['data']
+            raise
+
+        self.cache.store(
+            url,
+            data,
+            etag=response_headers.get('ETag'),
+            last_modified=response_headers.get('Last-Modified')
+        )
+        return data
+
+    async def get_pokemon_by_name_or_id(self, identifier: str) -> Optional[Dict]:
+        """
+        Obtiene información detallada de un Pokémon por nombre o ID
+        """
+        key = str(identifier).strip().lower()
+        cached = pokemon_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self.offline:
+            processed_data = self.catalog.get(key)
+        else:
+            try:
+                endpoint = f"/pokemon/{key}"
+                pokemon_data = await self._fetch_json(f"{self.base_url}{endpoint}", endpoint)
+                species_data = await self._fetch_json(
+                    pokemon_data['species']['url'],
+                    f"species/{key}"
+                )
+                evolution_data = await self._fetch_json(
+                    species_data['evolution_chain']['url'],
+                    f"evolution-chain/{key}"
+                )
+                processed_data = PokeAPIService.build_pokemon_details(
+                    pokemon_data, species_data, evolution_data
+                )
+            except NETWORK_ERRORS as e:
+                logger.log_error(f"Error fetching pokemon {identifier}: {str(e)}", exc_info=True)
+                processed_data = self.catalog.get(key) if self.catalog.is_loaded else None
+
+        if processed_data:
+            pokemon_cache.put(
+                str(processed_data['id']),
+                processed_data,
+                aliases=(processed_data['name'].lower(),)
+            )
+        return processed_data
+
+    async def get_pokemon_summary(self, identifier: str) -> Optional[Dict]:
+        """
+        Obtiene solo los datos que muestran las tarjetas de resultados
+        """
+        key = str(identifier).strip().lower()
+        summary = summary_cache.get(key)
+        if summary is not None:
+            return summary
+
+        details = pokemon_cache.get(key)
+        if details is None and self.offline:
+            details = self.catalog.get(key)
+            if details is None:
+                return None
+
+        if details is not None:
+            summary = PokeAPIService.summarize_details(details)
+        else:
+            try:
+                endpoint = f"/pokemon/{key}"
+                pokemon_data = await self._fetch_json(f"{self.base_url}{endpoint}", endpoint)
+                summary = PokeAPIService.build_pokemon_summary(pokemon_data)
+            except NETWORK_ERRORS as e:
+                logger.log_error(f"Error fetching pokemon summary {identifier}: {str(e)}", exc_info=True)
+                details = self.catalog.get(key) if self.catalog.is_loaded else None
+                if details is None:
+                    return None
+                summary = PokeAPIService.summarize_details(details)
+
+        summary_cache.put(str(summary['id']), summary, aliases=(summary['name'].lower(),))
+        return summary
+
+    async def get_many_pokemon(self, identifiers: Iterable[str], summary: bool = False) -> List[Optional[Dict]]:
+        """
+        Obtiene varios Pokémon a la vez conservando el orden. Si la
+        operación se cancela, se cancelan también todas las peticiones
+        pendientes.
+        """
+        fetch = self.get_pokemon_summary if summary else self.get_pokemon_by_name_or_id
+        tasks = [asyncio.ensure_future(fetch(identifier)) for identifier in identifiers]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def search_pokemon(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Busca Pokémon que coincidan con el término de búsqueda
+        """
+        start_time = time.time()
+        try:
+            if not name_index.is_built or name_index.is_stale(self.cache.ttls['list']):
+                await self.refresh_name_index()
+
+            matches = name_index.search(query, limit)
+            summaries = await self.get_many_pokemon(
+                [match['name'] for match in matches],
+                summary=True
+            )
+
+            logger.log_api_call(
+                endpoint=f"pokemon/search/{query}",
+                method="GET",
+                status_code=200,
+                response_time=time.time() - start_time
+            )
+            return [summary for summary in summaries if summary]
+
+        except NETWORK_ERRORS as e:
+            logger.log_error(f"Error searching pokemon with query {query}: {str(e)}", exc_info=True)
+            return []
+
+    async def refresh_name_index(self):
+        """
+        Reconstruye el índice de nombres compartido
+        """
+        if self.offline:
+            name_index.build(self.catalog.names())
+            return
+
+        endpoint = "/pokemon?limit=100000"
+        all_pokemon = (await self._fetch_json(f"{self.base_url}{endpoint}", endpoint))['results']
+        name_index.build([
+            (int(pokemon['url'].rstrip('/').split('/')[-1]), pokemon['name'])
+            for pokemon in all_pokemon
+        ])
+
+    async def get_pokemon_types(self) -> List[str]:
+        """
+        Obtiene la lista de todos los tipos de Pokémon
+        """
+        if self.offline:
+            return list(self.catalog.types)
+
+        try:
+            endpoint = "/type"
+            types_data = await self._fetch_json(f"{self.base_url}{endpoint}", endpoint)
+            return [type_info['name'] for type_info in types_data['results']]
+        except NETWORK_ERRORS as e:
+            logger.log_error(f"Error fetching pokemon types: {str(e)}", exc_info=True)
+            return []
+
+    async def download_sprite(self, url: str) -> Optional[bytes]:
+        """
+        Descarga una imagen sprite de un Pokémon
+        """
+        try:
+            start_time = time.time()
+            status, _, content = await self._get(url, read_json=False)
+            logger.log_api_call(
+                endpoint="sprite_download",
+                method="GET",
+                status_code=status,
+                response_time=time.time() - start_time
+            )
+            if status >= 400:
+                raise aiohttp.ClientResponseError(
+                    None, (), status=status, message=f"HTTP {status} for {url}"
+                )
+            return content
+        except NETWORK_ERRORS as e:
+            logger.log_error(f"Error downloading sprite from {url}: {str(e)}", exc_info=True)
+            return None
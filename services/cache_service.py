@@ -0,0 +1,161 @@
+# services/cache_service.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from config.config_handler import config
+from services.logging_service import logger
+
+class ResponseCache:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ResponseCache, cls).__new__(cls)
+            cls._instance._setup_cache()
+        return cls._instance
+
+    def _setup_cache(self):
+        """
+        Configura la base de datos local donde se guardan las respuestas
+        """
+        settings = config.cache
+        self.directory = settings['directory']
+        self.ttls = settings['ttl']
+
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stale': 0,
+            'revalidated': 0,
+            'stored': 0
+        }
+
+        self._connection = sqlite3.connect(
+            os.path.join(self.directory, 'api_cache.sqlite'),
+            check_same_thread=False
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            self._connection.commit()
+
+    def get_ttl(self, url: str) -> int:
+        """
+        Obtiene el tiempo de vida (en segundos) según el endpoint de la URL
+        """
+        parsed = urlparse(url)
+        segments = [segment for segment in parsed.path.split('/') if segment]
+        resource = segments[2] if len(segments) > 2 else ''
+
+        # Listados paginados (?limit=...): cambian cuando se añaden Pokémon
+        if parsed.query:
+            return self.ttls['list']
+        if resource == 'pokemon':
+            return self.ttls['pokemon']
+        if resource == 'pokemon-species':
+            return self.ttls['species']
+        if resource == 'evolution-chain':
+            return self.ttls['evolution']
+        return self.ttls['default']
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """
+        Busca una respuesta guardada e indica si sigue vigente
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+
+            if not row:
+                self._stats['misses'] += 1
+                return None
+
+            fresh = row[3] > time.time()
+            self._stats['hits' if fresh else 'stale'] += 1
+
+        return {
+            'data': json.loads(row[0]),
+            'etag': row[1],
+            'last_modified': row[2],
+            'fresh': fresh
+        }
+
+    def store(self, url: str, data: Dict, etag: str = None, last_modified: str = None):
+        """
+        Guarda (o reemplaza) la respuesta de una URL
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                self._connection.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                        (url, body, etag, last_modified, fetched_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (url, json.dumps(data), etag, last_modified, now, now + self.get_ttl(url))
+                )
+                self._connection.commit()
+                self._stats['stored'] += 1
+        except sqlite3.Error as e:
+            logger.log_error(f"Error storing cached response for {url}: {str(e)}", exc_info=True)
+
+    def revalidate(self, url: str):
+        """
+        Renueva el tiempo de vida de una respuesta confirmada por el servidor (304)
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "UPDATE responses SET fetched_at = ?, expires_at = ? WHERE url = ?",
+                    (now, now + self.get_ttl(url), url)
+                )
+                self._connection.commit()
+                self._stats['revalidated'] += 1
+        except sqlite3.Error as e:
+            logger.log_error(f"Error revalidating cached response for {url}: {str(e)}", exc_info=True)
+
+    def clear(self):
+        """
+        Elimina todas las respuestas guardadas
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna los contadores de aciertos y fallos de la caché
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+        lookups = stats['hits'] + stats['stale'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+# Crear instancia global de la caché
+response_cache = ResponseCache()
@@ -0,0 +1,213 @@
+# services/catalog_service.py
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+from config.config_handler import config
+from services.logging_service import logger
+
+# Formato del snapshot:
+#   cabecera | registros (JSON comprimido con zlib) | índice | metadatos
+# El índice son entradas de tamaño fijo (id, offset, longitud) ordenadas
+# por id, de modo que cada registro se localiza con una búsqueda binaria
+# directamente sobre el archivo mapeado sin decodificar el resto.
+CATALOG_MAGIC = b'PKDXCAT\x00'
+CATALOG_VERSION = 1
+_HEADER = struct.Struct('<8sHIdQQQ')
+_INDEX_ENTRY = struct.Struct('<IQI')
+
+def write_snapshot(path: str, records: Iterable[Dict], types: List[str]) -> int:
+    """
+    Escribe un snapshot del catálogo en path y retorna el número de
+    registros guardados. Para sustituir el snapshot en uso se usa
+    CatalogSnapshot.replace().
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    index = []
+    names = []
+
+    with open(path, 'wb') as snapshot_file:
+        snapshot_file.write(b'\x00' * _HEADER.size)
+
+        for record in sorted(records, key=lambda r: r['id']):
+            blob = zlib.compress(json.dumps(record, separators=(',', ':')).encode('utf-8'))
+            index.append((record['id'], snapshot_file.tell(), len(blob)))
+            names.append([record['id'], record['name'].lower()])
+            snapshot_file.write(blob)
+
+        index_offset = snapshot_file.tell()
+        for entry in index:
+            snapshot_file.write(_INDEX_ENTRY.pack(*entry))
+
+        meta_offset = snapshot_file.tell()
+        meta = zlib.compress(json.dumps({'names': names, 'types': types}).encode('utf-8'))
+        snapshot_file.write(meta)
+
+        snapshot_file.seek(0)
+        snapshot_file.write(_HEADER.pack(
+            CATALOG_MAGIC, CATALOG_VERSION, len(index), time.time(),
+            index_offset, meta_offset, len(meta)
+        ))
+
+    return len(index)
+
+class CatalogSnapshot:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CatalogSnapshot, cls).__new__(cls)
+            cls._instance._setup_catalog()
+        return cls._instance
+
+    def _setup_catalog(self):
+        """
+        Mapea en memoria el snapshot configurado, si existe
+        """
+        settings = config.catalog
+        self.path = settings['path']
+        self.offline = settings['offline']
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+        self._count = 0
+        self._index_offset = 0
+        self._ids_by_name = {}
+        self.types = []
+        self.created_at = None
+        self.open()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._map is not None
+
+    def open(self) -> bool:
+        """
+        (Re)abre el snapshot. Solo se decodifican la cabecera y los
+        metadatos; los registros se leen bajo demanda.
+        """
+        with self._lock:
+            return self._open()
+
+    def replace(self, records: Iterable[Dict], types: List[str]) -> int:
+        """
+        Sustituye el snapshot por uno nuevo y retorna el número de
+        registros guardados. El archivo nuevo se escribe aparte y el
+        mapeo actual se cierra antes del cambio: en Windows no se puede
+        reemplazar un archivo abierto, y ninguna lectura ve el cambio a medias.
+        """
+        temp_path = f"{self.path}.tmp"
+        saved = write_snapshot(temp_path, records, types)
+        with self._lock:
+            self._close()
+            try:
+                os.replace(temp_path, self.path)
+            finally:
+                # Si el cambio falla se vuelve a mapear el snapshot anterior
+                self._open()
+        return saved
+
+    def _open(self) -> bool:
+        # Se llama con el lock tomado
+        self._close()
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            self._file = open(self.path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, count, created_at, index_offset, meta_offset, meta_length = \
+                _HEADER.unpack_from(self._map, 0)
+            if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+                raise ValueError(f"Unsupported catalog snapshot (version {version})")
+
+            meta = json.loads(zlib.decompress(self._map[meta_offset:meta_offset + meta_length]))
+            self._count = count
+            self._index_offset = index_offset
+            self._ids_by_name = {name: pokemon_id for pokemon_id, name in meta['names']}
+            self.types = meta['types']
+            self.created_at = created_at
+            return True
+
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            logger.log_error(f"Error opening catalog snapshot {self.path}: {str(e)}", exc_info=True)
+            self._close()
+            return False
+
+    def _close(self):
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._map = None
+        self._file = None
+        self._count = 0
+        self._ids_by_name = {}
+        self.types = []
+        self.created_at = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def names(self) -> List[Tuple[int, str]]:
+        """
+        Retorna los pares (id, nombre) del catálogo
+        """
+        return [(pokemon_id, name) for name, pokemon_id in self._ids_by_name.items()]
+
+    def _find_entry(self, pokemon_id: int) -> Optional[Tuple[int, int]]:
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry_id, offset, length = _INDEX_ENTRY.unpack_from(
+                self._map, self._index_offset + middle * _INDEX_ENTRY.size
+            )
+            if entry_id == pokemon_id:
+                return offset, length
+            if entry_id < pokemon_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def get(self, identifier) -> Optional[Dict]:
+        """
+        Obtiene (y decodifica) el registro de un Pokémon por nombre o ID
+        """
+        key = str(identifier).strip().lower()
+        with self._lock:
+            if self._map is None:
+                return None
+
+            pokemon_id = int(key) if key.isdigit() else self._ids_by_name.get(key)
+            if pokemon_id is None:
+                return None
+
+            entry = self._find_entry(pokemon_id)
+            if entry is None:
+                return None
+
+            offset, length = entry
+            blob = self._map[offset:offset + length]
+
+        return json.loads(zlib.decompress(blob))
+
+# Instancia global del catálogo (se mapea al iniciar la aplicación)
+catalog = CatalogSnapshot()
+
+if __name__ == "__main__":
+    from services.api_service import PokeAPIService
+
+    def print_progress(done: int, total: int):
+        print(f"\r{done}/{total}", end="", flush=True)
+
+    total = PokeAPIService().sync_catalog(progress_callback=print_progress)
+    print(f"\nCatálogo sincronizado: {total} Pokémon en {catalog.path}")
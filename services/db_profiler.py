@@ -0,0 +1,343 @@
+# services/db_profiler.py
+import json
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache, wraps
+from typing import Dict, List, Optional
+from config.config_handler import config
+from services.logging_service import logger
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Límites superiores (ms) de los intervalos del histograma de tiempos
+HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Variación del tiempo medio a partir de la cual compare_reports la señala
+MEAN_CHANGE_RATIO = 0.25
+
+# Archivos que no cuentan como origen de una consulta
+_INTERNAL_FILES = (
+    os.path.join('config', 'database.py'),
+    os.path.join('services', 'db_profiler.py'),
+    'contextlib.py'
+)
+
+_STRING = re.compile(r"'(?:[^'\\]|''|\\.)*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+(\w+)", re.IGNORECASE)
+
+@lru_cache(maxsize=1024)
+def normalize_sql(query: str) -> str:
+    """
+    Reduce una consulta a su forma general: sin valores concretos, con
+    las listas IN (...) agrupadas y en una sola línea
+    """
+    query = query.replace('%s', '?')
+    query = _STRING.sub('?', query)
+    query = _NUMBER.sub('?', query)
+    query = ' '.join(query.split())
+    return _IN_LIST.sub('IN (...)', query)
+
+def _table_of(statement: str) -> str:
+    match = _TABLE.search(statement)
+    return match.group(1) if match else '-'
+
+def call_site() -> str:
+    """
+    Retorna el primer archivo:línea (y función) del proyecto fuera de la
+    capa de base de datos en la pila actual
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        path = frame.f_code.co_filename
+        if not path.endswith(_INTERNAL_FILES):
+            if path.startswith(PROJECT_ROOT):
+                path = os.path.relpath(path, PROJECT_ROOT)
+            return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return 'unknown'
+
+class StatementStats:
+    """
+    Histograma de tiempos y filas de una consulta normalizada
+    """
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.call_sites = Counter()
+
+    def add(self, elapsed_ms: float, rows: int, site: str, slow: bool):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+        self.slow += int(slow)
+        self.call_sites[site] += 1
+        for index, limit in enumerate(HISTOGRAM_BUCKETS):
+            if elapsed_ms <= limit:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        # Aproximado: límite superior del intervalo que alcanza el percentil
+        target = fraction * self.count
+        seen = 0
+        for index, total in enumerate(self.buckets[:-1]):
+            seen += total
+            if seen >= target:
+                return HISTOGRAM_BUCKETS[index]
+        return self.max_ms
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 2),
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max_ms, 2),
+            'rows': self.rows,
+            'slow': self.slow,
+            # Un contador por intervalo de HISTOGRAM_BUCKETS más el de los mayores
+            'histogram': list(self.buckets),
+            'call_sites': dict(sorted(self.call_sites.items()))
+        }
+
+class DatabaseProfiler:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(DatabaseProfiler, cls).__new__(cls)
+            cls._instance._setup()
+        return cls._instance
+
+    def _setup(self):
+        settings = config.profiler
+        self.enabled = settings['enabled']
+        self.slow_query_ms = settings['slow_query_ms']
+        self.n_plus_one_threshold = settings['n_plus_one_threshold']
+        self.report_dir = settings['report_dir']
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._statements = {}  # consulta normalizada -> StatementStats
+        self._actions = {}  # acción -> {'runs', 'queries', 'max_queries'}
+        self._n_plus_one = {}  # (acción, consulta) -> hallazgo
+
+    def record(self, query: str, elapsed: float, rows: int = 0):
+        """
+        Registra una consulta ejecutada y su duración en segundos
+        """
+        if not self.enabled:
+            return
+        elapsed_ms = elapsed * 1000
+        statement = normalize_sql(query)
+        site = call_site()
+        slow = elapsed_ms >= self.slow_query_ms
+
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = StatementStats()
+            stats.add(elapsed_ms, rows, site, slow)
+
+        action = getattr(self._local, 'action', None)
+        if action is not None:
+            action['queries'][statement] += 1
+            action['sites'].setdefault(statement, Counter())[site] += 1
+
+        if slow:
+            logger.log_database_operation(
+                'slow_query', _table_of(statement),
+                f"{elapsed_ms:.1f}ms | rows={rows} | {site} | {statement}"
+            )
+
+    def action(self, name: str):
+        """
+        Delimita una acción de la interfaz para detectar consultas
+        repetidas dentro de ella (patrón N+1)
+        """
+        return _ProfiledAction(self, name)
+
+    def _start_action(self, name: str) -> bool:
+        # Solo cuenta la acción más externa; las anidadas forman parte de ella
+        if not self.enabled or getattr(self._local, 'action', None) is not None:
+            return False
+        self._local.action = {'name': name, 'queries': Counter(), 'sites': {}}
+        return True
+
+    def _end_action(self):
+        action, self._local.action = self._local.action, None
+        name = action['name']
+        findings = [
+            (statement, total) for statement, total in action['queries'].items()
+            if total >= self.n_plus_one_threshold
+        ]
+
+        with self._lock:
+            summary = self._actions.setdefault(name, {'runs': 0, 'queries': 0, 'max_queries': 0})
+            executed = sum(action['queries'].values())
+            summary['runs'] += 1
+            summary['queries'] += executed
+            summary['max_queries'] = max(summary['max_queries'], executed)
+
+            for statement, total in findings:
+                finding = self._n_plus_one.setdefault((name, statement), {
+                    'action': name,
+                    'statement': statement,
+                    'occurrences': 0,
+                    'max_repeats': 0,
+                    'call_sites': Counter()
+                })
+                finding['occurrences'] += 1
+                finding['max_repeats'] = max(finding['max_repeats'], total)
+                finding['call_sites'].update(action['sites'][statement])
+
+        for statement, total in findings:
+            site = action['sites'][statement].most_common(1)[0][0]
+            logger.log_database_operation(
+                'n_plus_one', _table_of(statement),
+                f"{name} ran the same statement {total} times | {site} | {statement}"
+            )
+
+    def get_report(self) -> Dict:
+        """
+        Retorna el informe de la sesión con claves ordenadas, para poder
+        comparar informes de distintas versiones
+        """
+        with self._lock:
+            statements = {
+                statement: stats.to_dict()
+                for statement, stats in sorted(self._statements.items())
+            }
+            actions = {name: dict(summary) for name, summary in sorted(self._actions.items())}
+            n_plus_one = [
+                dict(finding, call_sites=dict(sorted(finding['call_sites'].items())))
+                for _, finding in sorted(self._n_plus_one.items())
+            ]
+        return {
+            'session': {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'backend': config.database['backend'],
+                'slow_query_ms': self.slow_query_ms,
+                'histogram_buckets_ms': list(HISTOGRAM_BUCKETS),
+                'n_plus_one_threshold': self.n_plus_one_threshold
+            },
+            'totals': {
+                'statements': len(statements),
+                'queries': sum(stats['count'] for stats in statements.values()),
+                'total_ms': round(sum(stats['total_ms'] for stats in statements.values()), 2),
+                'slow': sum(stats['slow'] for stats in statements.values())
+            },
+            'statements': statements,
+            'actions': actions,
+            'n_plus_one': n_plus_one
+        }
+
+    def export_report(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Guarda el informe de la sesión en JSON y retorna la ruta
+        """
+        if not self.enabled or not self._statements:
+            return None
+        if path is None:
+            if not os.path.exists(self.report_dir):
+                os.makedirs(self.report_dir)
+            path = os.path.join(
+                self.report_dir,
+                f"db_profile_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json"
+            )
+        with open(path, 'w', encoding='utf-8') as report:
+            json.dump(self.get_report(), report, indent=2, sort_keys=True, ensure_ascii=False)
+        return path
+
+    def reset(self):
+        """
+        Descarta lo registrado hasta ahora y empieza una sesión nueva
+        """
+        with self._lock:
+            self._statements.clear()
+            self._actions.clear()
+            self._n_plus_one.clear()
+            self.started_at = datetime.now()
+
+class _ProfiledAction:
+    def __init__(self, profiler: DatabaseProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.owner = False
+
+    def __enter__(self):
+        self.owner = self.profiler._start_action(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.owner:
+            self.profiler._end_action()
+
+def profiled_action(function):
+    """
+    Decorador para los manejadores de la interfaz: cada llamada es una
+    acción del perfilador con el nombre Clase.método
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with profiler.action(function.__qualname__):
+            return function(*args, **kwargs)
+    return wrapper
+
+def compare_reports(old: Dict, new: Dict) -> List[Dict]:
+    """
+    Compara dos informes y retorna las consultas nuevas, desaparecidas o
+    cuyo número de ejecuciones o tiempo medio ha cambiado apreciablemente
+    """
+    changes = []
+    old_statements, new_statements = old['statements'], new['statements']
+    for statement in sorted(set(old_statements) | set(new_statements)):
+        before, after = old_statements.get(statement), new_statements.get(statement)
+        if before is None or after is None:
+            changes.append({
+                'statement': statement,
+                'change': 'added' if before is None else 'removed',
+                'count': (after or before)['count'],
+                'mean_ms': (after or before)['mean_ms']
+            })
+        elif (before['count'] != after['count'] or
+              abs(after['mean_ms'] - before['mean_ms']) > MEAN_CHANGE_RATIO * max(before['mean_ms'], 1.0)):
+            changes.append({
+                'statement': statement,
+                'change': 'changed',
+                'count': f"{before['count']} -> {after['count']}",
+                'mean_ms': f"{before['mean_ms']} -> {after['mean_ms']}"
+            })
+    return changes
+
+def main(arguments: List[str]) -> int:
+    if len(arguments) != 3 or arguments[0] != 'compare':
+        print("Uso: python -m services.db_profiler compare <informe_anterior.json> <informe_nuevo.json>")
+        return 2
+    with open(arguments[1], 'r', encoding='utf-8') as old, open(arguments[2], 'r', encoding='utf-8') as new:
+        changes = compare_reports(json.load(old), json.load(new))
+    for change in changes:
+        print(f"[{change['change']}] count={change['count']} mean_ms={change['mean_ms']} | {change['statement']}")
+    if not changes:
+        print("Sin cambios en las consultas")
+    return 0
+
+# Instancia global del perfilador
+profiler = DatabaseProfiler()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+# services/maintenance_service.py
+import sys
+from typing import List
+from models.rollup_model import RollupModel
+from services.logging_service import logger
+
+def rebuild_rollups() -> bool:
+    """
+    Recalcula las tablas resumen del panel de administración
+    """
+    success = RollupModel().rebuild()
+    if success:
+        logger.log_database_operation('rebuild', 'rollups', 'dashboard rollups rebuilt')
+    return success
+
+def reconcile_user_counters() -> int:
+    """
+    Corrige los contadores por usuario y retorna cuántos estaban desajustados
+    """
+    drifted = RollupModel().reconcile_user_counters()
+    if drifted >= 0:
+        logger.log_database_operation('reconcile', 'user_counters', f"{drifted} drifted rows fixed")
+    return drifted
+
+def main(arguments: List[str]) -> int:
+    command = arguments[0] if arguments else ''
+
+    if command == 'rollups':
+        if not rebuild_rollups():
+            print("Error al recalcular las tablas resumen")
+            return 1
+        print("Tablas resumen recalculadas")
+    elif command == 'counters':
+        drifted = reconcile_user_counters()
+        if drifted < 0:
+            print("Error al corregir los contadores por usuario")
+            return 1
+        print(f"Contadores por usuario corregidos: {drifted}")
+    else:
+        print("Uso: python -m services.maintenance_service [rollups|counters]")
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
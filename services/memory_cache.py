@@ -0,0 +1,133 @@
+# services/memory_cache.py
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+from config.config_handler import config
+
+def estimate_size(value: Any) -> int:
+    """
+    Estima el tamaño aproximado en bytes de un valor serializable
+    """
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+class LRUCache:
+    def __init__(self, name: str, max_entries: int, max_bytes: int,
+                 sizeof: Callable[[Any], int] = estimate_size):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()  # clave -> (valor, tamaño, alias)
+        self._aliases = {}  # alias -> clave
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def _resolve(self, key):
+        return self._aliases.get(key, key)
+
+    def get(self, key, default=None):
+        """
+        Obtiene un valor por su clave o por cualquiera de sus alias
+        """
+        with self._lock:
+            key = self._resolve(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, key, value, aliases: Iterable = ()):
+        """
+        Guarda un valor y registra los alias que apuntan a él
+        """
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            aliases = tuple(alias for alias in aliases if alias != key)
+            for alias in aliases:
+                self._aliases[alias] = key
+
+            self._entries[key] = (value, size, aliases)
+            self._total_bytes += size
+            self._evict()
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._resolve(key) in self._entries
+
+    def invalidate(self, key):
+        """
+        Elimina una entrada (por clave o alias)
+        """
+        with self._lock:
+            key = self._resolve(key)
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """
+        Vacía la caché
+        """
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key):
+        _, size, aliases = self._entries.pop(key)
+        self._total_bytes -= size
+        for alias in aliases:
+            if self._aliases.get(alias) == key:
+                del self._aliases[alias]
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries or
+            self._total_bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._stats['evictions'] += 1
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna estadísticas de uso, desalojos y tasa de aciertos
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._total_bytes
+            stats['max_entries'] = self.max_entries
+            stats['max_bytes'] = self.max_bytes
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+# Caché global de Pokémon ya procesados
+pokemon_cache = LRUCache(
+    'pokemon_details',
+    max_entries=config.cache['memory_max_entries'],
+    max_bytes=config.cache['memory_max_bytes']
+)
+
+# Caché global de resúmenes para las tarjetas de resultados
+summary_cache = LRUCache(
+    'pokemon_summaries',
+    max_entries=config.cache['summary_max_entries'],
+    max_bytes=config.cache['memory_max_bytes']
+)
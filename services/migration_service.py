@@ -0,0 +1,288 @@
+# services/migration_service.py
+import os
+import re
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+from config.database import DatabaseConnection
+from services.logging_service import logger
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'database', 'migrations')
+_MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.(up|down)\.sql$')
+
+# Versión mínima de MySQL: la migración 0003 usa JSON_TABLE y las
+# estadísticas de equipo usan funciones de ventana
+MIN_MYSQL_VERSION = (8, 0, 4)
+
+# Tablas pequeñas que se pueden recorrer enteras sin problema
+ALLOWED_FULL_SCANS = {'roles', 'rollup_totals', 'rollup_role_users'}
+
+# Tabla (y alias opcional) tras FROM o JOIN
+_TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+_NOT_ALIAS = {
+    'where', 'join', 'left', 'right', 'inner', 'outer', 'cross', 'natural', 'on',
+    'using', 'group', 'order', 'limit', 'having', 'union', 'for', 'window'
+}
+
+def _table_aliases(query: str) -> Dict[str, str]:
+    """
+    Relaciona cada alias de la consulta (y cada nombre de tabla) con la
+    tabla real, ya que EXPLAIN muestra el alias
+    """
+    aliases = {}
+    for table, alias in _TABLE_REFERENCE.findall(query):
+        aliases[table] = table
+        if alias and alias.lower() not in _NOT_ALIAS:
+            aliases[alias] = table
+    return aliases
+
+class MigrationError(Exception):
+    """
+    Se lanza cuando una migración no se puede aplicar o revertir
+    """
+
+class MigrationService:
+    def __init__(self, directory: str = MIGRATIONS_DIR):
+        self.directory = directory
+        self.db = DatabaseConnection()
+
+    def _ensure_version_table(self):
+        self.db.execute_query("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def discover(self) -> List[Dict]:
+        """
+        Lista las migraciones disponibles ordenadas por versión
+        """
+        migrations = {}
+        for file_name in os.listdir(self.directory):
+            match = _MIGRATION_FILE.match(file_name)
+            if not match:
+                continue
+            version, name, direction = int(match.group(1)), match.group(2), match.group(3)
+            migration = migrations.setdefault(version, {'version': version, 'name': name})
+            migration[direction] = os.path.join(self.directory, file_name)
+
+        for migration in migrations.values():
+            if 'up' not in migration or 'down' not in migration:
+                raise MigrationError(
+                    f"Migration {migration['version']:04d} needs both .up.sql and .down.sql"
+                )
+        return [migrations[version] for version in sorted(migrations)]
+
+    def applied_versions(self) -> List[int]:
+        """
+        Retorna las versiones ya aplicadas
+        """
+        self._ensure_version_table()
+        rows = self.db.fetch_all("SELECT version FROM schema_version ORDER BY version")
+        return [row['version'] for row in rows]
+
+    def current_version(self) -> int:
+        versions = self.applied_versions()
+        return versions[-1] if versions else 0
+
+    @staticmethod
+    def _read_statements(path: str) -> List[str]:
+        # Las sentencias terminan en ';' al final de línea; se ignoran comentarios
+        with open(path, 'r', encoding='utf-8') as script:
+            lines = [
+                line for line in script.read().splitlines()
+                if not line.strip().startswith(('--', '#'))
+            ]
+        return [
+            statement.strip()
+            for statement in re.split(r';\s*$', '\n'.join(lines), flags=re.MULTILINE)
+            if statement.strip()
+        ]
+
+    def _run_script(self, path: str):
+        # Todo el script va por la misma conexión para que los SET SESSION
+        # afecten al resto de sentencias
+        with self.db.connection() as conn:
+            with conn.cursor() as cursor:
+                for statement in self._read_statements(path):
+                    cursor.execute(statement)
+
+    def _check_server_version(self):
+        """
+        Rechaza servidores anteriores a MIN_MYSQL_VERSION antes de aplicar
+        nada, para no dejar el esquema a medio migrar
+        """
+        version = self.db.fetch_one("SELECT VERSION() as version")['version']
+        if 'mariadb' in version.lower():
+            return
+        numbers = tuple(int(part) for part in re.findall(r'\d+', version)[:3])
+        if numbers < MIN_MYSQL_VERSION:
+            raise MigrationError(
+                f"MySQL {'.'.join(map(str, MIN_MYSQL_VERSION))} or later is required "
+                f"(server is {version})"
+            )
+
+    def upgrade(self, target: Optional[int] = None) -> List[int]:
+        """
+        Aplica en orden las migraciones pendientes hasta target (o todas)
+        """
+        self._check_server_version()
+        applied = set(self.applied_versions())
+        done = []
+        for migration in self.discover():
+            version = migration['version']
+            if version in applied or (target is not None and version > target):
+                continue
+            try:
+                # MySQL confirma implícitamente cada sentencia DDL, por eso
+                # la versión se registra justo después de cada migración
+                self._run_script(migration['up'])
+                self.db.execute_query(
+                    "INSERT INTO schema_version (version, name) VALUES (%s, %s)",
+                    (version, migration['name'])
+                )
+            except Exception as e:
+                raise MigrationError(f"Migration {version:04d}_{migration['name']} failed: {str(e)}")
+
+            logger.log_database_operation('migrate_up', 'schema_version', f"{version:04d}_{migration['name']}")
+            done.append(version)
+        return done
+
+    def downgrade(self, target: int) -> List[int]:
+        """
+        Revierte, de la más reciente a la más antigua, las migraciones
+        posteriores a target
+        """
+        applied = set(self.applied_versions())
+        done = []
+        for migration in reversed(self.discover()):
+            version = migration['version']
+            if version not in applied or version <= target:
+                continue
+            try:
+                self._run_script(migration['down'])
+                self.db.execute_query("DELETE FROM schema_version WHERE version = %s", (version,))
+            except Exception as e:
+                raise MigrationError(f"Reverting {version:04d}_{migration['name']} failed: {str(e)}")
+
+            logger.log_database_operation('migrate_down', 'schema_version', f"{version:04d}_{migration['name']}")
+            done.append(version)
+        return done
+
+    def _hot_paths(self, user_id: int, trainer_id: int, region: str) -> List[Tuple[str, Callable, set]]:
+        """
+        Consultas de los modelos que deben usar índices: (nombre, llamada,
+        tablas que pueden recorrerse enteras)
+        """
+        # Importación diferida: los modelos no son necesarios para migrar
+        from models.admin_model import AdminModel
+        from models.pokemon_model import PokemonModel
+        from models.search_model import SearchModel
+        from models.team_model import TeamModel
+        from models.team_stats_model import TeamStatsModel
+        from models.trainer_model import TrainerModel
+        from models.user_model import UserModel
+
+        admin, pokemon, search = AdminModel(), PokemonModel(), SearchModel()
+        team, trainer, user = TeamModel(), TrainerModel(), UserModel()
+        team_stats = TeamStatsModel()
+        return [
+            ('SearchModel.get_user_searches', lambda: search.get_user_searches(user_id), set()),
+            ('SearchModel.get_popular_searches', lambda: search.get_popular_searches(), set()),
+            ('UserModel.get_user_stats', lambda: user.get_user_stats(user_id), set()),
+            ('AdminModel.get_users_page', lambda: admin.get_users_page(), set()),
+            ('AdminModel.get_system_stats', lambda: admin.get_system_stats(), set()),
+            ('AdminModel.get_search_logs', lambda: admin.get_search_logs(), set()),
+            ('AdminModel.get_activity_logs', lambda: admin.get_activity_logs(), set()),
+            ('TrainerModel.get_trainer_by_user_id', lambda: trainer.get_trainer_by_user_id(user_id), set()),
+            ('TrainerModel.get_trainer_stats', lambda: trainer.get_trainer_stats(trainer_id), set()),
+            ('TrainerModel.get_trainers_by_region', lambda: trainer.get_trainers_by_region(region), set()),
+            ('TrainerModel.get_all_regions', lambda: trainer.get_all_regions(), set()),
+            ('TeamModel.get_trainer_pokemon', lambda: team.get_trainer_pokemon(trainer_id), set()),
+            ('TeamModel.get_type_distribution', lambda: team.get_type_distribution(trainer_id), set()),
+            ('TeamStatsModel.get_team_stats', lambda: team_stats.get_team_stats(trainer_id), set()),
+            # El informe de todos los equipos recorre team_pokemon completa por diseño
+            ('TeamStatsModel.get_all_team_stats', lambda: team_stats.get_all_team_stats(), {'team_pokemon'}),
+            ('PokemonModel.search_pokemon_by_name', lambda: pokemon.search_pokemon_by_name(trainer_id, 'a'), set())
+        ]
+
+    def verify(self) -> List[Dict]:
+        """
+        Ejecuta EXPLAIN sobre las consultas de los modelos y retorna las
+        que recorren una tabla completa no permitida, tenga o no índices
+        que el optimizador pudiera haber usado
+        """
+        sample = self.db.fetch_one("""
+            SELECT t.id as trainer_id, t.user_id, t.region
+            FROM trainers t
+            LIMIT 1
+        """) or {}
+        hot_paths = self._hot_paths(
+            sample.get('user_id') or 1,
+            sample.get('trainer_id') or 1,
+            sample.get('region') or 'Kanto'
+        )
+
+        problems = []
+        for name, call, allowed_scans in hot_paths:
+            with self.db.capture_queries() as queries:
+                call()
+
+            for query, params in queries:
+                if not query.lstrip().lstrip('(').upper().startswith('SELECT'):
+                    continue
+                aliases = _table_aliases(query)
+                for row in self.db.fetch_all(f"EXPLAIN {query}", params):
+                    table = row.get('table') or ''
+                    table = aliases.get(table, table)
+                    if (row.get('type') == 'ALL' and
+                            table not in ALLOWED_FULL_SCANS and table not in allowed_scans and
+                            not table.startswith('<')):
+                        problems.append({
+                            'path': name,
+                            'table': table,
+                            'query': ' '.join(query.split())
+                        })
+        return problems
+
+def main(arguments: List[str]) -> int:
+    service = MigrationService()
+    command = arguments[0] if arguments else 'status'
+
+    # El esquema de SQLite (database/schema_sqlite.sql) ya incluye todas
+    # las migraciones; los scripts y EXPLAIN son propios de MySQL
+    if service.db.backend == 'sqlite' and command in ('upgrade', 'downgrade', 'verify'):
+        print("Las migraciones solo se aplican con backend = mysql; "
+              "la base SQLite se crea con el esquema completo")
+        return 2
+
+    if command == 'upgrade':
+        target = int(arguments[1]) if len(arguments) > 1 else None
+        applied = service.upgrade(target)
+        print(f"Migraciones aplicadas: {applied or 'ninguna'}")
+    elif command == 'downgrade':
+        if len(arguments) < 2:
+            print("Uso: python -m services.migration_service downgrade <versión>")
+            return 2
+        reverted = service.downgrade(int(arguments[1]))
+        print(f"Migraciones revertidas: {reverted or 'ninguna'}")
+    elif command == 'verify':
+        problems = service.verify()
+        for problem in problems:
+            print(f"[{problem['path']}] recorre la tabla '{problem['table']}': {problem['query']}")
+        if problems:
+            return 1
+        print("Todas las consultas usan índices")
+    elif command == 'status':
+        applied = set(service.applied_versions())
+        for migration in service.discover():
+            state = 'aplicada' if migration['version'] in applied else 'pendiente'
+            print(f"{migration['version']:04d}_{migration['name']}: {state}")
+    else:
+        print("Uso: python -m services.migration_service [status|upgrade [versión]|downgrade <versión>|verify]")
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
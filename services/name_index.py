@@ -0,0 +1,167 @@
+# services/name_index.py
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+_TERMINAL = '$'
+
+def _ngrams(text: str, size: int) -> set:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Distancia de edición entre a y b, o None si supera max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j, char_b in enumerate(b, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            row_min = min(row_min, current[j])
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    return previous[-1] if previous[-1] <= max_distance else None
+
+class PokemonNameIndex:
+    # Trie para prefijos e índice invertido de n-gramas (1 a 3 caracteres)
+    # para subcadenas y candidatos difusos
+    MAX_GRAM = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = []
+        self._ids = []
+        self._trie = {}
+        self._grams = {}
+        self.built_at = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def is_stale(self, max_age: int) -> bool:
+        return self.built_at is None or time.time() - self.built_at > max_age
+
+    def build(self, entries: List[Tuple[int, str]]):
+        """
+        Construye el índice a partir de pares (id, nombre)
+        """
+        entries = sorted(entries)
+        names = [name.lower() for _, name in entries]
+        ids = [pokemon_id for pokemon_id, _ in entries]
+
+        trie = {}
+        grams = {}
+        for position, name in enumerate(names):
+            node = trie
+            for char in name:
+                node = node.setdefault(char, {})
+            node.setdefault(_TERMINAL, []).append(position)
+
+            for size in range(1, self.MAX_GRAM + 1):
+                for gram in _ngrams(name, size):
+                    grams.setdefault(gram, []).append(position)
+
+        # Reemplazar el índice completo de una sola vez
+        with self._lock:
+            self._names, self._ids = names, ids
+            self._trie, self._grams = trie, grams
+            self.built_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _prefix_matches(self, trie: Dict, prefix: str) -> List[int]:
+        node = trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+
+        positions = []
+        pending = [node]
+        while pending:
+            current = pending.pop()
+            for key, child in current.items():
+                if key == _TERMINAL:
+                    positions.extend(child)
+                else:
+                    pending.append(child)
+        return positions
+
+    def _gram_candidates(self, grams: Dict, query: str) -> List[int]:
+        size = min(len(query), self.MAX_GRAM)
+        postings = [grams.get(gram, ()) for gram in _ngrams(query, size)]
+        if not postings or not all(postings):
+            return []
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+        return list(candidates)
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Busca nombres por prefijo, subcadena y, si faltan resultados,
+        por similitud (distancia de edición). Los resultados se ordenan
+        por relevancia: exacto, prefijo, subcadena y difuso.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        with self._lock:
+            names, ids = self._names, self._ids
+            trie, grams = self._trie, self._grams
+
+        ranked = {}
+
+        for position in self._prefix_matches(trie, query):
+            tier = 0 if names[position] == query else 1
+            ranked[position] = (tier, 0, len(names[position]), ids[position])
+
+        for position in self._gram_candidates(grams, query):
+            if position not in ranked and query in names[position]:
+                offset = names[position].index(query)
+                ranked[position] = (2, offset, len(names[position]), ids[position])
+
+        if len(ranked) < limit and len(query) >= 3:
+            max_distance = 1 if len(query) <= 5 else 2
+            shared = {}
+            for gram in _ngrams(query, 2):
+                for position in grams.get(gram, ()):
+                    shared[position] = shared.get(position, 0) + 1
+
+            minimum_shared = max(1, len(query) - 1 - 2 * max_distance)
+            for position, count in shared.items():
+                if position in ranked or count < minimum_shared:
+                    continue
+                name = names[position]
+                # Comparar también con el prefijo para tolerar nombres más largos
+                distance = bounded_levenshtein(query, name, max_distance)
+                if distance is None and len(name) > len(query):
+                    distance = bounded_levenshtein(query, name[:len(query)], max_distance)
+                    if distance is not None:
+                        distance += 1
+                if distance is not None and distance <= max_distance + 1:
+                    ranked[position] = (3, distance, len(name), ids[position])
+
+        ordered = sorted(ranked.items(), key=lambda item: item[1])[:limit]
+        return [
+            {'id': ids[position], 'name': names[position]}
+            for position, _ in ordered
+        ]
+
+# Índice global compartido por todas las instancias del servicio
+name_index = PokemonNameIndex()
@@ -0,0 +1,94 @@
+# services/query_cache.py
+import threading
+from typing import Any, Dict, Iterable
+from config.config_handler import config
+from services.memory_cache import LRUCache
+
+class QueryCache:
+    """
+    Resultados de consultas etiquetados por las entidades de las que
+    dependen (por ejemplo trainer:3 o user:7). Las escrituras invalidan
+    por etiqueta solo las entradas afectadas.
+    """
+    MISSING = object()
+
+    def __init__(self, name: str, max_entries: int, max_bytes: int):
+        self._results = LRUCache(name, max_entries=max_entries, max_bytes=max_bytes)
+        self._keys_by_tag = {}  # etiqueta -> claves
+        self._clock = 0  # aumenta con cada invalidación
+        self._lock = threading.Lock()
+        self._stats = {'invalidations': 0, 'discarded': 0}
+
+    def get(self, key) -> Any:
+        """
+        Retorna el resultado guardado o QueryCache.MISSING
+        """
+        return self._results.get(key, self.MISSING)
+
+    def clock(self) -> int:
+        """
+        Marca que se toma antes de consultar la base de datos y se pasa a put()
+        """
+        with self._lock:
+            return self._clock
+
+    def put(self, key, value: Any, tags: Iterable[str], since: int):
+        """
+        Guarda un resultado salvo que se haya invalidado algo mientras se
+        consultaba, ya que podría reflejar datos anteriores a la escritura
+        """
+        with self._lock:
+            if self._clock != since:
+                self._stats['discarded'] += 1
+                return
+            self._results.put(key, value)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            if len(self._keys_by_tag) > 4 * self._results.max_entries:
+                self._prune()
+
+    def invalidate(self, *tags: str):
+        """
+        Elimina los resultados que dependen de alguna de las etiquetas
+        """
+        with self._lock:
+            self._clock += 1
+            self._stats['invalidations'] += 1
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, ()):
+                    self._results.invalidate(key)
+
+    def clear(self):
+        """
+        Vacía la caché
+        """
+        with self._lock:
+            self._clock += 1
+            self._results.clear()
+            self._keys_by_tag.clear()
+
+    def _prune(self):
+        # Se llama con el lock tomado; olvida las claves que el LRU ya desalojó
+        for tag in list(self._keys_by_tag):
+            keys = {key for key in self._keys_by_tag[tag] if key in self._results}
+            if keys:
+                self._keys_by_tag[tag] = keys
+            else:
+                del self._keys_by_tag[tag]
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna las estadísticas del LRU y de las invalidaciones
+        """
+        stats = self._results.get_stats()
+        with self._lock:
+            stats.update(self._stats)
+            stats['tags'] = len(self._keys_by_tag)
+        return stats
+
+# Caché global de resultados de consultas de los modelos
+query_cache = QueryCache(
+    'query_results',
+    max_entries=config.cache['query_max_entries'],
+    max_bytes=config.cache['memory_max_bytes']
+)
@@ -0,0 +1,139 @@
+# services/resilience.py
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import requests
+from config.config_handler import config
+from services.logging_service import logger
+
+# Respuestas que indican un problema transitorio del servidor
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """
+    Se lanza cuando el circuito está abierto y la llamada se rechaza sin ir a la red
+    """
+
+class RetryPolicy:
+    def __init__(self, max_retries: int, backoff_base: float, backoff_max: float):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Calcula la espera antes del siguiente intento: respeta Retry-After
+        si el servidor lo envía y si no usa backoff exponencial con jitter
+        """
+        if retry_after:
+            delay = self.parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.backoff_max)
+
+        # Full jitter: aleatorio entre 0 y base * 2^intento
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        """
+        Interpreta Retry-After en segundos o como fecha HTTP
+        """
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+        self._stats = {'rejected': 0, 'opened': 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.time() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_progress = False
+        return self._state
+
+    def before_call(self):
+        """
+        Rechaza la llamada si el circuito está abierto. En estado
+        semiabierto deja pasar una única llamada de prueba.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return
+            self._stats['rejected'] += 1
+
+        raise CircuitOpenError(f"Circuit '{self.name}' is open: API unavailable")
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_progress = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._stats['opened'] += 1
+                    logger.log_error(
+                        f"Circuit '{self.name}' opened after {self._failures} consecutive failures"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.time()
+                self._trial_in_progress = False
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['state'] = self._current_state()
+            stats['consecutive_failures'] = self._failures
+        return stats
+
+def _build_retry_policy() -> RetryPolicy:
+    settings = config.api
+    return RetryPolicy(
+        max_retries=settings['max_retries'],
+        backoff_base=settings['backoff_base'],
+        backoff_max=settings['backoff_max']
+    )
+
+def _build_breaker() -> CircuitBreaker:
+    settings = config.api
+    return CircuitBreaker(
+        'pokeapi',
+        failure_threshold=settings['breaker_failure_threshold'],
+        reset_timeout=settings['breaker_reset_timeout']
+    )
+
+# Política y circuito compartidos por todos los clientes de la PokeAPI
+api_retry_policy = _build_retry_policy()
+api_breaker = _build_breaker()
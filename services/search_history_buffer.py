@@ -0,0 +1,241 @@
+# services/search_history_buffer.py
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+from config.config_handler import config
+from config.database import PERMANENT_ERRORS
+from models.search_model import SearchModel
+from services.logging_service import logger
+
+class SearchHistoryBuffer:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SearchHistoryBuffer, cls).__new__(cls)
+            cls._instance._setup_buffer()
+        return cls._instance
+
+    def _setup_buffer(self):
+        """
+        Prepara el búfer en memoria y el hilo que lo vuelca a la base de datos
+        """
+        settings = config.history
+        self.flush_size = settings['flush_size']
+        self.flush_interval = settings['flush_interval']
+        self.journal_path = settings['journal']
+        self.rejected_path = settings['rejected']
+        self.max_retries = settings['max_retries']
+        self.max_pending = settings['max_pending']
+        self.search_model = SearchModel()
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._pending = []  # Búsquedas aún no enviadas
+        self._in_flight = []  # Búsquedas que se están escribiendo
+        self._failures = 0  # Volcados fallidos seguidos
+        self._stats = {
+            'buffered': 0, 'written': 0, 'flushes': 0, 'spilled': 0,
+            'rejected': 0, 'dropped': 0
+        }
+
+        # Lo que quedó en el diario de una sesión anterior se reintenta
+        self._pending.extend(self._read_journal())
+        self._trim()
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name="search-history",
+            daemon=True
+        )
+        self._worker.start()
+
+    def add(self, user_id: int, search_term: str):
+        """
+        Encola una búsqueda sin tocar la base de datos
+        """
+        with self._lock:
+            # Sin microsegundos, igual que la columna search_date, para poder
+            # reconocer la búsqueda cuando ya está en la base de datos
+            self._pending.append((user_id, search_term, datetime.now().replace(microsecond=0)))
+            self._stats['buffered'] += 1
+            self._trim()
+            full = len(self._pending) >= self.flush_size
+        if full:
+            self._wake.set()
+
+    def get_pending(self, user_id: int) -> List[Dict]:
+        """
+        Retorna las búsquedas del usuario que aún no están en la base de datos
+        """
+        with self._lock:
+            entries = self._in_flight + self._pending
+        return [
+            {'search_term': search_term, 'search_date': search_date}
+            for entry_user_id, search_term, search_date in entries
+            if entry_user_id == user_id
+        ]
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Escribe en un solo INSERT todas las búsquedas pendientes. Si la base
+        de datos no responde, se guardan en el diario local y se reintentan
+        en los siguientes volcados, hasta max_retries veces. Si alguna fila
+        nunca se podrá escribir (por ejemplo, de un usuario ya eliminado),
+        el lote se escribe fila a fila y las rechazadas se apartan.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return True
+                self._in_flight = self._pending
+                self._pending = []
+                entries = self._in_flight
+
+            unwritten, rejected = self._write(entries)
+
+            written = not unwritten
+            with self._lock:
+                self._in_flight = []
+                self._stats['written'] += len(entries) - len(unwritten) - len(rejected)
+                if written:
+                    self._failures = 0
+                    self._stats['flushes'] += 1
+                else:
+                    self._failures += 1
+                    if self._failures >= self.max_retries:
+                        rejected = rejected + unwritten
+                        unwritten = []
+                        self._failures = 0
+                self._pending = unwritten + self._pending
+                self._trim()
+                pending = bool(self._pending)
+
+            if rejected:
+                self._reject(rejected)
+            if pending:
+                self._write_journal()
+            else:
+                self._clear_journal()
+            return written
+
+    def _write(self, entries: List[Tuple[int, str, datetime]]) -> Tuple[List, List]:
+        """
+        Retorna las búsquedas que quedan por escribir y las rechazadas
+        """
+        try:
+            self.search_model.insert_searches(entries)
+            return [], []
+        except PERMANENT_ERRORS:
+            pass
+        except Exception as e:
+            logger.log_error(f"Error writing search history: {str(e)}")
+            return entries, []
+
+        # Alguna fila es inválida: se escriben una a una para aislarla
+        rejected = []
+        for index, entry in enumerate(entries):
+            try:
+                self.search_model.insert_searches([entry])
+            except PERMANENT_ERRORS as e:
+                logger.log_error(f"Search history entry rejected {entry[:2]}: {str(e)}")
+                rejected.append(entry)
+            except Exception as e:
+                logger.log_error(f"Error writing search history: {str(e)}")
+                return entries[index:], rejected
+        return [], rejected
+
+    def _trim(self):
+        # Se llama con el lock tomado; si la base de datos no responde
+        # durante mucho tiempo se descartan las búsquedas más antiguas
+        excess = len(self._pending) + len(self._in_flight) - self.max_pending
+        if excess > 0:
+            excess = min(excess, len(self._pending))
+            del self._pending[:excess]
+            self._stats['dropped'] += excess
+
+    def _reject(self, entries: List[Tuple[int, str, datetime]]):
+        # Las búsquedas que no se pudieron escribir se apartan para revisarlas
+        with self._lock:
+            self._stats['rejected'] += len(entries)
+        directory = os.path.dirname(self.rejected_path)
+        try:
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(self.rejected_path, 'a', encoding='utf-8') as rejected:
+                for user_id, search_term, search_date in entries:
+                    rejected.write(json.dumps([user_id, search_term, search_date.isoformat()]) + '\n')
+        except OSError as e:
+            logger.log_error(f"Error writing rejected search history: {str(e)}", exc_info=True)
+
+    def _read_journal(self) -> List[Tuple[int, str, datetime]]:
+        if not os.path.exists(self.journal_path):
+            return []
+        entries = []
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as journal:
+                for line in journal:
+                    if line.strip():
+                        user_id, search_term, search_date = json.loads(line)
+                        entries.append((user_id, search_term, datetime.fromisoformat(search_date)))
+        except (OSError, ValueError) as e:
+            logger.log_error(f"Error reading search history journal: {str(e)}", exc_info=True)
+        return entries
+
+    def _write_journal(self):
+        # Se reescribe con todo lo pendiente para que no haya duplicados
+        with self._lock:
+            entries = list(self._pending)
+            self._stats['spilled'] = len(entries)
+
+        directory = os.path.dirname(self.journal_path)
+        temp_path = f"{self.journal_path}.tmp"
+        try:
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(temp_path, 'w', encoding='utf-8') as journal:
+                for user_id, search_term, search_date in entries:
+                    journal.write(json.dumps([user_id, search_term, search_date.isoformat()]) + '\n')
+            os.replace(temp_path, self.journal_path)
+        except OSError as e:
+            logger.log_error(f"Error writing search history journal: {str(e)}", exc_info=True)
+
+    def _clear_journal(self):
+        with self._lock:
+            self._stats['spilled'] = 0
+        if os.path.exists(self.journal_path):
+            try:
+                os.remove(self.journal_path)
+            except OSError as e:
+                logger.log_error(f"Error removing search history journal: {str(e)}", exc_info=True)
+
+    def close(self):
+        """
+        Detiene el hilo de volcado y escribe lo pendiente
+        """
+        self._stopped = True
+        self._wake.set()
+        self.flush()
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna las búsquedas encoladas, escritas, guardadas en el diario,
+        rechazadas y descartadas
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._pending) + len(self._in_flight)
+        return stats
+
+# Búfer global del historial de búsquedas
+search_history = SearchHistoryBuffer()
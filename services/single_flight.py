@@ -0,0 +1,60 @@
+# services/single_flight.py
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'executed': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Ejecuta function una sola vez por clave: las llamadas concurrentes
+        con la misma clave esperan a la que está en curso y comparten su
+        resultado (o su excepción)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats['executed'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna cuántas peticiones se ejecutaron y cuántas se ahorraron
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+        return stats
+
+# Grupo global para las peticiones a la PokeAPI
+request_group = SingleFlight()
@@ -0,0 +1,200 @@
+# services/sprite_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+from PIL import Image
+from config.config_handler import config
+from services.logging_service import logger
+from services.memory_cache import LRUCache
+
+def image_size(image: Image.Image) -> int:
+    """
+    Estima la memoria que ocupa una imagen decodificada
+    """
+    return image.width * image.height * len(image.getbands())
+
+class SpriteCache:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SpriteCache, cls).__new__(cls)
+            cls._instance._setup_cache()
+        return cls._instance
+
+    def _setup_cache(self):
+        """
+        Prepara el almacén en disco de sprites y miniaturas
+        """
+        settings = config.cache
+        self.directory = os.path.join(settings['directory'], 'sprites')
+        self.sizes = settings['sprite_sizes']
+
+        # Las imágenes originales se guardan por el hash de su contenido, así
+        # dos URLs con el mismo sprite comparten archivo y miniaturas
+        for subdirectory in ('originals', 'thumbnails'):
+            path = os.path.join(self.directory, subdirectory)
+            if not os.path.exists(path):
+                os.makedirs(path)
+
+        self._lock = threading.Lock()
+        self._stats = {'downloads': 0, 'resized': 0, 'disk_hits': 0}
+        self._api = None  # Servicio de la API compartido por todas las descargas
+        self._images = LRUCache(
+            'sprites',
+            max_entries=settings['sprite_memory_entries'],
+            max_bytes=settings['memory_max_bytes'],
+            sizeof=image_size
+        )
+
+        self._connection = sqlite3.connect(
+            os.path.join(self.directory, 'sprites.sqlite'),
+            check_same_thread=False
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS sprites (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._connection.commit()
+
+    def _original_path(self, digest: str) -> str:
+        return os.path.join(self.directory, 'originals', f"{digest}.png")
+
+    def _thumbnail_path(self, digest: str, size: Tuple[int, int]) -> str:
+        return os.path.join(self.directory, 'thumbnails', f"{digest}_{size[0]}x{size[1]}.png")
+
+    def _lookup_digest(self, url: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT sha256 FROM sprites WHERE url = ?", (url,)
+            ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _write_atomic(path: str, content: bytes):
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as target:
+            target.write(content)
+        os.replace(temp_path, path)
+
+    def _store_original(self, url: str, content: bytes) -> str:
+        """
+        Guarda los bytes descargados y genera las miniaturas configuradas
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        original_path = self._original_path(digest)
+        if not os.path.exists(original_path):
+            self._write_atomic(original_path, content)
+
+        for size in self.sizes:
+            if not os.path.exists(self._thumbnail_path(digest, size)):
+                self._create_thumbnail(digest, size)
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sprites (url, sha256, fetched_at) VALUES (?, ?, ?)",
+                (url, digest, time.time())
+            )
+            self._connection.commit()
+        return digest
+
+    def _create_thumbnail(self, digest: str, size: Tuple[int, int]) -> Image.Image:
+        with Image.open(self._original_path(digest)) as original:
+            thumbnail = original.convert('RGBA').resize(size, Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        thumbnail.save(buffer, format='PNG')
+        self._write_atomic(self._thumbnail_path(digest, size), buffer.getvalue())
+        with self._lock:
+            self._stats['resized'] += 1
+        return thumbnail
+
+    def _load_thumbnail(self, digest: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        path = self._thumbnail_path(digest, size)
+        if os.path.exists(path):
+            with Image.open(path) as thumbnail:
+                thumbnail.load()
+                with self._lock:
+                    self._stats['disk_hits'] += 1
+                return thumbnail.copy()
+
+        if os.path.exists(self._original_path(digest)):
+            return self._create_thumbnail(digest, size)
+        return None
+
+    def get_image(self, url: str, size: Tuple[int, int] = (96, 96)) -> Optional[Image.Image]:
+        """
+        Obtiene el sprite ya escalado: primero de memoria, luego de las
+        miniaturas en disco y solo en último caso descargándolo
+        """
+        if not url:
+            return None
+
+        size = tuple(size)
+        key = (url, size)
+        image = self._images.get(key)
+        if image is not None:
+            return image
+
+        try:
+            digest = self._lookup_digest(url)
+            image = self._load_thumbnail(digest, size) if digest else None
+
+            if image is None:
+                content = self._get_api().download_sprite(url)
+                if not content:
+                    return None
+                with self._lock:
+                    self._stats['downloads'] += 1
+                digest = self._store_original(url, content)
+                image = self._load_thumbnail(digest, size)
+
+        except (OSError, sqlite3.Error) as e:
+            logger.log_error(f"Error loading sprite {url}: {str(e)}", exc_info=True)
+            return None
+
+        if image is not None:
+            self._images.put(key, image)
+        return image
+
+    def _get_api(self):
+        """
+        Retorna el servicio de la API, creado una sola vez para que todas
+        las descargas reutilicen su sesión y sus conexiones abiertas
+        """
+        with self._lock:
+            if self._api is None:
+                # Importación diferida: el servicio de la API no depende de esta caché
+                from services.api_service import PokeAPIService
+                self._api = PokeAPIService()
+            return self._api
+
+    def clear(self):
+        """
+        Vacía la caché en memoria (los archivos en disco se conservan)
+        """
+        self._images.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna las descargas, escalados y aciertos de la caché de sprites
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['stored'] = self._connection.execute(
+                "SELECT COUNT(DISTINCT sha256) FROM sprites"
+            ).fetchone()[0]
+        stats['memory'] = self._images.get_stats()
+        return stats
+
+# Instancia global compartida por todas las vistas
+sprite_cache = SpriteCache()
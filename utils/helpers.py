@@ -1 +1,28 @@
-# Funciones auxiliares
\ No newline at end of file
+# Funciones auxiliares
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+def encode_cursor(*values) -> str:
+    """
+    Convierte la clave de la última fila de una página en un cursor opaco
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str, *types) -> Tuple:
+    """
+    Recupera la clave de un cursor convirtiendo cada valor al tipo indicado.
+    Lanza ValueError si el cursor no es válido.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value, value_type in zip(values, types)
+        )
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
@@ -1,11 +1,20 @@
 # views/admin_view.py
 import customtkinter as ctk
+from services.db_profiler import profiled_action
 from controllers.admin_controller import AdminController
+from views.components.paged_list import PagedScrollableFrame
 from datetime import datetime
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 class AdminView(ctk.CTkFrame):
+    # Ventanas de tiempo del registro de actividad (None = sin límite)
+    ACTIVITY_WINDOWS = {
+        "Últimos 7 días": 7,
+        "Últimos 30 días": 30,
+        "Todo": None
+    }
+
     def __init__(self, master, user_data):
         super().__init__(master)
         
@@ -63,6 +72,7 @@ class AdminView(ctk.CTkFrame):
             )
             btn.pack(pady=10, padx=20)
 
+    @profiled_action
     def show_dashboard(self):
         """
         Muestra el dashboard principal del panel de administración
@@ -194,6 +204,7 @@ class AdminView(ctk.CTkFrame):
             font=("Roboto", 24, "bold")
         ).pack(pady=(0, 10))
 
+    @profiled_action
     def show_users_list(self):
         """
         Muestra la lista de usuarios
@@ -210,8 +221,12 @@ class AdminView(ctk.CTkFrame):
             font=("Roboto", 24, "bold")
         ).pack(side="left", pady=10)
 
-        # Tabla de usuarios
-        table_frame = ctk.CTkScrollableFrame(self.main_container)
+        # Tabla de usuarios; las páginas se piden al desplazarse
+        table_frame = PagedScrollableFrame(
+            self.main_container,
+            fetch_page=lambda cursor: self.admin_controller.get_users_list(cursor),
+            render_row=self.render_user_row
+        )
         table_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
         # Encabezados
@@ -223,70 +238,75 @@ class AdminView(ctk.CTkFrame):
                 font=("Roboto", 12, "bold")
             ).grid(row=0, column=i, padx=5, pady=5, sticky="w")
 
-        # Obtener y mostrar usuarios
-        users = self.admin_controller.get_users_list()
-        for i, user in enumerate(users, start=1):
-            # Usuario
-            ctk.CTkLabel(
-                table_frame,
-                text=user['username']
-            ).grid(row=i, column=0, padx=5, pady=5, sticky="w")
+        # Primera página de usuarios
+        table_frame.load_more()
 
-            # Email
-            ctk.CTkLabel(
-                table_frame,
-                text=user['email']
-            ).grid(row=i, column=1, padx=5, pady=5, sticky="w")
-
-            # Rol
-            role_frame = ctk.CTkFrame(table_frame)
-            role_frame.grid(row=i, column=2, padx=5, pady=5)
-
-            role_var = ctk.StringVar(value=user['role_name'])
-            role_menu = ctk.CTkOptionMenu(
-                role_frame,
-                values=['user', 'admin'],
-                variable=role_var,
-                command=lambda uid=user['id'], rv=role_var: self.update_user_role(uid, rv.get())
-            )
-            role_menu.pack()
+    def render_user_row(self, table_frame, user: dict, i: int):
+        """
+        Dibuja la fila de un usuario en la tabla
+        """
+        # Usuario
+        ctk.CTkLabel(
+            table_frame,
+            text=user['username']
+        ).grid(row=i, column=0, padx=5, pady=5, sticky="w")
 
-            # Fecha de registro
-            ctk.CTkLabel(
-                table_frame,
-                text=user['created_at'].strftime('%d/%m/%Y')
-            ).grid(row=i, column=3, padx=5, pady=5)
+        # Email
+        ctk.CTkLabel(
+            table_frame,
+            text=user['email']
+        ).grid(row=i, column=1, padx=5, pady=5, sticky="w")
 
-            # Búsquedas
-            ctk.CTkLabel(
-                table_frame,
-                text=str(user['total_searches'])
-            ).grid(row=i, column=4, padx=5, pady=5)
+        # Rol
+        role_frame = ctk.CTkFrame(table_frame)
+        role_frame.grid(row=i, column=2, padx=5, pady=5)
 
-            # Pokémon
-            ctk.CTkLabel(
-                table_frame,
-                text=str(user['total_pokemon'])
-            ).grid(row=i, column=5, padx=5, pady=5)
-
-            # Botones de acción
-            actions_frame = ctk.CTkFrame(table_frame)
-            actions_frame.grid(row=i, column=6, padx=5, pady=5)
-
-            ctk.CTkButton(
-                actions_frame,
-                text="Detalles",
-                command=lambda uid=user['id']: self.show_user_details(uid)
-            ).pack(side="left", padx=2)
-
-            ctk.CTkButton(
-                actions_frame,
-                text="Eliminar",
-                fg_color="red",
-                hover_color="dark red",
-                command=lambda uid=user['id']: self.confirm_delete_user(uid)
-            ).pack(side="left", padx=2)
+        role_var = ctk.StringVar(value=user['role_name'])
+        role_menu = ctk.CTkOptionMenu(
+            role_frame,
+            values=['user', 'admin'],
+            variable=role_var,
+            command=lambda uid=user['id'], rv=role_var: self.update_user_role(uid, rv.get())
+        )
+        role_menu.pack()
+
+        # Fecha de registro
+        ctk.CTkLabel(
+            table_frame,
+            text=user['created_at'].strftime('%d/%m/%Y')
+        ).grid(row=i, column=3, padx=5, pady=5)
+
+        # Búsquedas
+        ctk.CTkLabel(
+            table_frame,
+            text=str(user['total_searches'])
+        ).grid(row=i, column=4, padx=5, pady=5)
+
+        # Pokémon
+        ctk.CTkLabel(
+            table_frame,
+            text=str(user['total_pokemon'])
+        ).grid(row=i, column=5, padx=5, pady=5)
+
+        # Botones de acción
+        actions_frame = ctk.CTkFrame(table_frame)
+        actions_frame.grid(row=i, column=6, padx=5, pady=5)
+
+        ctk.CTkButton(
+            actions_frame,
+            text="Detalles",
+            command=lambda uid=user['id']: self.show_user_details(uid)
+        ).pack(side="left", padx=2)
 
+        ctk.CTkButton(
+            actions_frame,
+            text="Eliminar",
+            fg_color="red",
+            hover_color="dark red",
+            command=lambda uid=user['id']: self.confirm_delete_user(uid)
+        ).pack(side="left", padx=2)
+
+    @profiled_action
     def show_activity_logs(self):
         """
         Muestra los logs de actividad
@@ -310,18 +330,44 @@ class AdminView(ctk.CTkFrame):
             font=("Roboto", 12)
         ).pack(side="left", padx=10)
 
-        filter_var = ctk.StringVar(value="Todos")
+        self.activity_filter_var = ctk.StringVar(value="Todos")
         filter_menu = ctk.CTkOptionMenu(
             filters_frame,
             values=["Todos", "Búsquedas", "Equipos"],
-            variable=filter_var,
+            variable=self.activity_filter_var,
             command=self.filter_activity_logs
         )
         filter_menu.pack(side="left", padx=10)
 
+        self.activity_days_var = ctk.StringVar(value="Últimos 7 días")
+        days_menu = ctk.CTkOptionMenu(
+            filters_frame,
+            values=list(self.ACTIVITY_WINDOWS.keys()),
+            variable=self.activity_days_var,
+            command=self.filter_activity_logs
+        )
+        days_menu.pack(side="left", padx=10)
+
         # Tabla de logs
-        logs_frame = ctk.CTkScrollableFrame(self.main_container)
+        self.logs_frame = None
+        self.load_activity_logs(None, 7)
+
+    def load_activity_logs(self, activity_type: str = None, days: int = 7):
+        """
+        Crea la tabla de logs; las páginas se piden al desplazarse
+        """
+        if self.logs_frame is not None:
+            self.logs_frame.destroy()
+
+        logs_frame = PagedScrollableFrame(
+            self.main_container,
+            fetch_page=lambda cursor: self.admin_controller.get_recent_activity(
+                cursor, activity_type=activity_type, days=days
+            ),
+            render_row=self.render_activity_row
+        )
         logs_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        self.logs_frame = logs_frame
 
         # Encabezados
         headers = ["Fecha", "Usuario", "Actividad", "Detalle"]
@@ -332,40 +378,60 @@ class AdminView(ctk.CTkFrame):
                 font=("Roboto", 12, "bold")
             ).grid(row=0, column=i, padx=5, pady=5, sticky="w")
 
-        # Obtener y mostrar logs
-        logs = self.admin_controller.get_recent_activity()
-        for i, log in enumerate(logs, start=1):
-            # Fecha
-            ctk.CTkLabel(
-                logs_frame,
-                text=log['activity_date'].strftime('%d/%m/%Y %H:%M')
-            ).grid(row=i, column=0, padx=5, pady=5)
+        # Primera página de logs
+        logs_frame.load_more()
 
-            # Usuario
-            ctk.CTkLabel(
-                logs_frame,
-                text=log['username']
-            ).grid(row=i, column=1, padx=5, pady=5)
+    @profiled_action
+    def filter_activity_logs(self, choice: str = None):
+        """
+        Vuelve a cargar los logs con los filtros elegidos
+        """
+        activity_types = {
+            "Todos": None,
+            "Búsquedas": "search",
+            "Equipos": "team_update"
+        }
+        self.load_activity_logs(
+            activity_types.get(self.activity_filter_var.get()),
+            self.ACTIVITY_WINDOWS.get(self.activity_days_var.get())
+        )
 
-            # Tipo de actividad
-            activity_label = ctk.CTkLabel(
-                logs_frame,
-                text=log['type'].capitalize()
-            )
-            activity_label.grid(row=i, column=2, padx=5, pady=5)
+    def render_activity_row(self, logs_frame, log: dict, i: int):
+        """
+        Dibuja una fila de actividad en la tabla
+        """
+        # Fecha
+        ctk.CTkLabel(
+            logs_frame,
+            text=log['activity_date'].strftime('%d/%m/%Y %H:%M')
+        ).grid(row=i, column=0, padx=5, pady=5)
+
+        # Usuario
+        ctk.CTkLabel(
+            logs_frame,
+            text=log['username']
+        ).grid(row=i, column=1, padx=5, pady=5)
+
+        # Tipo de actividad
+        activity_label = ctk.CTkLabel(
+            logs_frame,
+            text=log['type'].capitalize()
+        )
+        activity_label.grid(row=i, column=2, padx=5, pady=5)
 
-            # Color según tipo
-            if log['type'] == 'search':
-                activity_label.configure(text_color="blue")
-            elif log['type'] == 'team_update':
-                activity_label.configure(text_color="green")
+        # Color según tipo
+        if log['type'] == 'search':
+            activity_label.configure(text_color="blue")
+        elif log['type'] == 'team_update':
+            activity_label.configure(text_color="green")
 
-            # Detalle
-            ctk.CTkLabel(
-                logs_frame,
-                text=log['detail']
-            ).grid(row=i, column=3, padx=5, pady=5)
+        # Detalle
+        ctk.CTkLabel(
+            logs_frame,
+            text=log['detail']
+        ).grid(row=i, column=3, padx=5, pady=5)
 
+    @profiled_action
     def show_statistics(self):
         """
         Muestra estadísticas detalladas
@@ -480,6 +546,7 @@ class AdminView(ctk.CTkFrame):
         canvas.draw()
         canvas.get_tk_widget().pack(fill="both", expand=True)
 
+    @profiled_action
     def update_user_role(self, user_id: int, new_role: str):
         """
         Actualiza el rol de un usuario
@@ -523,6 +590,7 @@ class AdminView(ctk.CTkFrame):
             command=lambda: self.delete_user(user_id, dialog)
         ).pack(side="left", padx=10)
 
+    @profiled_action
     def delete_user(self, user_id: int, dialog=None):
         """
         Elimina un usuario
@@ -536,6 +604,7 @@ class AdminView(ctk.CTkFrame):
         else:
             self.show_error(message)
 
+    @profiled_action
     def show_user_details(self, user_id: int):
         """
         Muestra los detalles de un usuario
@@ -0,0 +1,141 @@
+# views/components/image_loader.py
+import itertools
+import queue
+import threading
+import tkinter as tk
+from collections import deque
+from typing import Callable, Dict, Tuple
+from PIL import ImageTk
+from config.config_handler import config
+from services.logging_service import logger
+from services.sprite_cache import sprite_cache
+
+# Prioridades: menor número = se atiende antes
+PRIORITY_VISIBLE = 0
+PRIORITY_BACKGROUND = 100
+
+class ImageRequest:
+    def __init__(self, widget, url: str, size: Tuple[int, int], callback: Callable):
+        self.widget = widget
+        self.url = url
+        self.size = size
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class ImageLoader:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ImageLoader, cls).__new__(cls)
+            cls._instance._setup_loader()
+        return cls._instance
+
+    def _setup_loader(self):
+        """
+        Arranca el pool fijo de trabajadores que cargan los sprites
+        """
+        settings = config.app
+        self.batch_size = settings['image_batch_size']
+        self.poll_interval = settings['image_poll_interval']
+
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._completed = deque()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._root = None
+        self._polling = False
+        self._stats = {'requested': 0, 'delivered': 0, 'cancelled': 0}
+
+        for number in range(settings['image_workers']):
+            worker = threading.Thread(
+                target=self._work,
+                name=f"image-loader-{number}",
+                daemon=True
+            )
+            worker.start()
+
+    def request(self, widget, url: str, size: Tuple[int, int], callback: Callable,
+                priority: int = PRIORITY_BACKGROUND) -> ImageRequest:
+        """
+        Encola la carga de una imagen. callback recibe el PhotoImage en el
+        hilo de Tk; si el widget se destruye antes, la carga se cancela.
+        Debe llamarse desde el hilo de Tk.
+        """
+        image_request = ImageRequest(widget, url, size, callback)
+        widget.bind("<Destroy>", lambda event: image_request.cancel(), add="+")
+
+        with self._lock:
+            self._pending += 1
+            self._stats['requested'] += 1
+        self._root = widget.winfo_toplevel()
+
+        self._queue.put((priority, next(self._sequence), image_request))
+        self._schedule_poll()
+        return image_request
+
+    def _work(self):
+        while True:
+            _, _, image_request = self._queue.get()
+            image = None
+            if not image_request.cancelled:
+                try:
+                    image = sprite_cache.get_image(image_request.url, image_request.size)
+                except Exception as e:
+                    logger.log_error(f"Error loading image {image_request.url}: {str(e)}", exc_info=True)
+            # Se entrega aunque falle para que el contador de pendientes cuadre
+            self._completed.append((image_request, image))
+
+    def _schedule_poll(self):
+        if not self._polling and self._root is not None:
+            self._polling = True
+            self._root.after(self.poll_interval, self._drain)
+
+    def _drain(self):
+        """
+        Entrega en el hilo de Tk un lote de imágenes ya cargadas
+        """
+        self._polling = False
+        delivered = 0
+        while self._completed and delivered < self.batch_size:
+            image_request, image = self._completed.popleft()
+            delivered += 1
+            with self._lock:
+                self._pending -= 1
+
+            if image_request.cancelled:
+                with self._lock:
+                    self._stats['cancelled'] += 1
+                continue
+            if image is None or not image_request.widget.winfo_exists():
+                continue
+
+            image_request.callback(ImageTk.PhotoImage(image, master=image_request.widget))
+            with self._lock:
+                self._stats['delivered'] += 1
+
+        with self._lock:
+            pending = self._pending
+        if pending:
+            try:
+                self._schedule_poll()
+            except tk.TclError:
+                # La ventana principal ya no existe
+                self._polling = False
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna las cargas solicitadas, entregadas, canceladas y pendientes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = self._pending
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+# Cargador global compartido por todas las tarjetas
+image_loader = ImageLoader()
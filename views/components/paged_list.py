@@ -0,0 +1,48 @@
+# views/components/paged_list.py
+import customtkinter as ctk
+from services.db_profiler import profiled_action
+from typing import Callable, Dict, List, Optional, Tuple
+
+class PagedScrollableFrame(ctk.CTkScrollableFrame):
+    """
+    Marco desplazable que pide la siguiente página cuando el usuario se
+    acerca al final, de modo que nunca se carga la tabla completa
+    """
+    def __init__(self, master, fetch_page: Callable[[Optional[str]], Tuple[List[Dict], Optional[str]]],
+                 render_row: Callable[[ctk.CTkFrame, Dict, int], None],
+                 first_row: int = 1, threshold: float = 0.9, **kwargs):
+        super().__init__(master, **kwargs)
+        self.fetch_page = fetch_page  # cursor -> (filas, cursor siguiente)
+        self.render_row = render_row  # (marco, fila, número de fila)
+        self.threshold = threshold
+        self.next_row = first_row
+        self.cursor = None
+        self.exhausted = False
+        self.loading = False
+
+        # Se intercepta la actualización de la barra para saber cuándo
+        # queda visible el final de la lista
+        self._parent_canvas.configure(yscrollcommand=self._on_scroll)
+
+    def _on_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if float(last) >= self.threshold and not self.exhausted and not self.loading:
+            self.after_idle(self.load_more)
+
+    @profiled_action
+    def load_more(self):
+        """
+        Carga y dibuja la siguiente página
+        """
+        if self.loading or self.exhausted or not self.winfo_exists():
+            return
+        self.loading = True
+        try:
+            rows, self.cursor = self.fetch_page(self.cursor)
+            for row in rows:
+                self.render_row(self, row, self.next_row)
+                self.next_row += 1
+            if self.cursor is None:
+                self.exhausted = True
+        finally:
+            self.loading = False
@@ -1,15 +1,15 @@
 # views/components/pokemon_card.py
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
-import threading
+from views.components.image_loader import image_loader, PRIORITY_VISIBLE
+
+SPRITE_SIZE = (96, 96)
 
 class PokemonCard(ctk.CTkFrame):
-    def __init__(self, master, pokemon_data, on_click=None, **kwargs):
+    def __init__(self, master, pokemon_data, on_click=None, priority=PRIORITY_VISIBLE, **kwargs):
         super().__init__(master, **kwargs)
         self.pokemon_data = pokemon_data
         self.on_click = on_click
+        self.priority = priority
         self.image_label = None
         self.sprite_image = None
         
@@ -72,23 +72,18 @@ class PokemonCard(ctk.CTkFrame):
             self.bind("<Leave>", self.on_leave)
 
     def load_sprite(self):
-        def fetch_image():
-            try:
-                response = requests.get(self.pokemon_data['sprite'])
-                image = Image.open(BytesIO(response.content))
-                image = image.resize((96, 96), Image.Resampling.LANCZOS)
-                self.sprite_image = ImageTk.PhotoImage(image)
-                
-                # Actualizar la UI en el hilo principal
-                self.after(0, self.update_image)
-            except Exception as e:
-                print(f"Error loading sprite: {e}")
-
-        # Iniciar la descarga en un hilo separado
-        thread = threading.Thread(target=fetch_image)
-        thread.start()
+        # El cargador compartido descarga y escala en su pool de hilos y
+        # entrega la imagen en el hilo de Tk
+        image_loader.request(
+            self,
+            self.pokemon_data.get('sprite'),
+            SPRITE_SIZE,
+            self.update_image,
+            priority=self.priority
+        )
 
-    def update_image(self):
+    def update_image(self, sprite_image):
+        self.sprite_image = sprite_image
         if self.sprite_image and self.image_label:
             self.image_label.configure(image=self.sprite_image, text="")
 
@@ -1,6 +1,7 @@
 
 # views/login_view.py
 import customtkinter as ctk
+from services.db_profiler import profiled_action
 from controllers.auth_controller import AuthController
 
 class LoginView(ctk.CTkFrame):
@@ -120,6 +121,7 @@ class LoginView(ctk.CTkFrame):
         )
         self.register_error.pack(pady=10)
 
+    @profiled_action
     def handle_login(self):
         username = self.login_username.get()
         password = self.login_password.get()
@@ -131,6 +133,7 @@ class LoginView(ctk.CTkFrame):
         else:
             self.login_error.configure(text=message)
 
+    @profiled_action
     def handle_register(self):
         username = self.register_username.get()
         email = self.register_email.get()
@@ -1,5 +1,6 @@
 # views/main_view.py
 import customtkinter as ctk
+from services.db_profiler import profiled_action
 from views.search_view import SearchView
 from views.team_view import TeamView  
 from datetime import datetime
@@ -142,6 +143,7 @@ class MainView(ctk.CTkFrame):
         )
         logout_btn.grid(row=8, column=0, padx=20, pady=20, sticky="ew")
 
+    @profiled_action
     def show_dashboard(self):
         self.clear_main_container()
         self.set_active_button(0)
@@ -180,23 +182,27 @@ class MainView(ctk.CTkFrame):
         
         # Añadir más widgets según necesites
 
+    @profiled_action
     def show_search(self):
         self.clear_main_container()
         self.set_active_button(1)
         search_view = SearchView(self.main_container, self.user_data['id'])
         search_view.grid(row=0, column=0, sticky="nsew")
 
+    @profiled_action
     def show_team(self):
         self.clear_main_container()
         self.set_active_button(2)
         # Aquí implementaremos la vista del equipo más adelante
 
+    @profiled_action
     def show_profile(self):
         self.clear_main_container()
         self.set_active_button(3)
         profile_view = ProfileView(self.main_container, self.user_data)
         profile_view.grid(row=0, column=0, sticky="nsew")
 
+    @profiled_action
     def show_admin_panel(self):
         if self.user_data['role_name'] != 'admin':
             return
@@ -219,6 +225,7 @@ class MainView(ctk.CTkFrame):
     def logout(self):
         self.master.show_login()
 
+    @profiled_action
     def show_team(self):
         self.clear_main_container()
         self.set_active_button(2)
@@ -1,5 +1,6 @@
 # views/profile_view.py
 import customtkinter as ctk
+from services.db_profiler import profiled_action
 from models.user_model import UserModel
 import re
 from datetime import datetime
@@ -215,6 +216,7 @@ class ProfileView(ctk.CTkFrame):
 
         return True
 
+    @profiled_action
     def save_profile(self):
         # Recopilar datos
         data = {
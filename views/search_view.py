@@ -1,5 +1,6 @@
 # views/search_view.py
 import customtkinter as ctk
+from services.db_profiler import profiled_action
 from views.components.pokemon_card import PokemonCard
 from views.components.stats_chart import StatsRadarChart
 from controllers.pokemon_controller import PokemonController
@@ -64,6 +65,7 @@ class SearchView(ctk.CTkFrame):
         # Cargar búsquedas recientes
         self.load_recent_searches()
 
+    @profiled_action
     def search_pokemon(self):
         query = self.search_entry.get()
         if not query:
@@ -85,12 +87,13 @@ class SearchView(ctk.CTkFrame):
             no_results.pack(pady=20)
             return
 
-        # Mostrar resultados
-        for pokemon in results:
+        # Mostrar resultados (las primeras tarjetas, visibles, cargan antes)
+        for position, pokemon in enumerate(results):
             card = PokemonCard(
                 self.results_scroll,
                 pokemon,
-                on_click=self.show_pokemon_details
+                on_click=self.show_pokemon_details,
+                priority=position
             )
             card.pack(pady=10, padx=10, fill="x")
 
@@ -173,6 +176,7 @@ Evoluciones:
             )
             search_button.pack(pady=5, padx=10, fill="x")
 
+    @profiled_action
     def quick_search(self, term):
         self.search_entry.delete(0, 'end')
         self.search_entry.insert(0, term)
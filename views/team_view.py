@@ -86,13 +86,13 @@ class TeamView(ctk.CTkFrame):
             widget.destroy()
 
         # Mostrar Pokémon
-        for pokemon in pokemon_list:
-            self.create_pokemon_card(pokemon)
+        for position, pokemon in enumerate(pokemon_list):
+            self.create_pokemon_card(pokemon, position)
 
         # Actualizar estadísticas
         self.update_stats_display(team_stats)
 
-    def create_pokemon_card(self, pokemon_data):
+    def create_pokemon_card(self, pokemon_data, position=0):
         # Frame para la tarjeta y botones
         card_frame = ctk.CTkFrame(self.pokemon_list)
         card_frame.pack(fill="x", pady=5, padx=5)
@@ -101,7 +101,8 @@ class TeamView(ctk.CTkFrame):
         pokemon_card = PokemonCard(
             card_frame,
             pokemon_data,
-            on_click=lambda: self.show_pokemon_details(pokemon_data)
+            on_click=lambda: self.show_pokemon_details(pokemon_data),
+            priority=position
         )
         pokemon_card.pack(side="left", fill="both", expand=True)
 
@@ -132,7 +133,8 @@ class TeamView(ctk.CTkFrame):
         for widget in self.graphs_frame.winfo_children():
             widget.destroy()
 
-        if not stats['total_pokemon']:
+        # Si el cálculo falla el controlador retorna un diccionario vacío
+        if not stats.get('total_pokemon'):
             no_stats = ctk.CTkLabel(
                 self.graphs_frame,
                 text="No hay Pokémon en el equipo",